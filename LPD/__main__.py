@@ -0,0 +1,59 @@
+""" Análise de programas LPD pela linha de comando
+
+    python -m LPD programa.lpd [outro.lpd ...]
+    python -m LPD --tokens programa.lpd
+    python -m LPD --ply programa.lpd
+
+A análise usa o LPD.parser, que informa todos os erros de sintaxe do arquivo
+numa passada. --ply usa a gramática do ply.yacc (LPD.grammar), que para no
+primeiro erro.
+"""
+
+import argparse
+import sys
+
+from LPD.fast_lexer import tokenize
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m LPD", description="Analisa programas LPD")
+    parser.add_argument("paths", nargs="+", help="arquivos com o código")
+    parser.add_argument("--tokens", action="store_true", help="só lista os tokens, sem a análise sintática")
+    parser.add_argument("--ply", action="store_true", help="usa a gramática do ply.yacc (tabelas em cache)")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for path in args.paths:
+        with open(path, encoding='utf-8') as file:
+            text = file.read()
+        if args.tokens:
+            for token in tokenize(text):
+                print(f"{token.type}\t{token.value}\t{token.lineno}")
+            continue
+        if args.ply:
+            from LPD.frontend import parse
+            from LPD.grammar import LPDSyntaxError
+            try:
+                parse(text)
+            except LPDSyntaxError as error:
+                print(f"{path}: {error}")
+                status = 1
+            else:
+                print(f"{path}: ok")
+            continue
+
+        from LPD.parser import parse_program
+        _, errors, log = parse_program(text)
+        for illegal in log:
+            print(f"{path}:{illegal.lineno}:{illegal.column(text)}: caractere ilegal {illegal.char!r}")
+        for error in errors:
+            print(f"{path}:{error.lineno}: {error.message}")
+        if errors or log:
+            status = 1
+        else:
+            print(f"{path}: ok")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
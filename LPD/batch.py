@@ -0,0 +1,265 @@
+""" Análise léxica de muitos arquivos LPD pela linha de comando
+
+    python -m LPD.batch programas/ outro.lpd --workers 4 --format jsonl > tokens.jsonl
+
+Recebe arquivos e diretórios (percorridos recursivamente atrás de arquivos com a
+extensão pedida, .lpd por padrão) e distribui os arquivos num
+ProcessPoolExecutor. Cada processo monta um único lexer no início (o fast_lexer,
+ou o ply.lex com as tabelas em cache) e o reaproveita para todos os arquivos que
+receber. Os resultados saem na ordem dos arquivos, à medida que ficam prontos:
+
+  - jsonl: uma linha por arquivo,
+      {"path": ..., "seconds": ..., "tokens": [[tipo, valor, linha, posição], ...],
+       "errors": [{"char": ..., "line": ..., "column": ..., "pos": ...}, ...]}
+  - binary: formato compacto descrito em write_binary_header / encode_binary
+    (lido de volta com read_binary);
+  - none: só o resumo.
+
+Cada caractere ilegal também vai para a saída de erros no formato
+"arquivo:linha:coluna: caractere ilegal 'x'". Um arquivo que não pode ser lido
+não interrompe os demais: vira "arquivo: mensagem" na saída de erros (e
+{"path": ..., "error": ...} no jsonl). O código de saída é 1 se houver algum
+desses erros. O resumo (arquivos, tokens, tokens/s) vai para a saída de erros no fim.
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+from LPD.diagnostics import DiagnosticLog
+from LPD.tokens import TOKEN_INDEX, tokens as TOKEN_TYPES
+
+BINARY_MAGIC = b'LPDT'
+BINARY_VERSION = 2
+
+# Registro de arquivo: tamanho do caminho, tokens, erros e segundos.
+_FILE_RECORD = struct.Struct('<HIId')
+# Token: tipo, linha, posição e tamanho do lexema (em UTF-8).
+_TOKEN_RECORD = struct.Struct('<BIII')
+# Erro: linha, posição e tamanho do caractere (em UTF-8).
+_ERROR_RECORD = struct.Struct('<IIB')
+
+
+class FileResult:
+    """
+    Resultado de um arquivo, como devolvido pelos processos.
+
+    Atributos:
+      path (str): Caminho do arquivo.
+      payload (bytes | str | None): Registro do arquivo no formato de saída.
+      token_count (int): Quantidade de tokens.
+      errors (list): Tuplas (caractere, linha, coluna, posição) dos caracteres ilegais.
+      seconds (float): Tempo da análise do arquivo.
+      failure (str | None): Por que o arquivo não pôde ser lido (None se foi lido).
+    """
+
+    __slots__ = ('path', 'payload', 'token_count', 'errors', 'seconds', 'failure')
+
+    def __init__(self, path: str, payload, token_count: int, errors: list, seconds: float,
+                 failure=None) -> None:
+        self.path = path
+        self.payload = payload
+        self.token_count = token_count
+        self.errors = errors
+        self.seconds = seconds
+        self.failure = failure
+
+
+def collect_paths(paths, extension: str = '.lpd'):
+    """ Arquivos dados diretamente, mais os arquivos com `extension` dentro dos diretórios. """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for directory, subdirectories, names in os.walk(path):
+            subdirectories.sort()
+            for name in sorted(names):
+                if name.endswith(extension):
+                    yield os.path.join(directory, name)
+
+
+def encode_jsonl(path: str, tokens, errors, text: str, seconds: float) -> str:
+    return json.dumps({
+        'path': path,
+        'seconds': round(seconds, 6),
+        'tokens': [[token.type, token.value, token.lineno, token.lexpos] for token in tokens],
+        'errors': [error.as_dict(text) for error in errors],
+    }, ensure_ascii=False) + '\n'
+
+
+def encode_jsonl_failure(path: str, failure: str) -> str:
+    """ Linha de um arquivo que não pôde ser lido (no binário, o arquivo só fica de fora). """
+    return json.dumps({'path': path, 'error': failure}, ensure_ascii=False) + '\n'
+
+
+def write_binary_header(output) -> None:
+    """ Cabeçalho: b'LPDT', versão e a tabela de tipos (quantidade, e cada nome com o tamanho antes). """
+    names = [token_type.encode('ascii') for token_type in TOKEN_TYPES]
+    output.write(BINARY_MAGIC + bytes([BINARY_VERSION, len(names)]) +
+                 b''.join(bytes([len(name)]) + name for name in names))
+
+
+def encode_binary(path: str, tokens, errors, text: str, seconds: float) -> bytes:
+    """
+    Registro de um arquivo: caminho, quantidades e tempo (_FILE_RECORD), depois
+    cada token (_TOKEN_RECORD e o lexema) e cada erro (_ERROR_RECORD e o caractere).
+    NUMBER é gravado como texto.
+    """
+    encoded_path = path.encode('utf-8')
+    parts = [_FILE_RECORD.pack(len(encoded_path), len(tokens), len(errors), seconds), encoded_path]
+    pack_token = _TOKEN_RECORD.pack
+    for token in tokens:
+        value = str(token.value).encode('utf-8')
+        parts.append(pack_token(TOKEN_INDEX[token.type], token.lineno, token.lexpos, len(value)))
+        parts.append(value)
+    for error in errors:
+        char = error.char.encode('utf-8')
+        parts.append(_ERROR_RECORD.pack(error.lineno, error.lexpos, len(char)))
+        parts.append(char)
+    return b''.join(parts)
+
+
+def _read_exact(file, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Arquivo binário de tokens truncado")
+    return data
+
+
+def read_binary(file):
+    """
+    Lê a saída binária. Gera, para cada arquivo, (caminho, segundos, tokens, erros)
+    com tokens como tuplas (tipo, valor, linha, posição) e erros como (caractere, linha, posição).
+    """
+    if _read_exact(file, 4) != BINARY_MAGIC:
+        raise ValueError("Não é um arquivo binário de tokens LPD")
+    version, type_count = _read_exact(file, 2)
+    if version != BINARY_VERSION:
+        raise ValueError(f"Versão {version} do formato binário não suportada")
+    types = []
+    for _ in range(type_count):
+        types.append(_read_exact(file, _read_exact(file, 1)[0]).decode('ascii'))
+
+    while True:
+        header = file.read(_FILE_RECORD.size)
+        if not header:
+            return
+        if len(header) != _FILE_RECORD.size:
+            raise ValueError("Arquivo binário de tokens truncado")
+        path_size, token_count, error_count, seconds = _FILE_RECORD.unpack(header)
+        path = _read_exact(file, path_size).decode('utf-8')
+        tokens = []
+        for _ in range(token_count):
+            type_index, lineno, lexpos, size = _TOKEN_RECORD.unpack(_read_exact(file, _TOKEN_RECORD.size))
+            token_type, value = types[type_index], _read_exact(file, size).decode('utf-8')
+            tokens.append((token_type, int(value) if token_type == 'NUMBER' else value, lineno, lexpos))
+        errors = []
+        for _ in range(error_count):
+            lineno, lexpos, size = _ERROR_RECORD.unpack(_read_exact(file, _ERROR_RECORD.size))
+            errors.append((_read_exact(file, size).decode('utf-8'), lineno, lexpos))
+        yield path, seconds, tokens, errors
+
+
+ENCODERS = {'jsonl': encode_jsonl, 'binary': encode_binary, 'none': None}
+
+# Lexer e formato de cada processo, definidos pelo inicializador do pool.
+_worker_lexer = None
+_worker_log = None
+_worker_encoder = None
+
+
+def _set_worker_lexer(engine: str, output_format: str) -> None:
+    global _worker_lexer, _worker_log, _worker_encoder
+    _worker_log = DiagnosticLog()
+    if engine == 'ply':
+        from LPD.frontend import load_lexer
+        _worker_lexer = load_lexer(error=_worker_log)
+    else:
+        from LPD.fast_lexer import FastLexer
+        _worker_lexer = FastLexer(error=_worker_log)
+    _worker_encoder = ENCODERS[output_format]
+
+
+def _tokenize_file(path: str) -> FileResult:
+    try:
+        with open(path, encoding='utf-8', errors='replace') as file:
+            text = file.read()
+    except OSError as error:
+        failure = error.strerror or str(error)
+        payload = encode_jsonl_failure(path, failure) if _worker_encoder is encode_jsonl else None
+        return FileResult(path, payload, 0, [], 0.0, failure)
+    start_time = timeit.default_timer()
+    del _worker_log[:]
+    _worker_lexer.lineno = 1
+    _worker_lexer.input(text)
+    tokens = list(_worker_lexer)
+    seconds = timeit.default_timer() - start_time
+
+    payload = _worker_encoder(path, tokens, _worker_log, text, seconds) if _worker_encoder else None
+    errors = [(error.char, error.lineno, error.column(text), error.lexpos) for error in _worker_log]
+    return FileResult(path, payload, len(tokens), errors, seconds)
+
+
+def tokenize_files(paths, workers=None, engine: str = 'fast', output_format: str = 'jsonl', chunksize: int = 4):
+    """ FileResult de cada arquivo, na ordem de `paths`, analisados em `workers` processos. """
+    with ProcessPoolExecutor(max_workers=workers, initializer=_set_worker_lexer,
+                             initargs=(engine, output_format)) as executor:
+        yield from executor.map(_tokenize_file, paths, chunksize=chunksize)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m LPD.batch", description="Análise léxica de arquivos LPD em lote")
+    parser.add_argument("paths", nargs="+", help="arquivos ou diretórios")
+    parser.add_argument("--format", choices=sorted(ENCODERS), default="jsonl")
+    parser.add_argument("--output", "-o", help="arquivo de saída (padrão: saída padrão)")
+    parser.add_argument("--workers", type=int, default=None, help="processos (padrão: um por CPU)")
+    parser.add_argument("--engine", choices=("fast", "ply"), default="fast",
+                        help="fast_lexer ou ply.lex com tabelas em cache")
+    parser.add_argument("--extension", default=".lpd", help="extensão procurada nos diretórios")
+    parser.add_argument("--timings", action="store_true", help="mostra o tempo de cada arquivo")
+    args = parser.parse_args(argv)
+
+    binary = args.format == 'binary'
+    if args.output:
+        output = open(args.output, 'wb' if binary else 'w', encoding=None if binary else 'utf-8')
+    else:
+        output = sys.stdout.buffer if binary else sys.stdout
+    if binary:
+        write_binary_header(output)
+
+    start_time = timeit.default_timer()
+    file_count = token_count = error_count = failure_count = 0
+    try:
+        for result in tokenize_files(list(collect_paths(args.paths, args.extension)), args.workers,
+                                     args.engine, args.format):
+            file_count += 1
+            token_count += result.token_count
+            error_count += len(result.errors)
+            if result.payload is not None:
+                output.write(result.payload)
+            if result.failure is not None:
+                failure_count += 1
+                print(f"{result.path}: {result.failure}", file=sys.stderr)
+            for char, lineno, column, _ in result.errors:
+                print(f"{result.path}:{lineno}:{column}: caractere ilegal {char!r}", file=sys.stderr)
+            if args.timings:
+                print(f"{result.path}: {result.token_count} tokens em {result.seconds * 1000:.2f} ms",
+                      file=sys.stderr)
+    finally:
+        if args.output:
+            output.close()
+        else:
+            output.flush()
+
+    seconds = timeit.default_timer() - start_time
+    print(f"{file_count} arquivos ({failure_count} ilegíveis), {token_count} tokens, {error_count} caracteres "
+          f"ilegais em {seconds:.2f}s ({token_count / max(seconds, 1e-9):,.0f} tokens/s)", file=sys.stderr)
+    return 1 if error_count or failure_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+""" Diagnósticos da análise léxica
+
+Os lexers recebem uma função `error(caractere, linha, posição)` chamada para cada
+caractere ilegal. report_error imprime a mensagem de sempre; DiagnosticLog guarda
+os erros como IllegalCharacter, para saída estruturada (ex.: python -m LPD.batch).
+"""
+
+
+def report_error(char: str, lineno: int, lexpos: int) -> None:
+    """ Mesma mensagem do t_error original das regras do PLY. """
+    print(f"Caractere ilegal '{char}' na linha {lineno}")
+
+
+class IllegalCharacter:
+    """
+    Um caractere que não forma token.
+
+    Atributos:
+      char (str): O caractere.
+      lineno (int): Linha (contada como o lexer conta).
+      lexpos (int): Posição no texto.
+    """
+
+    __slots__ = ('char', 'lineno', 'lexpos')
+
+    def __init__(self, char: str, lineno: int, lexpos: int) -> None:
+        self.char = char
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def column(self, text: str) -> int:
+        """ Coluna (a partir de 1) do caractere em `text`. """
+        return self.lexpos - text.rfind('\n', 0, self.lexpos)
+
+    def as_dict(self, text=None) -> dict:
+        record = {'char': self.char, 'line': self.lineno, 'pos': self.lexpos}
+        if text is not None:
+            record['column'] = self.column(text)
+        return record
+
+    def __repr__(self) -> str:
+        return f"IllegalCharacter({self.char!r}, {self.lineno}, {self.lexpos})"
+
+
+class DiagnosticLog(list):
+    """ Lista de IllegalCharacter; a própria lista é a função `error` dos lexers. """
+
+    def __call__(self, char: str, lineno: int, lexpos: int) -> None:
+        self.append(IllegalCharacter(char, lineno, lexpos))
@@ -0,0 +1,188 @@
+""" Lexer e parser da LPD com tabelas em cache
+
+Montar o lexer do PLY (lex.lex) lê as docstrings e compila as expressões a cada
+chamada, e o ply.yacc ainda refaz as tabelas LALR. Aqui as tabelas são geradas
+uma única vez e gravadas como módulos (lextab_<hash>.py e parsetab_<hash>.py) no
+diretório de cache; o hash é o das fontes das regras (LPD/tokens.py,
+LPD/ply_rules.py e LPD/grammar.py), então uma gramática alterada gera tabelas
+novas e as antigas são apagadas.
+
+Nada é importado antes de ser usado: analisar um arquivo pela linha de comando
+(python -m LPD) não importa tkinter nem numpy, e com as tabelas em cache inicia
+em dezenas de milissegundos. Medição da inicialização:
+
+    python -m LPD.frontend
+"""
+
+import functools
+import glob
+import importlib.util
+import os
+import zlib
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+RULE_SOURCES = ('tokens.py', 'ply_rules.py', 'grammar.py')
+
+# Diretório das tabelas: LPD_TABLE_DIR ou o cache do usuário.
+TABLE_DIR = os.environ.get('LPD_TABLE_DIR') or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'lpd')
+
+
+@functools.lru_cache(maxsize=None)
+def grammar_hash() -> str:
+    """ Hash das fontes das regras do lexer e da gramática. """
+    # CRC32 basta para distinguir versões e não carrega o hashlib (OpenSSL) na
+    # inicialização.
+    checksum = 0
+    for name in RULE_SOURCES:
+        with open(os.path.join(PACKAGE_DIR, name), 'rb') as file:
+            checksum = zlib.crc32(file.read(), checksum)
+    return f'{checksum:08x}'
+
+
+def _load_table(table_dir: str, name: str):
+    """ Módulo de tabela gravado em `table_dir`, ou None se ainda não existir. """
+    path = os.path.join(table_dir, name + '.py')
+    if not os.path.exists(path):
+        return None
+    spec = importlib.util.spec_from_file_location(f'_lpd_tables.{name}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _prepare_table_dir(table_dir: str, prefix: str, name: str) -> None:
+    """ Cria o diretório e apaga as tabelas de outras versões da gramática. """
+    os.makedirs(table_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(table_dir, prefix + '_*.py')):
+        if os.path.basename(path) != name + '.py':
+            os.remove(path)
+
+
+def load_lexer(table_dir: str = TABLE_DIR, error=None):
+    """
+    Lexer do ply.lex com as regras de LPD.ply_rules, a partir da tabela em cache.
+    `error(caractere, linha, posição)` substitui a mensagem de caractere ilegal.
+    """
+    from ply import lex
+
+    from LPD import ply_rules
+
+    name = f'lextab_{grammar_hash()}'
+    table = _load_table(table_dir, name)
+    if table is not None:
+        lexer = lex.lex(module=ply_rules, optimize=True, lextab=table)
+    else:
+        try:
+            _prepare_table_dir(table_dir, 'lextab', name)
+            lexer = lex.lex(module=ply_rules, optimize=True, lextab=name, outputdir=table_dir)
+        except OSError:
+            lexer = lex.lex(module=ply_rules)
+    if error is not None:
+        lexer.report_error = error
+    return lexer
+
+
+@functools.lru_cache(maxsize=None)
+def load_parser(table_dir: str = TABLE_DIR):
+    """ Parser do ply.yacc com a gramática de LPD.grammar, a partir da tabela em cache. """
+    from ply import yacc
+
+    from LPD import grammar
+
+    name = f'parsetab_{grammar_hash()}'
+    table = _load_table(table_dir, name)
+    if table is not None:
+        # O nome do arquivo já garante que a tabela é desta gramática.
+        return yacc.yacc(module=grammar, tabmodule=table, optimize=True, debug=False, write_tables=False)
+    try:
+        _prepare_table_dir(table_dir, 'parsetab', name)
+        write_tables = True
+    except OSError:
+        write_tables = False
+    # Os avisos do PLY (tokens sem uso na gramática) só poluiriam a saída.
+    return yacc.yacc(module=grammar, tabmodule=name, outputdir=table_dir, debug=False,
+                     write_tables=write_tables, errorlog=yacc.NullLogger())
+
+
+def parse(text: str, lexer=None, table_dir: str = TABLE_DIR):
+    """
+    Árvore sintática (tuplas, ver LPD.grammar) de `text`. Os tokens vêm do
+    LPD.fast_lexer, a menos que outro `lexer` seja passado. Erros de sintaxe
+    levantam LPD.grammar.LPDSyntaxError.
+    """
+    if lexer is None:
+        from LPD.fast_lexer import FastLexer
+        lexer = FastLexer()
+    return load_parser(table_dir).parse(text, lexer=lexer)
+
+
+SAMPLE_PROGRAM = """program exemplo;
+var total: int;
+procedure soma;
+var i: int;
+begin
+  while i do
+    if total then begin i := 1; total := i end else total := 0
+end;
+begin
+  while total do total := 0
+end.
+"""
+
+# Inicialização "como antes": tkinter importado, lexer e tabelas LALR refeitos.
+EAGER_STARTUP = """
+import tkinter
+import ply.lex as lex, ply.yacc as yacc
+from LPD import ply_rules, grammar
+from LPD.fast_lexer import FastLexer
+lex.lex(module=ply_rules)
+parser = yacc.yacc(module=grammar, debug=False, write_tables=False, errorlog=yacc.NullLogger())
+parser.parse(open({path!r}).read(), lexer=FastLexer())
+"""
+
+
+def _run(command, env, repeat: int) -> float:
+    """ Menor tempo (em segundos) de `repeat` execuções do processo. """
+    import subprocess
+    import timeit
+
+    timings = []
+    for _ in range(repeat):
+        start_time = timeit.default_timer()
+        subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+        timings.append(timeit.default_timer() - start_time)
+    return min(timings)
+
+
+def main(argv=None):
+    import argparse
+    import sys
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Mede o tempo de inicialização do analisador LPD")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    root = os.path.dirname(PACKAGE_DIR)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'exemplo.lpd')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(SAMPLE_PROGRAM)
+        env = dict(os.environ, LPD_TABLE_DIR=os.path.join(directory, 'tables'),
+                   PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+        analyze = [sys.executable, '-m', 'LPD', '--ply', path]
+
+        timings = {
+            "python sem nada": _run([sys.executable, '-c', 'pass'], env, args.repeat),
+            "antes (tkinter + lex.lex + yacc)": _run([sys.executable, '-c', EAGER_STARTUP.format(path=path)],
+                                                     env, args.repeat),
+            "sem tabelas (gera o cache)": _run(analyze, env, 1),
+            "com tabelas em cache": _run(analyze, env, args.repeat),
+        }
+    for name, seconds in timings.items():
+        print(f"{name:34} {seconds * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+""" Gramática da LPD para o ply.yacc
+
+As regras são as do parser.out, com duas diferenças. Em parser.out todo bloco
+exige uma declaração de procedimento, que por sua vez exige outro bloco, e todo
+comando contém outro comando: nenhum programa finito é aceito. Aqui a
+declaração de procedimento é opcional e há o comando de atribuição.
+
+A árvore é feita de tuplas, com o nome da regra na primeira posição:
+
+    ('program', nome, ('block', ('var', nome, tipo), procedimento, comando))
+"""
+
+from LPD.tokens import tokens
+
+start = 'program'
+
+
+class LPDSyntaxError(Exception):
+    """ Erro de sintaxe, com a linha e a posição do token inesperado (None no fim do texto). """
+
+    def __init__(self, message: str, token=None) -> None:
+        super().__init__(message)
+        self.token = token
+        self.lineno = token.lineno if token is not None else None
+        self.lexpos = token.lexpos if token is not None else None
+
+
+def p_program(p):
+    'program : PROGRAM IDENTIFIER SEMICOLON block DOT'
+    p[0] = ('program', p[2], p[4])
+
+
+def p_block(p):
+    'block : var_declaration procedure_declaration statement'
+    p[0] = ('block', p[1], p[2], p[3])
+
+
+def p_var_declaration(p):
+    'var_declaration : VAR IDENTIFIER COLON type SEMICOLON'
+    p[0] = ('var', p[2], p[4])
+
+
+def p_type(p):
+    '''type : INT
+            | CHAR
+            | FLOAT'''
+    p[0] = p[1].lower()
+
+
+def p_procedure_declaration(p):
+    'procedure_declaration : PROCEDURE IDENTIFIER SEMICOLON block SEMICOLON'
+    p[0] = ('procedure', p[2], p[4])
+
+
+def p_procedure_declaration_empty(p):
+    'procedure_declaration :'
+    p[0] = None
+
+
+def p_statement_compound(p):
+    'statement : BEGIN statement_list END'
+    p[0] = ('begin', p[2])
+
+
+def p_statement_attribution(p):
+    'statement : IDENTIFIER ATTRIBUTION expression'
+    p[0] = ('attribution', p[1], p[3])
+
+
+def p_statement_if(p):
+    'statement : IF expression THEN statement ELSE statement'
+    p[0] = ('if', p[2], p[4], p[6])
+
+
+def p_statement_while(p):
+    'statement : WHILE expression DO statement'
+    p[0] = ('while', p[2], p[4])
+
+
+def p_statement_list(p):
+    '''statement_list : statement SEMICOLON statement_list
+                      | statement'''
+    p[0] = [p[1]] + p[3] if len(p) == 4 else [p[1]]
+
+
+def p_expression_identifier(p):
+    'expression : IDENTIFIER'
+    p[0] = ('identifier', p[1])
+
+
+def p_expression_number(p):
+    'expression : NUMBER'
+    p[0] = ('number', p[1])
+
+
+def p_error(token):
+    if token is None:
+        raise LPDSyntaxError("Fim inesperado do programa")
+    raise LPDSyntaxError(f"Token inesperado {token.type} ({token.value!r}) na linha {token.lineno}", token)
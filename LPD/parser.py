@@ -0,0 +1,554 @@
+""" Analisador sintático completo da LPD
+
+Descendente recursivo, lendo diretamente o fluxo de tokens do lexer (um token
+de antecipação). Gramática:
+
+    programa    : PROGRAM IDENTIFIER ; bloco .
+    bloco       : declaração_var* sub-rotina* comando_composto
+    decl_var    : VAR IDENTIFIER {, IDENTIFIER} : tipo ;
+    tipo        : INT | CHAR | FLOAT
+    sub-rotina  : PROCEDURE IDENTIFIER ; bloco ;
+                | FUNCTION IDENTIFIER : tipo ; bloco ;
+    composto    : BEGIN comando {; comando} END
+    comando     : IDENTIFIER := expressão | IDENTIFIER          (chamada)
+                | IF expressão THEN comando [ELSE comando]
+                | WHILE expressão DO comando
+                | REPEAT comando {; comando} UNTIL expressão
+                | READC ( IDENTIFIER ) | READD ( IDENTIFIER )
+                | WRITEC ( IDENTIFIER ) | WRITED ( expressão )
+                | composto | (vazio, antes de END e UNTIL)
+    expressão   : simples [(= | <> | < | <= | > | >=) simples]
+    simples     : [+ | -] termo {(+ | - | OR) termo}
+    termo       : fator {(* | DIV | AND) fator}
+    fator       : IDENTIFIER | NUMBER | CHAR_LITERAL | NOT fator
+                | ( expressão ) | [ expressão ]
+
+A árvore não é feita de objetos aninhados: a SyntaxTree guarda os nós em
+arrays paralelos (tipo, valor, linha e a fatia dos filhos numa lista única de
+filhos), e cada nó é só um índice. Os filhos de um nó são gravados logo antes
+dele (pós-ordem), e a raiz é o último nó.
+
+Erros não interrompem a análise (modo pânico): o erro é registrado e os tokens
+são descartados até um ponto de sincronização (';', END, o início da próxima
+declaração...); o trecho vira um nó ERROR e a análise continua, então todos os
+erros saem numa passada. Depois de um erro, outros erros são ignorados até um
+token ser aceito, para não repetir mensagens em cascata.
+
+Cada nível de comando ou de parênteses custa alguns quadros de pilha, então o
+aninhamento é limitado a MAX_NESTING níveis: um trecho mais profundo vira um
+erro de sintaxe (e não um RecursionError).
+
+Vazão com um programa gerado de 200 mil linhas:
+
+    python -m LPD.parser --lines 200000
+"""
+
+import argparse
+import functools
+import timeit
+from array import array
+
+from LPD.diagnostics import DiagnosticLog
+from LPD.fast_lexer import tokenize
+from LPD.tokens import Token
+
+# Tipos de nó.
+(PROGRAM, BLOCK, VAR, PROCEDURE, FUNCTION, COMPOUND, ASSIGN, CALL, IF, WHILE, REPEAT, READ, WRITE,
+ BINARY, UNARY, IDENT, NUMBER, CHAR, ERROR) = range(19)
+KIND_NAMES = ('PROGRAM', 'BLOCK', 'VAR', 'PROCEDURE', 'FUNCTION', 'COMPOUND', 'ASSIGN', 'CALL', 'IF', 'WHILE',
+              'REPEAT', 'READ', 'WRITE', 'BINARY', 'UNARY', 'IDENT', 'NUMBER', 'CHAR', 'ERROR')
+
+EOF = '$end'
+
+# Níveis de comandos, parênteses e NOT aninhados (cada um custa ~4 quadros de pilha).
+MAX_NESTING = 150
+
+RELATIONAL = frozenset(('EQ', 'NE', 'LT', 'LE', 'GT', 'GE'))
+ADDITIVE = frozenset(('PLUS', 'MINUS', 'OR'))
+MULTIPLICATIVE = frozenset(('TIMES', 'DIV', 'AND'))
+TYPES = frozenset(('INT', 'CHAR', 'FLOAT'))
+STATEMENT_START = frozenset(('IDENTIFIER', 'IF', 'WHILE', 'REPEAT', 'BEGIN', 'READC', 'READD', 'WRITEC', 'WRITED'))
+
+# Pontos de sincronização do modo pânico.
+STATEMENT_SYNC = frozenset(('SEMICOLON', 'END', 'UNTIL', 'ELSE', 'DOT', EOF))
+CONDITION_SYNC = STATEMENT_SYNC | {'THEN', 'DO'}
+DECLARATION_SYNC = frozenset(('VAR', 'PROCEDURE', 'FUNCTION', 'BEGIN', 'DOT', EOF))
+# Tokens que encerram uma lista de comandos (mesmo que não seja a esperada).
+LIST_END = frozenset(('END', 'UNTIL', 'DOT', EOF, 'VAR', 'PROCEDURE', 'FUNCTION'))
+
+TOKEN_SPELLING = {
+    'SEMICOLON': "';'", 'COLON': "':'", 'COMMA': "','", 'DOT': "'.'", 'LPAREN': "'('", 'RPAREN': "')'",
+    'RBRACKET': "']'", 'ATTRIBUTION': "':='", EOF: "fim do arquivo",
+}
+
+
+class SyntaxTree:
+    """
+    Árvore sintática em arrays paralelos; um nó é um índice.
+
+    Atributos:
+      kinds (array): Tipo de cada nó (PROGRAM, IF, BINARY...).
+      values (list): Valor do nó: nome, número, operador ou tipo declarado (ou None).
+      linenos (array): Linha do token que originou o nó.
+      child_start (array), child_count (array): Fatia dos filhos em `children`.
+      children (array): Filhos de todos os nós, em sequência.
+      root (int): Nó PROGRAM (-1 se não houver).
+    """
+
+    __slots__ = ('kinds', 'values', 'linenos', 'child_start', 'child_count', 'children', 'root')
+
+    def __init__(self) -> None:
+        self.kinds = array('B')
+        self.values = []
+        self.linenos = array('l')
+        self.child_start = array('l')
+        self.child_count = array('l')
+        self.children = array('l')
+        self.root = -1
+
+    def add(self, kind: int, value, lineno: int, children=()) -> int:
+        """ Cria um nó com os filhos dados (já criados) e devolve o índice. """
+        node = len(self.kinds)
+        self.kinds.append(kind)
+        self.values.append(value)
+        self.linenos.append(lineno)
+        self.child_start.append(len(self.children))
+        self.child_count.append(len(children))
+        self.children.extend(children)
+        return node
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def kind(self, node: int) -> str:
+        return KIND_NAMES[self.kinds[node]]
+
+    def children_of(self, node: int):
+        start = self.child_start[node]
+        return self.children[start:start + self.child_count[node]].tolist()
+
+    def to_tuple(self, node=None):
+        """ O nó (a raiz por padrão) como tuplas aninhadas (tipo, valor, filhos...), para inspeção. """
+        node = self.root if node is None else node
+        return (self.kind(node), self.values[node], *(self.to_tuple(child) for child in self.children_of(node)))
+
+
+class ParseError:
+    """
+    Um erro de sintaxe.
+
+    Atributos:
+      message (str): Descrição.
+      lineno (int): Linha do token onde o erro foi percebido.
+      lexpos (int): Posição desse token.
+    """
+
+    __slots__ = ('message', 'lineno', 'lexpos')
+
+    def __init__(self, message: str, lineno: int, lexpos: int) -> None:
+        self.message = message
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self) -> str:
+        return f"ParseError({self.message!r}, {self.lineno}, {self.lexpos})"
+
+    def __str__(self) -> str:
+        return f"linha {self.lineno}: {self.message}"
+
+
+class _Panic(Exception):
+    """ Desfaz a descida até a regra que sabe se sincronizar. """
+
+
+def _describe(token) -> str:
+    if token.type == EOF:
+        return "fim do arquivo"
+    return f"{token.type} ({token.value!r})"
+
+
+class Parser:
+    """
+    Analisador de um fluxo de tokens (qualquer iterável de tokens com type, value,
+    lineno e lexpos). parse() devolve a SyntaxTree; os erros ficam em `errors`.
+    """
+
+    def __init__(self, tokens) -> None:
+        self.tree = SyntaxTree()
+        self.errors = []
+        self._end = Token(EOF, None, 1, 0)
+        self._next = functools.partial(next, iter(tokens), self._end)
+        self._suppressed = False
+        self.depth = 0
+        self.token = None
+        self.type = None
+        self.advance()
+
+    # Tokens
+
+    def advance(self):
+        """ Aceita o token atual e lê o próximo. """
+        token = self.token
+        following = self._next()
+        if following is self._end and token is not None:
+            # O fim do arquivo fica na linha do último token.
+            following.lineno, following.lexpos = token.lineno, token.lexpos
+        self.token, self.type = following, following.type
+        self._suppressed = False
+        return token
+
+    def expect(self, token_type: str):
+        """ Aceita um token do tipo dado, ou registra o erro e entra em pânico. """
+        if self.type == token_type:
+            return self.advance()
+        self.error(f"{TOKEN_SPELLING.get(token_type, token_type)} esperado, encontrado {_describe(self.token)}")
+        raise _Panic()
+
+    def error(self, message: str) -> None:
+        if not self._suppressed:
+            self.errors.append(ParseError(message, self.token.lineno, self.token.lexpos))
+            self._suppressed = True
+
+    def skip(self) -> None:
+        """ Descarta o token atual (sem aceitá-lo). """
+        token = self._next()
+        self.token, self.type = token, token.type
+
+    def synchronize(self, sync) -> None:
+        """ Descarta tokens até um do conjunto `sync`. """
+        next_token = self._next
+        token = self.token
+        while token.type not in sync:
+            token = next_token()
+        self.token, self.type = token, token.type
+
+    def nest(self) -> None:
+        """ Entra num nível de aninhamento (a saída é `self.depth -= 1`). """
+        if self.depth >= MAX_NESTING:
+            self.error(f"Aninhamento com mais de {MAX_NESTING} níveis")
+            raise _Panic()
+        self.depth += 1
+
+    def _error_node(self, lineno: int) -> int:
+        return self.tree.add(ERROR, None, lineno)
+
+    # Programa e declarações
+
+    def parse(self) -> SyntaxTree:
+        tree = self.tree
+        lineno = self.token.lineno
+        name = None
+        try:
+            self.expect('PROGRAM')
+            name = self.expect('IDENTIFIER').value
+            self.expect('SEMICOLON')
+        except _Panic:
+            self.synchronize(DECLARATION_SYNC)
+        block = self.block()
+        if self.type == 'DOT':
+            self.advance()
+        else:
+            self.error(f"'.' esperado no fim do programa, encontrado {_describe(self.token)}")
+        if self.type != EOF:
+            self.error(f"Texto depois do fim do programa: {_describe(self.token)}")
+        tree.root = tree.add(PROGRAM, name, lineno, (block,))
+        return tree
+
+    def block(self) -> int:
+        lineno = self.token.lineno
+        children = []
+        while self.type == 'VAR':
+            children.append(self.var_declaration())
+        while self.type in ('PROCEDURE', 'FUNCTION'):
+            children.append(self.subroutine())
+        if self.type == 'BEGIN':
+            children.append(self.compound())
+        else:
+            self.error(f"BEGIN esperado, encontrado {_describe(self.token)}")
+            self.synchronize(STATEMENT_SYNC | DECLARATION_SYNC)
+            children.append(self._error_node(self.token.lineno))
+        return self.tree.add(BLOCK, None, lineno, children)
+
+    def var_declaration(self) -> int:
+        lineno = self.advance().lineno
+        tree = self.tree
+        try:
+            names = [tree.add(IDENT, self.expect('IDENTIFIER').value, lineno)]
+            while self.type == 'COMMA':
+                self.advance()
+                names.append(tree.add(IDENT, self.expect('IDENTIFIER').value, self.token.lineno))
+            self.expect('COLON')
+            var_type = self.type_name()
+            self.expect('SEMICOLON')
+        except _Panic:
+            self.synchronize(DECLARATION_SYNC | {'SEMICOLON'})
+            if self.type == 'SEMICOLON':
+                self.advance()
+            return self._error_node(lineno)
+        return tree.add(VAR, var_type, lineno, names)
+
+    def type_name(self) -> str:
+        if self.type in TYPES:
+            return self.advance().type.lower()
+        self.error(f"Tipo (int, char ou float) esperado, encontrado {_describe(self.token)}")
+        raise _Panic()
+
+    def subroutine(self) -> int:
+        token = self.advance()
+        kind = PROCEDURE if token.type == 'PROCEDURE' else FUNCTION
+        name, return_type = None, None
+        try:
+            name = self.expect('IDENTIFIER').value
+            if kind == FUNCTION:
+                self.expect('COLON')
+                return_type = self.type_name()
+            self.expect('SEMICOLON')
+        except _Panic:
+            self.synchronize(DECLARATION_SYNC)
+        try:
+            self.nest()
+        except _Panic:
+            self.synchronize(STATEMENT_SYNC)
+            return self._error_node(token.lineno)
+        try:
+            block = self.block()
+        finally:
+            self.depth -= 1
+        if self.type == 'SEMICOLON':
+            self.advance()
+        else:
+            self.error(f"';' esperado depois de {token.value} {name}, encontrado {_describe(self.token)}")
+        value = name if kind == PROCEDURE else (name, return_type)
+        return self.tree.add(kind, value, token.lineno, (block,))
+
+    # Comandos
+
+    def compound(self) -> int:
+        lineno = self.advance().lineno
+        statements = self.statement_list('END')
+        if self.type == 'END':
+            self.advance()
+        else:
+            self.error(f"END esperado, encontrado {_describe(self.token)}")
+        return self.tree.add(COMPOUND, None, lineno, statements)
+
+    def statement_list(self, terminator: str) -> list:
+        """ Comandos separados por ';' até `terminator` (END ou UNTIL). """
+        statements = []
+        while self.type != terminator:
+            statements.append(self.protected_statement())
+            if self.type == 'SEMICOLON':
+                self.advance()
+            elif self.type in STATEMENT_START:
+                # Falta o ';' entre dois comandos: registra e segue.
+                self.error(f"';' esperado antes de {_describe(self.token)}")
+            elif self.type in LIST_END:
+                break
+            else:
+                # ELSE sem IF, ')' sobrando...: descarta até o fim do comando.
+                self.error(f"Token inesperado {_describe(self.token)}")
+                self.skip()
+                self.synchronize(STATEMENT_SYNC)
+                if self.type == 'SEMICOLON':
+                    self.advance()
+        return statements
+
+    def protected_statement(self) -> int:
+        """ Um comando; se houver erro, sincroniza e devolve um nó ERROR. """
+        lineno = self.token.lineno
+        try:
+            self.nest()
+            try:
+                return self.statement()
+            finally:
+                self.depth -= 1
+        except _Panic:
+            self.synchronize(STATEMENT_SYNC)
+            return self._error_node(lineno)
+
+    def statement(self) -> int:
+        token_type = self.type
+        tree = self.tree
+        if token_type == 'IDENTIFIER':
+            token = self.advance()
+            if self.type == 'ATTRIBUTION':
+                self.advance()
+                return tree.add(ASSIGN, token.value, token.lineno, (self.guarded_expression(STATEMENT_SYNC),))
+            return tree.add(CALL, token.value, token.lineno)
+        if token_type == 'IF':
+            lineno = self.advance().lineno
+            condition = self.guarded_expression(CONDITION_SYNC)
+            self.expect('THEN')
+            children = [condition, self.protected_statement()]
+            if self.type == 'ELSE':
+                self.advance()
+                children.append(self.protected_statement())
+            return tree.add(IF, None, lineno, children)
+        if token_type == 'WHILE':
+            lineno = self.advance().lineno
+            condition = self.guarded_expression(CONDITION_SYNC)
+            self.expect('DO')
+            return tree.add(WHILE, None, lineno, (condition, self.protected_statement()))
+        if token_type == 'BEGIN':
+            return self.compound()
+        if token_type == 'REPEAT':
+            lineno = self.advance().lineno
+            body = self.statement_list('UNTIL')
+            self.expect('UNTIL')
+            return tree.add(REPEAT, None, lineno, body + [self.guarded_expression(STATEMENT_SYNC)])
+        if token_type in ('READC', 'READD'):
+            token = self.advance()
+            self.expect('LPAREN')
+            target = self.expect('IDENTIFIER')
+            self.expect('RPAREN')
+            return tree.add(READ, token.type.lower(), token.lineno, (tree.add(IDENT, target.value, target.lineno),))
+        if token_type in ('WRITEC', 'WRITED'):
+            token = self.advance()
+            self.expect('LPAREN')
+            value = self.guarded_expression(STATEMENT_SYNC | {'RPAREN'})
+            self.expect('RPAREN')
+            return tree.add(WRITE, token.type.lower(), token.lineno, (value,))
+        self.error(f"Comando esperado, encontrado {_describe(self.token)}")
+        raise _Panic()
+
+    # Expressões
+
+    def guarded_expression(self, sync) -> int:
+        """ Uma expressão; se houver erro, sincroniza em `sync` e devolve um nó ERROR. """
+        lineno = self.token.lineno
+        try:
+            return self.expression()
+        except _Panic:
+            self.synchronize(sync)
+            return self._error_node(lineno)
+
+    def expression(self) -> int:
+        left = self.simple_expression()
+        if self.type in RELATIONAL:
+            operator = self.advance()
+            left = self.tree.add(BINARY, operator.type, operator.lineno, (left, self.simple_expression()))
+        return left
+
+    def simple_expression(self) -> int:
+        tree = self.tree
+        if self.type in ('PLUS', 'MINUS'):
+            operator = self.advance()
+            left = tree.add(UNARY, operator.type, operator.lineno, (self.term(),))
+        else:
+            left = self.term()
+        while self.type in ADDITIVE:
+            operator = self.advance()
+            left = tree.add(BINARY, operator.type, operator.lineno, (left, self.term()))
+        return left
+
+    def term(self) -> int:
+        left = self.factor()
+        while self.type in MULTIPLICATIVE:
+            operator = self.advance()
+            left = self.tree.add(BINARY, operator.type, operator.lineno, (left, self.factor()))
+        return left
+
+    def factor(self) -> int:
+        token_type = self.type
+        tree = self.tree
+        if token_type == 'IDENTIFIER':
+            token = self.advance()
+            return tree.add(IDENT, token.value, token.lineno)
+        if token_type == 'NUMBER':
+            token = self.advance()
+            return tree.add(NUMBER, token.value, token.lineno)
+        if token_type == 'CHAR_LITERAL':
+            token = self.advance()
+            return tree.add(CHAR, token.value, token.lineno)
+        if token_type == 'NOT':
+            self.nest()
+            try:
+                operator = self.advance()
+                return tree.add(UNARY, 'NOT', operator.lineno, (self.factor(),))
+            finally:
+                self.depth -= 1
+        if token_type in ('LPAREN', 'LBRACKET'):
+            self.nest()
+            try:
+                closing = 'RPAREN' if self.advance().type == 'LPAREN' else 'RBRACKET'
+                value = self.expression()
+                self.expect(closing)
+                return value
+            finally:
+                self.depth -= 1
+        self.error(f"Expressão esperada, encontrado {_describe(self.token)}")
+        raise _Panic()
+
+
+def parse_program(text: str, error=None):
+    """
+    Analisa o código `text`. Retorna (árvore, erros de sintaxe, caracteres
+    ilegais), os últimos numa DiagnosticLog; se dada, `error(caractere, linha,
+    posição)` também é chamada para cada caractere ilegal.
+    """
+    log = DiagnosticLog()
+    report = log
+    if error is not None:
+        def report(char, lineno, lexpos):
+            log(char, lineno, lexpos)
+            error(char, lineno, lexpos)
+    parser = Parser(tokenize(text, error=report))
+    return parser.parse(), parser.errors, log
+
+
+def generate_program(lines: int) -> str:
+    """ Programa LPD válido com aproximadamente `lines` linhas. """
+    procedure = """procedure soma{index};
+var i, parcial: int;
+var c: char;
+begin
+  i := 0;
+  parcial := 0;
+  while i <= 100 do
+  begin
+    parcial := parcial + i * 2 - (total div 3);
+    if (parcial >= 1000) and not (i <> 50) then
+      writed(parcial)
+    else
+      readd(x);
+    i := i + 1
+  end;
+  c := 'a';
+  writec(c);
+  repeat x := x - 1 until x < 0
+end;
+"""
+    procedure_lines = procedure.count('\n')
+    count = max(1, lines // procedure_lines)
+    body = ''.join(procedure.format(index=index) for index in range(count))
+    calls = ';\n  '.join(f"soma{index}" for index in range(0, count, max(1, count // 100)))
+    return f"program gerado;\nvar x, total: int;\n{body}begin\n  {calls}\nend.\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede a vazão do analisador sintático da LPD")
+    parser.add_argument("--lines", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    text = generate_program(args.lines)
+    lines = text.count('\n')
+    tokens = list(tokenize(text))
+    print(f"Programa de {lines} linhas, {len(tokens)} tokens")
+
+    def parse_tokens():
+        parser = Parser(tokens)
+        return parser.parse(), parser.errors
+
+    tree, errors = parse_tokens()
+    if errors:
+        raise AssertionError(f"O programa gerado tem erros: {errors[:3]}")
+    parse_seconds = min(timeit.repeat(parse_tokens, number=1, repeat=args.repeat))
+    total_seconds = min(timeit.repeat(lambda: parse_program(text), number=1, repeat=args.repeat))
+    print(f"Árvore com {len(tree)} nós")
+    print(f"Só a análise sintática: {parse_seconds:.3f}s ({lines / parse_seconds:,.0f} linhas/s)")
+    print(f"Léxica + sintática:     {total_seconds:.3f}s ({lines / total_seconds:,.0f} linhas/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+""" Regras do analisador léxico da LPD para o ply.lex
+
+É o lexer de referência: LPD.fast_lexer produz exatamente os mesmos tokens.
+"""
+
+import sys
+
+import ply.lex as lex
+
+from LPD.diagnostics import report_error
+from LPD.tokens import reserved, tokens
+
+# Regras para tokens simples
+t_PLUS = r'\+'
+t_MINUS = r'-'
+t_TIMES = r'\*'
+t_LPAREN = r'\('
+t_RPAREN = r'\)'
+t_LBRACKET = r'\['
+t_RBRACKET = r'\]'
+t_SEMICOLON = r';'
+t_COMMA = r','
+t_DOT = r'\.'
+t_GT = r'>'
+t_LT = r'<'
+t_EQ = r'='
+t_ATTRIBUTION = r':='
+t_COLON = r':'
+t_GE = r'>='
+t_LE = r'<='
+t_NE = r'<>'
+
+# Ignorar espaços e tabs
+t_ignore = ' \t'
+
+# Contador de linhas
+def t_newline(t):
+    r'\n+'
+    t.lexer.lineno += len(t.value)
+
+# Regra para números
+def t_NUMBER(t):
+    r'\d+'
+    t.value = int(t.value)
+    return t
+
+# Regra para caracteres literais
+def t_CHAR_LITERAL(t):
+    r'\'.\''
+    t.value = t.value[1:-1]  # Remove as aspas
+    return t
+
+# Regra para identificadores e palavras reservadas
+def t_IDENTIFIER(t):
+    r'[a-zA-Z][a-zA-Z0-9_]*'
+    t.type = reserved.get(t.value.lower(), 'IDENTIFIER')
+    return t
+
+# Regra para comentários
+def t_COMMENT(t):
+    r'\{[^}]*\}'
+    pass
+
+# Regra para erro: repassa o caractere à função `report_error` do lexer
+def t_error(t):
+    getattr(t.lexer, 'report_error', report_error)(t.value[0], t.lineno, t.lexpos)
+    t.lexer.skip(1)
+
+
+def build_lexer(error=report_error, **options):
+    """
+    Lexer do PLY com as regras deste módulo. `error(caractere, linha, posição)`
+    é chamada para cada caractere ilegal.
+    """
+    lexer = lex.lex(module=sys.modules[__name__], **options)
+    lexer.report_error = error
+    return lexer
@@ -0,0 +1,73 @@
+""" Análise léxica de arquivos em blocos
+
+stream_tokens lê o arquivo em blocos de tamanho fixo e gera os mesmos tokens
+que o fast_lexer geraria com o texto inteiro, sem nunca carregá-lo todo na
+memória. Cada bloco é analisado só até a última quebra de linha (nenhum token,
+exceto comentários, atravessa uma linha); o resto da última linha fica para o
+próximo bloco. Um '{' sem '}' no bloco pode ser um comentário que fecha num
+bloco seguinte: a análise para nele e ele espera até chegar um '}' (ou o fim do
+arquivo, quando vira erro como no PLY).
+
+A memória usada é a de um bloco mais a linha (ou o comentário) incompleta.
+
+    python -m LPD.streaming arquivo.lpd
+"""
+
+import argparse
+import timeit
+
+from LPD.fast_lexer import report_error, scan
+
+CHUNK_SIZE = 1 << 16
+
+
+def stream_tokens(file, chunk_size: int = CHUNK_SIZE, lineno: int = 1, error=report_error):
+    """
+    Tokens do arquivo de texto `file`, lido em blocos de `chunk_size` caracteres.
+    O lexpos de cada token é a posição no arquivo inteiro.
+    """
+    identifier_types = {}
+    pending = ''
+    offset = 0
+    # `pending` começa com um '{' que não tem '}' até `searched`.
+    open_comment = False
+    searched = 0
+
+    while True:
+        chunk = file.read(chunk_size)
+        final = not chunk
+        buffer = pending + chunk
+        if open_comment and not final and buffer.find('}', searched) < 0:
+            pending, searched = buffer, len(buffer)
+            continue
+        cut = len(buffer) if final else buffer.rfind('\n') + 1
+
+        lineno, stop = yield from scan(buffer, lineno, error, endpos=cut, offset=offset,
+                                       partial=not final, identifier_types=identifier_types)
+        open_comment = stop < cut
+        searched = cut - stop
+        pending = buffer[stop:]
+        offset += stop
+        if final:
+            return
+
+
+def tokenize_file(path, chunk_size: int = CHUNK_SIZE, error=report_error, encoding: str = 'utf-8'):
+    """ Tokens do arquivo em `path` (ver stream_tokens). """
+    with open(path, encoding=encoding, newline='') as file:
+        yield from stream_tokens(file, chunk_size, error=error)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Conta os tokens de um arquivo LPD lido em blocos")
+    parser.add_argument("path")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    start_time = timeit.default_timer()
+    quantity = sum(1 for _ in tokenize_file(args.path, args.chunk_size))
+    print(f"{quantity} tokens em {timeit.default_timer() - start_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
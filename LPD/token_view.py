@@ -0,0 +1,230 @@
+""" Tabela de tokens virtualizada para a interface do lexer
+
+Inserir uma linha do Treeview por token trava o Tk a partir de dezenas de
+milhares de tokens. Aqui os tokens ficam em arrays (TokenTable) e o Treeview tem
+só `height` linhas fixas: rolar, filtrar ou pular para uma linha apenas troca os
+valores dessas linhas. A memória da interface não depende da quantidade
+de tokens, e cada atualização mexe em algumas dezenas de itens.
+
+A TokenTable tem dois índices:
+
+  - por tipo: os tokens ordenados pelo tipo (ordenação estável), com o início
+    de cada tipo; os tokens de um tipo são uma fatia, sem cópia;
+  - por linha: os tokens já estão em ordem de linha, e as linhas na ordem por
+    tipo também ficam guardadas, então achar o primeiro token de uma linha (no
+    filtro atual ou não) é uma busca binária numa fatia, sem cópia.
+
+Medição com um milhão de tokens (sem abrir janela):
+
+    python -m LPD.token_view --tokens 1000000
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from LPD.tokens import TOKEN_INDEX, tokens as TOKEN_TYPES
+
+ALL_TYPES = 'Todos'
+
+
+class TokenTable:
+    """
+    Tokens em colunas.
+
+    Atributos:
+      types (np.ndarray): Código do tipo de cada token (posição em LPD.tokens.tokens).
+      values (list): Lexema de cada token.
+      linenos (np.ndarray): Linha de cada token (em ordem crescente).
+      lexpos (np.ndarray): Posição de cada token no texto.
+    """
+
+    def __init__(self, types, values, linenos, lexpos) -> None:
+        self.types = np.fromiter(map(TOKEN_INDEX.__getitem__, types), np.uint8, len(types))
+        self.values = values
+        self.linenos = np.asarray(linenos, dtype=np.int64)
+        self.lexpos = np.asarray(lexpos, dtype=np.int64)
+        self.by_type = np.argsort(self.types, kind='stable')
+        self.type_bounds = np.searchsorted(self.types[self.by_type], np.arange(len(TOKEN_TYPES) + 1))
+        self.linenos_by_type = self.linenos[self.by_type]
+
+    @classmethod
+    def from_lexer(cls, lexer):
+        """ Tabela dos tokens de um LPD.incremental.IncrementalLexer. """
+        return cls(*lexer.token_columns())
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        """ Tabela de tokens quaisquer (com type, value, lineno e lexpos). """
+        tokens = list(tokens)
+        return cls([token.type for token in tokens], [token.value for token in tokens],
+                   [token.lineno for token in tokens], [token.lexpos for token in tokens])
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def present_types(self) -> list:
+        """ Tipos que aparecem na tabela, em ordem alfabética. """
+        counts = np.diff(self.type_bounds)
+        return sorted(TOKEN_TYPES[code] for code in np.flatnonzero(counts))
+
+    def rows(self, token_type=None) -> np.ndarray:
+        """ Índices dos tokens do tipo (todos se None), em ordem de linha. """
+        if token_type is None:
+            return np.arange(len(self))
+        code = TOKEN_INDEX[token_type]
+        return self.by_type[self.type_bounds[code]:self.type_bounds[code + 1]]
+
+    def row_for_line(self, lineno: int, token_type=None) -> int:
+        """ Posição em rows(token_type) do primeiro token da linha `lineno` ou de uma linha seguinte. """
+        if token_type is None:
+            return int(np.searchsorted(self.linenos, lineno))
+        code = TOKEN_INDEX[token_type]
+        return int(np.searchsorted(self.linenos_by_type[self.type_bounds[code]:self.type_bounds[code + 1]], lineno))
+
+    def row(self, index: int):
+        """ (tipo, lexema, linha) do token `index`. """
+        return TOKEN_TYPES[self.types[index]], self.values[index], int(self.linenos[index])
+
+
+class VirtualTokenView:
+    """
+    Treeview com colunas Token, Lexema e Linha que mostra uma TokenTable de
+    qualquer tamanho, mais um filtro por tipo e um campo para pular para uma
+    linha. `frame` é o widget a posicionar (grid/pack) na janela.
+    """
+
+    COLUMNS = ('Token', 'Lexema', 'Linha')
+
+    def __init__(self, master, height: int = 10) -> None:
+        import tkinter as tk
+        from tkinter import ttk
+
+        self.table = TokenTable([], [], [], [])
+        self.visible_type = None
+        self.visible_rows = self.table.rows()
+        self.first = 0
+
+        self.frame = ttk.Frame(master)
+        toolbar = ttk.Frame(self.frame)
+        toolbar.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E))
+        ttk.Label(toolbar, text="Tipo:").pack(side=tk.LEFT)
+        self.type_var = tk.StringVar(value=ALL_TYPES)
+        self.type_box = ttk.Combobox(toolbar, textvariable=self.type_var, values=[ALL_TYPES], state='readonly',
+                                     width=14)
+        self.type_box.pack(side=tk.LEFT, padx=5)
+        self.type_box.bind('<<ComboboxSelected>>', lambda event: self.apply_filter())
+        ttk.Label(toolbar, text="Linha:").pack(side=tk.LEFT, padx=(10, 0))
+        self.line_var = tk.StringVar()
+        line_entry = ttk.Entry(toolbar, textvariable=self.line_var, width=8)
+        line_entry.pack(side=tk.LEFT, padx=5)
+        line_entry.bind('<Return>', lambda event: self.go_to_line())
+        ttk.Button(toolbar, text="Ir", command=self.go_to_line).pack(side=tk.LEFT)
+        self.count_label = ttk.Label(toolbar, text="")
+        self.count_label.pack(side=tk.RIGHT)
+
+        self.tree = ttk.Treeview(self.frame, columns=self.COLUMNS, show='headings', height=height)
+        for column in self.COLUMNS:
+            self.tree.heading(column, text=column)
+        self.tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.scroll)
+        self.scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        # A linha da tabela não cresce com o frame: o Treeview tem altura fixa.
+        self.frame.columnconfigure(0, weight=1)
+
+        # Itens fixos do Treeview, um por linha visível; só os valores mudam. A
+        # quantidade não acompanha o tamanho da janela: derivá-la da altura do
+        # próprio Treeview realimenta o <Configure> (a altura pedida muda a
+        # altura recebida).
+        self.items = [self.tree.insert('', tk.END, values=('', '', '')) for _ in range(height)]
+
+        self.tree.bind('<MouseWheel>', lambda event: self.scroll('scroll', -1 if event.delta > 0 else 1, 'units'))
+        self.tree.bind('<Button-4>', lambda event: self.scroll('scroll', -1, 'units'))
+        self.tree.bind('<Button-5>', lambda event: self.scroll('scroll', 1, 'units'))
+
+    def set_table(self, table: TokenTable) -> None:
+        """ Mostra outra tabela, mantendo o filtro se o tipo ainda existir. """
+        self.table = table
+        types = [ALL_TYPES] + table.present_types()
+        self.type_box['values'] = types
+        if self.type_var.get() not in types:
+            self.type_var.set(ALL_TYPES)
+        self.apply_filter()
+
+    def apply_filter(self) -> None:
+        token_type = self.type_var.get()
+        self.visible_type = None if token_type == ALL_TYPES else token_type
+        self.visible_rows = self.table.rows(self.visible_type)
+        self.count_label.configure(text=f"{len(self.visible_rows)} de {len(self.table)} tokens")
+        self.show(0)
+
+    def go_to_line(self) -> None:
+        try:
+            lineno = int(self.line_var.get())
+        except ValueError:
+            return
+        target = self.table.row_for_line(lineno, self.visible_type)
+        self.show(target)
+        # Perto do fim da lista a primeira linha visível pode vir antes do token.
+        if target < len(self.visible_rows):
+            self.tree.selection_set(self.items[target - self.first])
+
+    def show(self, first: int) -> None:
+        """ Preenche os itens do Treeview a partir da posição `first` do filtro atual. """
+        total = len(self.visible_rows)
+        first = max(0, min(first, total - len(self.items)))
+        self.first = first
+        shown = self.visible_rows[first:first + len(self.items)].tolist()
+        for item, index in zip(self.items, shown):
+            self.tree.item(item, values=self.table.row(index))
+        for item in self.items[len(shown):]:
+            self.tree.item(item, values=('', '', ''))
+        if total:
+            self.scrollbar.set(first / total, (first + len(shown)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll(self, action: str, amount, unit=None) -> None:
+        """ Comando da barra de rolagem (moveto fração / scroll n units|pages). """
+        if action == 'moveto':
+            self.show(int(float(amount) * len(self.visible_rows)))
+        elif action == 'scroll':
+            step = len(self.items) if unit == 'pages' else 1
+            self.show(self.first + int(amount) * step)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede a tabela de tokens virtualizada")
+    parser.add_argument("--tokens", type=int, default=1000000)
+    args = parser.parse_args(argv)
+
+    from LPD.fast_lexer import sample_source
+    from LPD.incremental import IncrementalLexer
+
+    text = sample_source(1)
+    while len(text) * 0.28 < args.tokens:
+        text += text
+    lexer = IncrementalLexer(text)
+
+    start_time = timeit.default_timer()
+    table = TokenTable.from_lexer(lexer)
+    print(f"Tabela de {len(table)} tokens montada em {timeit.default_timer() - start_time:.3f}s")
+
+    def page(rows, first):
+        return [table.row(index) for index in rows[first:first + 30].tolist()]
+
+    for name, operation in [
+        ("rolar até o meio", lambda: page(table.rows(), len(table) // 2)),
+        ("filtrar IDENTIFIER", lambda: page(table.rows('IDENTIFIER'), 0)),
+        ("pular para a linha do meio",
+         lambda: page(table.rows(), table.row_for_line(int(table.linenos[-1]) // 2))),
+        ("pular para a linha do meio (IDENTIFIER)",
+         lambda: page(table.rows('IDENTIFIER'), table.row_for_line(int(table.linenos[-1]) // 2, 'IDENTIFIER'))),
+    ]:
+        seconds = min(timeit.repeat(operation, number=1, repeat=5))
+        print(f"{name}: {seconds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
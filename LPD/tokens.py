@@ -0,0 +1,114 @@
+""" Tokens da LPD
+
+Conjunto de tokens e palavras reservadas usado tanto pelas regras do PLY
+(LPD.ply_rules) quanto pelo lexer compilado (LPD.fast_lexer).
+
+As palavras reservadas não diferenciam maiúsculas. Além do dicionário `reserved`
+há uma tabela de hash perfeito (KEYWORDS): cada palavra reservada cai numa posição
+diferente, então classificar um identificador é calcular o hash, olhar uma única
+posição e comparar.
+"""
+
+tokens = [
+    'PROGRAM', 'BEGIN', 'END', 'PROCEDURE', 'FUNCTION', 'IF', 'THEN', 'ELSE',
+    'WHILE', 'DO', 'REPEAT', 'UNTIL', 'VAR', 'INT', 'CHAR', 'FLOAT',
+    'IDENTIFIER', 'NUMBER', 'ATTRIBUTION', 'COLON', 'WRITEC', 'WRITED', 'READC', 'READD',
+    'DOT', 'SEMICOLON', 'COMMA', 'LPAREN', 'RPAREN', 'LBRACKET', 'RBRACKET',
+    'AND', 'OR', 'NOT', 'GT', 'LT', 'EQ', 'NE', 'GE', 'LE',
+    'PLUS', 'MINUS', 'TIMES', 'DIV', 'CHAR_LITERAL'
+]
+
+# Código de cada tipo de token (posição em `tokens`), para guardar tipos em arrays.
+TOKEN_INDEX = {token_type: index for index, token_type in enumerate(tokens)}
+
+# Palavras reservadas
+reserved = {
+    'program': 'PROGRAM',
+    'begin': 'BEGIN',
+    'end': 'END',
+    'procedure': 'PROCEDURE',
+    'function': 'FUNCTION',
+    'if': 'IF',
+    'then': 'THEN',
+    'else': 'ELSE',
+    'while': 'WHILE',
+    'do': 'DO',
+    'repeat': 'REPEAT',
+    'until': 'UNTIL',
+    'var': 'VAR',
+    'int': 'INT',
+    'char': 'CHAR',
+    'float': 'FLOAT',
+    'writec': 'WRITEC',
+    'writed': 'WRITED',
+    'readc': 'READC',
+    'readd': 'READD',
+    'and': 'AND',
+    'or': 'OR',
+    'not': 'NOT',
+    'div': 'DIV'
+}
+
+
+class Token:
+    """
+    Um token, com os mesmos atributos do LexToken do PLY.
+
+    Atributos:
+      type (str): Tipo do token (ex.: 'IDENTIFIER').
+      value: Lexema (int para NUMBER; sem as aspas para CHAR_LITERAL).
+      lineno (int): Linha do token.
+      lexpos (int): Posição do token no texto.
+    """
+
+    # `lexer` só é preenchido pelo ply.yacc no token de um erro de sintaxe.
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type: str, value, lineno: int, lexpos: int) -> None:
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __eq__(self, other) -> bool:
+        return (self.type == other.type and self.value == other.value and
+                self.lineno == other.lineno and self.lexpos == other.lexpos)
+
+    def __repr__(self) -> str:
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+def _keyword_hash(word: str, length_factor: int, first_factor: int, size: int) -> int:
+    """ Hash pelo tamanho e pela primeira e última letras (já em minúsculas). """
+    return (len(word) * length_factor + ord(word[0]) * first_factor + ord(word[-1])) % size
+
+
+def find_perfect_hash(words):
+    """ Menor tabela (tamanho, fator do tamanho, fator da primeira letra) sem colisões. """
+    for size in range(len(words), 8 * len(words)):
+        for length_factor in range(1, size):
+            for first_factor in range(1, size):
+                if len({_keyword_hash(word, length_factor, first_factor, size) for word in words}) == len(words):
+                    return size, length_factor, first_factor
+    raise ValueError("Nenhum hash perfeito encontrado para as palavras reservadas")
+
+
+# Parâmetros pré-calculados com find_perfect_hash(reserved); se as palavras
+# reservadas mudarem, são recalculados na importação.
+KEYWORD_TABLE_SIZE, KEYWORD_LENGTH_FACTOR, KEYWORD_FIRST_FACTOR = 39, 8, 34
+if len({_keyword_hash(word, KEYWORD_LENGTH_FACTOR, KEYWORD_FIRST_FACTOR, KEYWORD_TABLE_SIZE)
+        for word in reserved}) != len(reserved):
+    KEYWORD_TABLE_SIZE, KEYWORD_LENGTH_FACTOR, KEYWORD_FIRST_FACTOR = find_perfect_hash(list(reserved))
+
+# KEYWORDS[hash] = (palavra, tipo) ou None.
+KEYWORDS = [None] * KEYWORD_TABLE_SIZE
+for _word, _type in reserved.items():
+    KEYWORDS[_keyword_hash(_word, KEYWORD_LENGTH_FACTOR, KEYWORD_FIRST_FACTOR, KEYWORD_TABLE_SIZE)] = (_word, _type)
+del _word, _type
+
+
+def keyword_type(word: str) -> str:
+    """ Tipo do identificador `word`: a palavra reservada correspondente ou 'IDENTIFIER'. """
+    lowered = word.lower()
+    entry = KEYWORDS[_keyword_hash(lowered, KEYWORD_LENGTH_FACTOR, KEYWORD_FIRST_FACTOR, KEYWORD_TABLE_SIZE)]
+    return entry[1] if entry is not None and entry[0] == lowered else 'IDENTIFIER'
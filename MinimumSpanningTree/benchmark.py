@@ -0,0 +1,175 @@
+""" Benchmark repetível dos algoritmos de AGPM
+
+Cada cenário gera o grafo uma única vez, com semente fixa, e todos os algoritmos
+rodam sobre o mesmo grafo (que não é alterado por eles). Para cada algoritmo há
+execuções de aquecimento e depois N repetições cronometradas; o relatório traz
+mínimo, mediana, p95, execuções por segundo e o pico de memória alocada medido
+com `tracemalloc` numa execução separada (o rastreamento deixa o código mais
+lento, então não entra na medição de tempo).
+
+O resultado é um JSON, para comparar execuções entre versões:
+
+    python -m MinimumSpanningTree.benchmark --repeat 5 --output antes.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import timeit
+import tracemalloc
+
+from MinimumSpanningTree.measure_exec_time import available_backends, cached_custom_graph
+
+# (formato, vértices, arestas). Para a grade, vértices = lado * lado.
+SCENARIOS = [
+    ("sparse", 10, 14),
+    ("sparse", 100, 140),
+    ("sparse", 1000, 1400),
+    ("sparse", 10000, 14000),
+    ("sparse", 100000, 140000),
+    ("sparse", 1000000, 1400000),
+    ("dense", 100, 2000),
+    ("dense", 1000, 100000),
+    ("dense", 3000, 1000000),
+    ("chain", 1000, 999),
+    ("chain", 100000, 99999),
+    ("chain", 1000000, 999999),
+    ("grid", 32 * 32, 2 * 32 * 31),
+    ("grid", 316 * 316, 2 * 316 * 315),
+    ("grid", 1000 * 1000, 2 * 1000 * 999),
+]
+
+ALGORITHMS = ("kruskal", "prim", "boruvka")
+
+
+def build_graph(shape: str, num_nodes: int, num_edges: int, seed: int, cache_dir=None):
+    if shape in ("sparse", "dense"):
+        return cached_custom_graph(num_nodes, num_edges, seed, cache_dir)
+    # Caminho e grade usam o gerador NumPy.
+    from MinimumSpanningTree import generators
+    if shape == "chain":
+        return generators.chain(num_nodes, seed)
+    if shape == "grid":
+        side = int(round(num_nodes ** 0.5))
+        return generators.grid(side, side, seed)
+    raise ValueError(f"Formato de grafo desconhecido: {shape!r}")
+
+
+def run_algorithm(graph, algorithm: str, backend: str):
+    if algorithm == "kruskal":
+        return graph.kruskal(backend=backend)
+    if algorithm == "prim":
+        return graph.prim(backend=backend)
+    if algorithm == "boruvka":
+        return graph.boruvka(workers=1)
+    raise ValueError(f"Algoritmo desconhecido: {algorithm!r}")
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """ Percentil pelo método do posto mais próximo. """
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(function, repeat: int = 5, warmup: int = 1) -> dict:
+    """ Estatísticas de tempo e memória de `function()`. """
+    for _ in range(warmup):
+        function()
+
+    times = []
+    for _ in range(repeat):
+        start_time = timeit.default_timer()
+        function()
+        times.append(timeit.default_timer() - start_time)
+    times.sort()
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(times)
+    return {
+        "repeat": repeat,
+        "min": times[0],
+        "median": median,
+        "p95": percentile(times, 0.95),
+        "ops_per_sec": 1 / median if median else None,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run_benchmark(scenarios=SCENARIOS, algorithms=ALGORITHMS, repeat: int = 5, warmup: int = 1,
+                  seed: int = 0, max_edges=None, cache_dir=None, log=sys.stderr) -> dict:
+    results = []
+    backends = available_backends()
+
+    for shape, num_nodes, num_edges in scenarios:
+        if max_edges is not None and num_edges > max_edges:
+            continue
+        print(f"{shape}: {num_nodes} vertices, {num_edges} arestas", file=log)
+        graph = build_graph(shape, num_nodes, num_edges, seed, cache_dir)
+
+        for algorithm in algorithms:
+            for backend in (backends if algorithm != "boruvka" else ["python"]):
+                total_weight = run_algorithm(graph, algorithm, backend).total_weight
+                stats = measure(lambda: run_algorithm(graph, algorithm, backend), repeat, warmup)
+                print(f"  {algorithm:<8} {backend:<7} mediana {stats['median']:.6f}s "
+                      f"p95 {stats['p95']:.6f}s pico {stats['peak_memory_bytes'] / 1e6:.1f} MB", file=log)
+                results.append({
+                    "shape": shape,
+                    "nodes": num_nodes,
+                    "edges": len(graph.edges_list),
+                    "algorithm": algorithm,
+                    "backend": backend,
+                    "total_weight": total_weight,
+                    **stats,
+                })
+
+    return {
+        "metadata": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "warmup": warmup,
+            "backends": backends,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark repetível dos algoritmos de AGPM")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-edges", type=int, default=200000,
+                        help="ignora cenários maiores (0 para rodar todos)")
+    parser.add_argument("--shapes", nargs="+", choices=["sparse", "dense", "chain", "grid"])
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--cache-dir", metavar="DIRETORIO",
+                        help="guarda os grafos gerados em formato binário e os reutiliza")
+    parser.add_argument("--output", metavar="ARQUIVO", help="arquivo JSON de saída (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    scenarios = [scenario for scenario in SCENARIOS if not args.shapes or scenario[0] in args.shapes]
+    report = run_benchmark(scenarios, args.algorithms, args.repeat, args.warmup, args.seed,
+                           args.max_edges or None, args.cache_dir)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+""" Formato binário de grafo com leitura por mmap
+
+Salva um Graph num arquivo com cabeçalho fixo seguido de vetores binários:
+
+    cabeçalho   magic "MSTG", versão, V, E, flags             (32 bytes)
+    offsets     V+1 inteiros de 64 bits  (CSR)
+    neighbors   2E inteiros de 32 bits   (CSR)
+    csr_weights 2E floats de 64 bits     (CSR)
+    src, dst    E inteiros de 32 bits cada (lista de arestas)
+    weight      E floats de 64 bits
+    labels      tamanho (64 bits) + rótulos em UTF-8 separados por '\n'  (opcional)
+
+Cada seção começa num múltiplo de 8 bytes. A leitura usa `mmap`: os vetores são
+`memoryview`s sobre as páginas do arquivo, então abrir o grafo não copia nem
+converte nada, e processos diferentes que abrem o mesmo arquivo compartilham as
+páginas. Kruskal usa a lista de arestas e Prim usa a CSR, ambos direto no mapa.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from MinimumSpanningTree.csr import CSRAdjacency, build_csr
+from MinimumSpanningTree.edge_store import EdgeArrays
+from MinimumSpanningTree.graph import Graph
+
+MAGIC = b'MSTG'
+VERSION = 1
+HEADER = struct.Struct('<4sIqqI4x')
+
+FLAG_LABELS = 1
+FLAG_BIG_ENDIAN = 2
+
+
+def _compact_edges(edges) -> EdgeArrays:
+    if isinstance(edges, EdgeArrays) and edges.weight.typecode == 'd' and edges.src.typecode == 'i':
+        return edges
+    compact = EdgeArrays()
+    if len(edges):
+        start, end, weight = zip(*edges)
+        compact.extend(start, end, [float(value) for value in weight])
+    return compact
+
+
+def _write_section(file, data: bytes) -> None:
+    file.write(data)
+    padding = -len(data) % 8
+    if padding:
+        file.write(bytes(padding))
+
+
+def save_graph(graph: Graph, path) -> None:
+    """ Salva o grafo (arestas, CSR e rótulos) no formato binário. """
+    edges = _compact_edges(graph.edges_list)
+    csr = build_csr(graph.vertex_quantity, edges)
+    has_labels = any(graph.vertex_data)
+
+    flags = FLAG_LABELS if has_labels else 0
+    if sys.byteorder == 'big':
+        flags |= FLAG_BIG_ENDIAN
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, graph.vertex_quantity, len(edges), flags))
+        _write_section(file, memoryview(csr.offsets).cast('B'))
+        _write_section(file, memoryview(csr.targets).cast('B'))
+        _write_section(file, memoryview(csr.weights).cast('B'))
+        _write_section(file, memoryview(edges.src).cast('B'))
+        _write_section(file, memoryview(edges.dst).cast('B'))
+        _write_section(file, memoryview(edges.weight).cast('B'))
+        if has_labels:
+            labels = '\n'.join(graph.vertex_data).encode()
+            file.write(struct.pack('<q', len(labels)))
+            _write_section(file, labels)
+
+
+def load_graph(path) -> Graph:
+    """
+    Abre um grafo salvo por `save_graph` sem copiar os vetores.
+
+    O grafo retornado é somente leitura: suas arestas e a CSR apontam para as
+    páginas mapeadas do arquivo.
+    """
+    with open(path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buffer = memoryview(mapping)
+    magic, version, vertex_quantity, edge_quantity, flags = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{path} não é um grafo no formato binário")
+    if version != VERSION:
+        raise ValueError(f"Versão {version} do formato binário não suportada")
+    if bool(flags & FLAG_BIG_ENDIAN) != (sys.byteorder == 'big'):
+        raise ValueError("Arquivo gravado com outra ordem de bytes")
+
+    position = HEADER.size
+
+    def section(count: int, typecode: str):
+        nonlocal position
+        size = count * array(typecode).itemsize
+        view = buffer[position:position + size].cast(typecode)
+        position += size + (-size % 8)
+        return view
+
+    offsets = section(vertex_quantity + 1, 'q')
+    targets = section(2 * edge_quantity, 'i')
+    csr_weights = section(2 * edge_quantity, 'd')
+    src = section(edge_quantity, 'i')
+    dst = section(edge_quantity, 'i')
+    weight = section(edge_quantity, 'd')
+
+    graph = Graph.from_edge_arrays(vertex_quantity, EdgeArrays.from_buffers(src, dst, weight))
+    graph.set_adjacency(CSRAdjacency(offsets, targets, csr_weights))
+
+    if flags & FLAG_LABELS:
+        (length,) = struct.unpack_from('<q', buffer, position)
+        position += 8
+        graph.vertex_data = bytes(buffer[position:position + length]).decode().split('\n')
+    return graph
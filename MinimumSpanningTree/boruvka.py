@@ -0,0 +1,170 @@
+""" Algoritmo de Borůvka paralelo
+
+A cada rodada, cada componente escolhe a aresta mais barata que sai dele, e todas
+essas arestas entram na árvore de uma vez. O número de componentes cai pelo menos
+pela metade por rodada, então há no máximo log2(V) rodadas.
+
+A busca da aresta mais barata por componente é a parte cara (percorre todas as
+arestas) e é independente entre as arestas, então é dividida em fatias que rodam
+em um `ProcessPoolExecutor`. Os vetores de arestas e o rótulo de componente de
+cada vértice ficam em `multiprocessing.shared_memory`: os processos leem os mesmos
+dados sem cópia, e a cada rodada só os rótulos são reescritos pelo processo
+principal.
+
+Empates de peso são desfeitos pelo índice da aresta, o que garante que as arestas
+escolhidas numa rodada nunca formam ciclo.
+"""
+
+import os
+import timeit
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from MinimumSpanningTree.edge_store import EdgeArrays
+from MinimumSpanningTree.union_find import DisjointSet
+
+# Abaixo desta quantidade de arestas o custo de criar os processos não compensa.
+PARALLEL_MIN_EDGES = 200_000
+
+# Vetores compartilhados vistos por cada processo do pool (preenchido por _attach).
+_shared = {}
+
+
+def cheapest_edges(src, dst, weight, labels, start: int, end: int) -> dict:
+    """
+    Aresta mais barata que sai de cada componente, olhando só as arestas
+    start..end-1. Retorna {componente: (peso, índice_da_aresta)}.
+    """
+    best = {}
+    get = best.get
+    for index in range(start, end):
+        start_component = labels[src[index]]
+        end_component = labels[dst[index]]
+        if start_component == end_component:
+            continue
+        candidate = (weight[index], index)
+        current = get(start_component)
+        if current is None or candidate < current:
+            best[start_component] = candidate
+        current = get(end_component)
+        if current is None or candidate < current:
+            best[end_component] = candidate
+    return best
+
+
+def _attach(names: dict) -> None:
+    """ Inicializador do pool: abre os blocos de memória compartilhada uma vez por processo. """
+    for key, (name, typecode, size) in names.items():
+        block = shared_memory.SharedMemory(name=name)
+        _shared[key] = (block, block.buf[:size].cast(typecode))
+
+
+def _cheapest_edges_shared(start: int, end: int) -> dict:
+    return cheapest_edges(_shared['src'][1], _shared['dst'][1], _shared['weight'][1],
+                          _shared['labels'][1], start, end)
+
+
+def _share(values, blocks: list):
+    """
+    Copia um vetor para um bloco novo de memória compartilhada. O bloco tem pelo
+    menos 1 byte (e o sistema pode arredondar o tamanho), então a visão cobre só
+    os `data.nbytes` primeiros.
+    """
+    view = memoryview(values)
+    data = view.cast('B')
+    block = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+    blocks.append(block)
+    block.buf[:data.nbytes] = data
+    return block, block.buf[:data.nbytes].cast(view.format)
+
+
+def _as_edge_arrays(edges) -> EdgeArrays:
+    if isinstance(edges, EdgeArrays):
+        return edges
+    compact = EdgeArrays()
+    if edges:
+        start, end, weight = zip(*edges)
+        compact.extend(start, end, weight)
+    return compact
+
+
+def boruvka(vertex_quantity: int, edges, workers=None):
+    """
+    Floresta geradora mínima por Borůvka.
+
+    `workers` é o número de processos; com 1 (ou em grafos pequenos, quando não é
+    informado) tudo roda no processo atual.
+
+    Retorna (arestas, número de componentes, tempo de cada rodada em segundos).
+    """
+    edges = _as_edge_arrays(edges)
+    edge_quantity = len(edges)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if edge_quantity >= PARALLEL_MIN_EDGES else 1
+
+    blocks = []
+    views = []
+    executor = None
+    try:
+        # Sem arestas não há o que dividir entre processos.
+        if workers > 1 and edge_quantity:
+            names = {}
+            shared = {}
+            for key, values in (('src', edges.src), ('dst', edges.dst), ('weight', edges.weight),
+                                ('labels', array('i', range(vertex_quantity)))):
+                block, view = _share(values, blocks)
+                views.append(view)
+                names[key] = (block.name, view.format, view.nbytes)
+                shared[key] = view
+            src, dst, weight, labels = shared['src'], shared['dst'], shared['weight'], shared['labels']
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(names,))
+            shard_size = -(-edge_quantity // (workers * 4)) or 1
+            shards = [(start, min(start + shard_size, edge_quantity))
+                      for start in range(0, edge_quantity, shard_size)]
+        else:
+            src, dst, weight = edges.src, edges.dst, edges.weight
+            labels = array('i', range(vertex_quantity))
+
+        mst = []
+        components = DisjointSet(vertex_quantity)
+        round_times = []
+
+        while components.component_count > 1:
+            round_start = timeit.default_timer()
+
+            if executor is not None:
+                best = {}
+                for partial in executor.map(_cheapest_edges_shared, *zip(*shards)):
+                    for component, candidate in partial.items():
+                        current = best.get(component)
+                        if current is None or candidate < current:
+                            best[component] = candidate
+            else:
+                best = cheapest_edges(src, dst, weight, labels, 0, edge_quantity)
+
+            if not best:
+                # Nenhuma aresta liga componentes diferentes: o grafo é desconexo.
+                break
+
+            for _, index in best.values():
+                start_vertex, end_vertex = src[index], dst[index]
+                # A mesma aresta pode ter sido escolhida pelos dois componentes.
+                if components.union(start_vertex, end_vertex):
+                    mst.append((start_vertex, end_vertex, weight[index]))
+
+            find = components.find
+            for vertex in range(vertex_quantity):
+                labels[vertex] = find(vertex)
+
+            round_times.append(timeit.default_timer() - round_start)
+
+        return mst, components.component_count, round_times
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        for view in views:
+            view.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
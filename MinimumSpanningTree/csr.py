@@ -0,0 +1,86 @@
+""" Lista de adjacência compacta (CSR)
+
+Representação "Compressed Sparse Row" de um grafo não direcionado: os vizinhos de
+todos os vértices ficam num único vetor `targets`, e os vizinhos do vértice `v`
+estão no intervalo `offsets[v]:offsets[v + 1]`. O peso de cada entrada fica na
+mesma posição em `weights`.
+
+Cada aresta (u, v, peso) aparece duas vezes, uma na linha de `u` e outra na de `v`.
+"""
+
+from array import array
+
+from MinimumSpanningTree.edge_store import EdgeArrays
+
+
+class CSRAdjacency:
+    """
+    Lista de adjacência em vetores contíguos.
+
+    Atributos:
+      offsets (array): Início da linha de cada vértice (tamanho V+1).
+      targets (array): Vizinhos, linha a linha.
+      weights: Peso de cada entrada de `targets`.
+    """
+
+    __slots__ = ('offsets', 'targets', 'weights')
+
+    def __init__(self, offsets, targets, weights) -> None:
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @property
+    def vertex_quantity(self) -> int:
+        return len(self.offsets) - 1
+
+    def degree(self, vertex: int) -> int:
+        return self.offsets[vertex + 1] - self.offsets[vertex]
+
+    def neighbors(self, vertex: int):
+        """ Pares (vizinho, peso) do vértice. """
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+
+def build_csr(vertex_quantity: int, edges) -> CSRAdjacency:
+    """
+    Constrói a CSR a partir de uma sequência de arestas (lista de tuplas ou EdgeArrays).
+
+    Usa ordenação por contagem: conta o grau de cada vértice, acumula os graus em
+    `offsets` e depois distribui as arestas nas posições livres de cada linha.
+    """
+    if isinstance(edges, EdgeArrays):
+        src, dst, weight = edges.src, edges.dst, edges.weight
+        weights = array(weight.typecode, bytes(2 * len(weight) * weight.itemsize))
+    else:
+        src = [edge[0] for edge in edges]
+        dst = [edge[1] for edge in edges]
+        weight = [edge[2] for edge in edges]
+        # Lista comum preserva o tipo dos pesos (int continua int).
+        weights = [0] * (2 * len(weight))
+
+    degree = array('q', bytes(8 * (vertex_quantity + 1)))
+    for vertex in src:
+        degree[vertex + 1] += 1
+    for vertex in dst:
+        degree[vertex + 1] += 1
+
+    offsets = degree
+    for vertex in range(vertex_quantity):
+        offsets[vertex + 1] += offsets[vertex]
+
+    targets = array('i', bytes(4 * offsets[vertex_quantity]))
+    position = array('q', offsets)
+    for start, end, edge_weight in zip(src, dst, weight):
+        index = position[start]
+        targets[index] = end
+        weights[index] = edge_weight
+        position[start] = index + 1
+
+        index = position[end]
+        targets[index] = start
+        weights[index] = edge_weight
+        position[end] = index + 1
+
+    return CSRAdjacency(offsets, targets, weights)
@@ -0,0 +1,166 @@
+""" Manutenção incremental da AGPM
+
+Guarda a árvore (floresta) geradora mínima atual e a atualiza a cada inserção ou
+remoção de aresta, sem reordenar todas as arestas como o Kruskal faria.
+
+  - Inserção de (u, v, peso): se u e v estão em árvores diferentes, a aresta liga
+    as duas. Senão, procura a aresta de maior peso no caminho u → v da árvore; se
+    a nova aresta é mais barata, ela entra no lugar (propriedade do ciclo).
+  - Remoção de uma aresta da árvore: a árvore se divide em duas partes e a aresta
+    de reposição é a mais barata que cruza o corte (propriedade do corte). As
+    arestas fora da árvore ficam ordenadas por peso, então a busca para na
+    primeira aresta que cruza.
+
+Cada atualização custa O(V) para percorrer a árvore, mais a busca pela aresta de
+reposição na remoção, em vez dos O(E log E) de recalcular tudo.
+"""
+
+from bisect import bisect_left, insort
+from collections import deque
+
+from MinimumSpanningTree.result import MSTResult
+from MinimumSpanningTree.union_find import DisjointSet
+
+
+def _key(start_vertex: int, end_vertex: int, weight):
+    if start_vertex > end_vertex:
+        start_vertex, end_vertex = end_vertex, start_vertex
+    return weight, start_vertex, end_vertex
+
+
+class DynamicMST:
+    """
+    Floresta geradora mínima mantida sob inserções e remoções de arestas.
+
+    Atributos:
+      tree (list[dict]): Adjacência da árvore; tree[u][v] é o peso da aresta u-v.
+      non_tree (list): Arestas fora da árvore como (peso, u, v) com u <= v,
+        ordenadas por peso.
+      total_weight: Peso total da floresta.
+      component_count (int): Número de componentes da floresta.
+    """
+
+    def __init__(self, vertex_quantity: int) -> None:
+        self.vertex_quantity = vertex_quantity
+        self.tree = [{} for _ in range(vertex_quantity)]
+        self.non_tree = []
+        self.total_weight = 0
+        self.component_count = vertex_quantity
+
+    @classmethod
+    def from_sorted_edges(cls, vertex_quantity: int, edges) -> 'DynamicMST':
+        """ Inicializa com Kruskal a partir de arestas já em ordem crescente de peso. """
+        dynamic = cls(vertex_quantity)
+        components = DisjointSet(vertex_quantity)
+        for start_vertex, end_vertex, weight in edges:
+            if components.union(start_vertex, end_vertex):
+                dynamic._link(start_vertex, end_vertex, weight)
+            else:
+                dynamic.non_tree.append(_key(start_vertex, end_vertex, weight))
+        dynamic.non_tree.sort()
+        return dynamic
+
+    def _link(self, start_vertex: int, end_vertex: int, weight) -> None:
+        self.tree[start_vertex][end_vertex] = weight
+        self.tree[end_vertex][start_vertex] = weight
+        self.total_weight += weight
+        self.component_count -= 1
+
+    def _cut(self, start_vertex: int, end_vertex: int):
+        weight = self.tree[start_vertex].pop(end_vertex)
+        del self.tree[end_vertex][start_vertex]
+        self.total_weight -= weight
+        self.component_count += 1
+        return weight
+
+    def _tree_path(self, start_vertex: int, end_vertex: int):
+        """ Pai de cada vértice visitado numa busca em largura de start até end, ou None. """
+        parents = {start_vertex: start_vertex}
+        queue = deque((start_vertex,))
+        tree = self.tree
+        while queue:
+            vertex = queue.popleft()
+            for neighbor in tree[vertex]:
+                if neighbor not in parents:
+                    parents[neighbor] = vertex
+                    if neighbor == end_vertex:
+                        return parents
+                    queue.append(neighbor)
+        return None
+
+    def _component(self, vertex: int) -> set:
+        seen = {vertex}
+        stack = [vertex]
+        tree = self.tree
+        while stack:
+            for neighbor in tree[stack.pop()]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return seen
+
+    def insert(self, start_vertex: int, end_vertex: int, weight) -> bool:
+        """ Insere uma aresta. Retorna True se a árvore mudou. """
+        if start_vertex == end_vertex:
+            insort(self.non_tree, _key(start_vertex, end_vertex, weight))
+            return False
+
+        parents = self._tree_path(start_vertex, end_vertex)
+        if parents is None:
+            self._link(start_vertex, end_vertex, weight)
+            return True
+
+        # Aresta mais pesada no caminho end -> start da árvore.
+        heaviest = None
+        vertex = end_vertex
+        while vertex != start_vertex:
+            parent = parents[vertex]
+            path_weight = self.tree[vertex][parent]
+            if heaviest is None or path_weight > heaviest[0]:
+                heaviest = (path_weight, parent, vertex)
+            vertex = parent
+
+        if weight < heaviest[0]:
+            _, parent, vertex = heaviest
+            self._cut(parent, vertex)
+            insort(self.non_tree, _key(parent, vertex, heaviest[0]))
+            self._link(start_vertex, end_vertex, weight)
+            return True
+
+        insort(self.non_tree, _key(start_vertex, end_vertex, weight))
+        return False
+
+    def delete(self, start_vertex: int, end_vertex: int, weight) -> bool:
+        """
+        Remove uma aresta. Retorna True se a árvore mudou.
+
+        Lança KeyError se a aresta não existe.
+        """
+        key = _key(start_vertex, end_vertex, weight)
+        index = bisect_left(self.non_tree, key)
+        if index < len(self.non_tree) and self.non_tree[index] == key:
+            # Uma cópia fora da árvore pode sair sem alterar a árvore.
+            del self.non_tree[index]
+            return False
+
+        if self.tree[start_vertex].get(end_vertex) != weight:
+            raise KeyError((start_vertex, end_vertex, weight))
+
+        self._cut(start_vertex, end_vertex)
+        side = self._component(start_vertex)
+        for index, (candidate_weight, candidate_start, candidate_end) in enumerate(self.non_tree):
+            if (candidate_start in side) != (candidate_end in side):
+                del self.non_tree[index]
+                self._link(candidate_start, candidate_end, candidate_weight)
+                break
+        return True
+
+    def edges(self):
+        """ Arestas da floresta, cada uma uma vez. """
+        for start_vertex, neighbors in enumerate(self.tree):
+            for end_vertex, weight in neighbors.items():
+                if start_vertex < end_vertex:
+                    yield start_vertex, end_vertex, weight
+
+    def result(self) -> MSTResult:
+        return MSTResult.from_edges(list(self.edges()), self.component_count, "Dinâmica")
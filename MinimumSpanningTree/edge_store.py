@@ -0,0 +1,110 @@
+""" Armazenamento compacto de arestas
+
+Uma lista de tuplas (vértice_inicio, vértice_fim, peso) custa mais de 100 bytes por
+aresta em Python. Aqui as arestas são guardadas em três vetores tipados paralelos
+(array('i') para os vértices e array('d') para os pesos), o que reduz o custo para
+16 bytes por aresta.
+
+A classe se comporta como uma sequência de tuplas, então o código que percorre
+`Graph.edges_list` continua funcionando sem alterações.
+"""
+
+from array import array
+
+
+def extend_array(target, values) -> None:
+    """
+    Anexa `values` ao vetor `target`.
+
+    Quando `values` expõe um buffer com o mesmo tipo (array ou vetor NumPy com dtype
+    compatível), os bytes são copiados de uma vez, sem passar por objetos Python.
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        target.extend(values)
+        return
+
+    if view.format == target.typecode and view.itemsize == target.itemsize and view.c_contiguous:
+        target.frombytes(view.cast('B'))
+    else:
+        target.extend(view.tolist())
+
+
+def value_range(values):
+    """ Retorna (mínimo, máximo) de um vetor, usando os métodos do NumPy quando existirem. """
+    if hasattr(values, 'min'):
+        return int(values.min()), int(values.max())
+    return min(values), max(values)
+
+
+class EdgeArrays:
+    """
+    Sequência de arestas guardada em três vetores paralelos.
+
+    Atributos:
+      src (array): Vértice de início de cada aresta.
+      dst (array): Vértice de fim de cada aresta.
+      weight (array): Peso de cada aresta.
+    """
+
+    __slots__ = ('src', 'dst', 'weight')
+
+    def __init__(self, vertex_typecode: str = 'i', weight_typecode: str = 'd') -> None:
+        self.src = array(vertex_typecode)
+        self.dst = array(vertex_typecode)
+        self.weight = array(weight_typecode)
+
+    @classmethod
+    def from_buffers(cls, src, dst, weight) -> 'EdgeArrays':
+        """
+        Usa buffers já existentes (ex.: memoryviews de um arquivo mapeado) sem
+        copiá-los. Se os buffers não forem `array`, as arestas são somente leitura.
+        """
+        edges = cls.__new__(cls)
+        edges.src = src
+        edges.dst = dst
+        edges.weight = weight
+        return edges
+
+    @property
+    def readonly(self) -> bool:
+        return not isinstance(self.src, array)
+
+    def __len__(self) -> int:
+        return len(self.weight)
+
+    def __getitem__(self, index):
+        return self.src[index], self.dst[index], self.weight[index]
+
+    def __delitem__(self, index) -> None:
+        if self.readonly:
+            raise TypeError("Arestas em buffers externos são somente leitura")
+        del self.src[index]
+        del self.dst[index]
+        del self.weight[index]
+
+    def __iter__(self):
+        return zip(self.src, self.dst, self.weight)
+
+    def append(self, edge) -> None:
+        if self.readonly:
+            raise TypeError("Arestas em buffers externos são somente leitura")
+        start_vertex, end_vertex, weight = edge
+        self.src.append(start_vertex)
+        self.dst.append(end_vertex)
+        self.weight.append(weight)
+
+    def extend(self, src, dst, weight) -> None:
+        """ Anexa vetores inteiros de arestas. """
+        if self.readonly:
+            raise TypeError("Arestas em buffers externos são somente leitura")
+        if not len(src) == len(dst) == len(weight):
+            raise ValueError("src, dst e weight devem ter o mesmo tamanho")
+        extend_array(self.src, src)
+        extend_array(self.dst, dst)
+        extend_array(self.weight, weight)
+
+    def nbytes(self) -> int:
+        """ Memória ocupada pelos vetores, em bytes. """
+        return sum(len(values) * values.itemsize for values in (self.src, self.dst, self.weight))
@@ -0,0 +1,200 @@
+""" Geradores de grafos aleatórios com NumPy
+
+Todas as arestas são sorteadas em lote com `numpy.random.Generator` e copiadas de
+uma vez para os vetores de um Graph compacto, sem laço em Python por aresta (a
+exceção é Barabási–Albert, em que cada vértice depende dos anteriores). Um grafo
+com 10 milhões de arestas é gerado em poucos segundos.
+
+Os pesos são inteiros sorteados em `weight_range` (inclusive), guardados como
+float. Com a mesma semente, o mesmo grafo é gerado.
+
+  - gnm: Erdős–Rényi G(n, m), m arestas uniformes.
+  - connected: árvore geradora aleatória + arestas extras (sempre conexo).
+  - grid: grade rows × columns.
+  - chain: caminho 0-1-...-(n-1).
+  - power_law: grau com cauda pesada (modelo de Chung–Lu).
+  - barabasi_albert: ligação preferencial, k arestas por vértice novo.
+  - complete: todas as n(n-1)/2 arestas.
+"""
+
+import numpy as np
+
+from MinimumSpanningTree.edge_store import EdgeArrays
+from MinimumSpanningTree.graph import Graph
+
+WEIGHT_RANGE = (1, 100)
+
+
+def _graph(num_nodes: int, src, dst, rng, weight_range, labels: bool) -> Graph:
+    low, high = weight_range
+    weight = rng.integers(low, high + 1, len(src)).astype(np.float64)
+    edges = EdgeArrays()
+    edges.extend(np.ascontiguousarray(src, dtype=np.int32),
+                 np.ascontiguousarray(dst, dtype=np.int32), weight)
+    graph = Graph.from_edge_arrays(num_nodes, edges)
+    if labels:
+        graph.vertex_data = [str(vertex) for vertex in range(num_nodes)]
+    return graph
+
+
+def _pair_keys(src, dst, num_nodes: int):
+    """ Chave única de cada aresta não direcionada: min * n + max. """
+    low = np.minimum(src, dst).astype(np.int64)
+    high = np.maximum(src, dst).astype(np.int64)
+    return low * num_nodes + high
+
+
+def _unique_edges(src, dst, num_nodes: int, existing=None):
+    """ Remove arestas repetidas (mantendo a primeira) e as que já estão em `existing`. """
+    keys = _pair_keys(src, dst, num_nodes)
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    src, dst, keys = src[first], dst[first], keys[first]
+    if existing is not None and len(existing):
+        keep = ~np.isin(keys, existing)
+        src, dst, keys = src[keep], dst[keep], keys[keep]
+    return src, dst, keys
+
+
+def _random_pairs(rng, num_nodes: int, count: int):
+    """ Pares sem laços: o destino é sorteado entre os outros n-1 vértices. """
+    src = rng.integers(0, num_nodes, count, dtype=np.int64)
+    dst = (src + rng.integers(1, num_nodes, count, dtype=np.int64)) % num_nodes
+    return src, dst
+
+
+def _sample_edges(rng, num_nodes: int, num_edges: int, dedup: bool, existing=None):
+    if num_edges == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    if num_nodes < 2:
+        raise ValueError("São necessários pelo menos 2 vértices para sortear arestas")
+    if not dedup:
+        return _random_pairs(rng, num_nodes, num_edges)
+
+    available = num_nodes * (num_nodes - 1) // 2 - (len(existing) if existing is not None else 0)
+    if num_edges > available:
+        raise ValueError(f"Não há {num_edges} arestas distintas disponíveis ({available})")
+
+    src = dst = keys = np.zeros(0, dtype=np.int64)
+    while len(src) < num_edges:
+        missing = num_edges - len(src)
+        new_src, new_dst = _random_pairs(rng, num_nodes, int(missing * 1.1) + 16)
+        src, dst, keys = _unique_edges(np.concatenate((src, new_src)),
+                                       np.concatenate((dst, new_dst)), num_nodes, existing)
+    return src[:num_edges], dst[:num_edges]
+
+
+def gnm(num_nodes: int, num_edges: int, seed=None, dedup: bool = True,
+        weight_range=WEIGHT_RANGE, labels: bool = False) -> Graph:
+    """ Grafo de Erdős–Rényi G(n, m), sem laços. Com `dedup=False` pode ter arestas paralelas. """
+    rng = np.random.default_rng(seed)
+    src, dst = _sample_edges(rng, num_nodes, num_edges, dedup)
+    return _graph(num_nodes, src, dst, rng, weight_range, labels)
+
+
+def connected(num_nodes: int, num_edges: int, seed=None, dedup: bool = True,
+              weight_range=WEIGHT_RANGE, labels: bool = False) -> Graph:
+    """
+    Grafo conexo: uma árvore geradora aleatória (cada vértice, numa ordem aleatória,
+    se liga a um vértice anterior) mais `num_edges - (n - 1)` arestas uniformes.
+    """
+    if num_edges < num_nodes - 1:
+        raise ValueError(f"Um grafo conexo com {num_nodes} vértices precisa de {num_nodes - 1} arestas")
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(num_nodes)
+    parents = (rng.random(num_nodes - 1) * np.arange(1, num_nodes)).astype(np.int64)
+    tree_src, tree_dst = order[1:], order[parents]
+
+    existing = np.unique(_pair_keys(tree_src, tree_dst, num_nodes)) if dedup else None
+    extra_src, extra_dst = _sample_edges(rng, num_nodes, num_edges - (num_nodes - 1), dedup, existing)
+    return _graph(num_nodes, np.concatenate((tree_src, extra_src)),
+                  np.concatenate((tree_dst, extra_dst)), rng, weight_range, labels)
+
+
+def grid(rows: int, columns: int, seed=None, weight_range=WEIGHT_RANGE, labels: bool = False) -> Graph:
+    """ Grade rows × columns: cada vértice se liga ao da direita e ao de baixo. """
+    rng = np.random.default_rng(seed)
+    vertices = np.arange(rows * columns, dtype=np.int64).reshape(rows, columns)
+    src = np.concatenate((vertices[:, :-1].ravel(), vertices[:-1, :].ravel()))
+    dst = np.concatenate((vertices[:, 1:].ravel(), vertices[1:, :].ravel()))
+    return _graph(rows * columns, src, dst, rng, weight_range, labels)
+
+
+def chain(num_nodes: int, seed=None, weight_range=WEIGHT_RANGE, labels: bool = False) -> Graph:
+    """ Caminho 0-1-2-...-(n-1). """
+    rng = np.random.default_rng(seed)
+    src = np.arange(max(num_nodes - 1, 0), dtype=np.int64)
+    return _graph(num_nodes, src, src + 1, rng, weight_range, labels)
+
+
+def power_law(num_nodes: int, num_edges: int, exponent: float = 2.5, seed=None, dedup: bool = True,
+              weight_range=WEIGHT_RANGE, labels: bool = False) -> Graph:
+    """
+    Grafo com distribuição de graus em lei de potência (modelo de Chung–Lu): as
+    pontas de cada aresta são sorteadas com probabilidade proporcional a
+    (i + 1)^(-1 / (exponent - 1)). Com `dedup`, arestas repetidas são descartadas,
+    então o grafo pode ter um pouco menos que `num_edges` arestas.
+    """
+    if exponent <= 1:
+        raise ValueError("O expoente da lei de potência deve ser maior que 1")
+    rng = np.random.default_rng(seed)
+    weights = np.arange(1, num_nodes + 1, dtype=np.float64) ** (-1 / (exponent - 1))
+    probabilities = weights / weights.sum()
+
+    src = rng.choice(num_nodes, num_edges, p=probabilities)
+    dst = rng.choice(num_nodes, num_edges, p=probabilities)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    if dedup:
+        src, dst, _ = _unique_edges(src, dst, num_nodes)
+    return _graph(num_nodes, src, dst, rng, weight_range, labels)
+
+
+def barabasi_albert(num_nodes: int, edges_per_node: int, seed=None, weight_range=WEIGHT_RANGE,
+                    labels: bool = False) -> Graph:
+    """
+    Modelo de Barabási–Albert (algoritmo de Batagelj–Brandes): cada vértice novo se
+    liga a `edges_per_node` vértices escolhidos com probabilidade proporcional ao
+    grau. O laço é por vértice; as escolhas de cada vértice são sorteadas em lote.
+    """
+    if not 1 <= edges_per_node < num_nodes:
+        raise ValueError("edges_per_node deve estar entre 1 e num_nodes - 1")
+    rng = np.random.default_rng(seed)
+    first = edges_per_node
+    num_edges = (num_nodes - first) * edges_per_node
+    src = np.empty(num_edges, dtype=np.int64)
+    dst = np.empty(num_edges, dtype=np.int64)
+
+    # Pontas de todas as arestas já criadas: sortear uma posição daqui equivale a
+    # sortear um vértice com probabilidade proporcional ao grau.
+    endpoints = np.empty(2 * num_edges, dtype=np.int64)
+    src[:first] = first
+    dst[:first] = np.arange(first)
+    endpoints[0:2 * first:2] = first
+    endpoints[1:2 * first:2] = np.arange(first)
+    filled = 2 * first
+
+    position = first
+    for vertex in range(first + 1, num_nodes):
+        targets = np.unique(endpoints[rng.integers(0, filled, edges_per_node)])
+        # Sorteios repetidos são refeitos até haver `edges_per_node` vizinhos
+        # distintos (já há pelo menos edges_per_node + 1 vértices nas pontas).
+        while len(targets) < edges_per_node:
+            extra = endpoints[rng.integers(0, filled, edges_per_node - len(targets))]
+            targets = np.union1d(targets, extra)
+        src[position:position + edges_per_node] = vertex
+        dst[position:position + edges_per_node] = targets
+        endpoints[filled:filled + 2 * edges_per_node:2] = vertex
+        endpoints[filled + 1:filled + 2 * edges_per_node:2] = targets
+        filled += 2 * edges_per_node
+        position += edges_per_node
+
+    return _graph(num_nodes, src, dst, rng, weight_range, labels)
+
+
+def complete(num_nodes: int, seed=None, weight_range=WEIGHT_RANGE, labels: bool = False) -> Graph:
+    """ Grafo completo K_n. """
+    rng = np.random.default_rng(seed)
+    src, dst = np.triu_indices(num_nodes, k=1)
+    return _graph(num_nodes, src, dst, rng, weight_range, labels)
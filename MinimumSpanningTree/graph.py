@@ -20,6 +20,15 @@ Funcionamento do Algoritmo:
       2.2. Se não , adcione a aresta como uma aresta da MST.
 """
 
+from MinimumSpanningTree.boruvka import boruvka
+from MinimumSpanningTree.csr import build_csr
+from MinimumSpanningTree.dynamic_mst import DynamicMST
+from MinimumSpanningTree.edge_store import EdgeArrays, value_range
+from MinimumSpanningTree.numpy_backend import kruskal_numpy, prim_numpy
+from MinimumSpanningTree.prim import PRIM_VARIANTS
+from MinimumSpanningTree.result import MSTResult
+from MinimumSpanningTree.union_find import DisjointSet
+
 class Graph():
   """
   Classe que representa a estrutura de dados grafo utilizando a lista de adjacência.
@@ -27,101 +36,165 @@ class Graph():
   Atributos:
     vertex_quantity (int): Número de vértices no grafo.
     edges_list : Lista de arestas na forma (vértice_inico,vértice_fim,peso).
+      Com `compact=True` as arestas ficam em vetores tipados (EdgeArrays).
     vertex_data: (List[str]): Dado associado com cada vértice.
   """
-  def __init__(self,vertex_quantity:int) -> None:
+  def __init__(self,vertex_quantity:int,compact:bool=False) -> None:
     self.vertex_quantity = vertex_quantity
-    self.edges_list: list = []
+    self.edges_list = EdgeArrays() if compact else []
     self.vertex_data: list[str] = [''] * vertex_quantity 
+    self._csr = None
+    self._csr_key = None
+    self._version = 0
+    self._dynamic_mst = None
+
+  @classmethod
+  def from_edge_arrays(cls,vertex_quantity:int,edges:EdgeArrays) -> 'Graph':
+    """ Grafo compacto que usa `edges` como armazenamento, sem copiar os vetores. """
+    graph = cls(vertex_quantity, compact=True)
+    graph.edges_list = edges
+    return graph
 
   def add_edge(self,start_vertex,end_vertex,weight) -> None:
     if 0 <= start_vertex < self.vertex_quantity and 0 <= end_vertex < self.vertex_quantity:
       self.edges_list.append((start_vertex,end_vertex,weight))
+      self._version += 1
+      if self._dynamic_mst is not None:
+        self._dynamic_mst.insert(*self.edges_list[-1])
+
+  def remove_edge(self,start_vertex,end_vertex,weight=None) -> bool:
+    """
+    Remove uma aresta u-v (em qualquer sentido). Sem `weight`, remove a primeira
+    encontrada. Retorna False se a aresta não existe.
+    """
+    for index, (start, end, edge_weight) in enumerate(self.edges_list):
+      if {start, end} == {start_vertex, end_vertex} and (weight is None or edge_weight == weight):
+        del self.edges_list[index]
+        self._version += 1
+        if self._dynamic_mst is not None:
+          self._dynamic_mst.delete(start, end, edge_weight)
+        return True
+    return False
+
+  def add_edges(self,src,dst,weights) -> None:
+    """
+    Adiciona várias arestas de uma vez a partir de vetores paralelos.
+
+    No modo compacto os vetores são copiados diretamente para o armazenamento,
+    sem criar uma tupla por aresta.
+    """
+    if not len(src) == len(dst) == len(weights):
+      raise ValueError("src, dst e weights devem ter o mesmo tamanho")
+    if len(src) == 0:
+      return
+    src_min, src_max = value_range(src)
+    dst_min, dst_max = value_range(dst)
+    if min(src_min,dst_min) < 0 or max(src_max,dst_max) >= self.vertex_quantity:
+      raise ValueError("Aresta com vértice fora do intervalo do grafo")
+
+    first_new = len(self.edges_list)
+    if isinstance(self.edges_list, EdgeArrays):
+      self.edges_list.extend(src,dst,weights)
+    else:
+      self.edges_list.extend(zip(src,dst,weights))
+    self._version += 1
+
+    if self._dynamic_mst is not None:
+      for index in range(first_new, len(self.edges_list)):
+        self._dynamic_mst.insert(*self.edges_list[index])
+
+  def sorted_edges(self):
+    """ Percorre as arestas em ordem crescente de peso, sem alterar o armazenamento. """
+    if isinstance(self.edges_list, EdgeArrays):
+      src, dst, weight = self.edges_list.src, self.edges_list.dst, self.edges_list.weight
+      order = sorted(range(len(weight)), key=weight.__getitem__)
+      return ((src[i], dst[i], weight[i]) for i in order)
+    return iter(sorted(self.edges_list, key=lambda item: item[2]))
   
   def add_vertex_data(self,vertex,data):
     if 0 <= vertex < self.vertex_quantity:
       self.vertex_data[vertex] = data
   
-  def find(self,parent,i):
-    if parent[i] == i:
-      return i
-    return self.find(parent,parent[i])
-  
-  def union(self, parent, rank, x, y):
-    x_root = self.find(parent,x)
-    y_root = self.find(parent,y)
-    
-    if rank[x_root] < rank[y_root]:
-      parent[x_root] = y_root
-    
-    elif rank[x_root] > rank[y_root]:
-      parent[y_root] = x_root
-    
+  def kruskal(self, backend: str = 'python') -> MSTResult:
+    """ Algoritmo de Kruskal. `backend` pode ser 'python' ou 'numpy'. """
+    if backend == 'numpy':
+      mst = kruskal_numpy(self.vertex_quantity, self.edges_list)
+    elif backend == 'python':
+      mst = []
+      components = DisjointSet(self.vertex_quantity)
+      max_edges = self.vertex_quantity - 1
+
+      for start_vertex, end_vertex, weight in self.sorted_edges():
+        if components.union(start_vertex, end_vertex):
+          mst.append((start_vertex,end_vertex,weight))
+          # Uma árvore com V vértices tem V-1 arestas: as demais formariam ciclos.
+          if len(mst) == max_edges:
+            break
     else:
-      parent[y_root] = x_root
-      rank[x_root] += 1
-
-  def kruskal(self):
-    
-    mst = []
-    edge_count = 0
-
-    self.edges_list = sorted(self.edges_list, key=lambda item: item[2])
-
-    parent, rank = [], []
-
-    for vertex in range(self.vertex_quantity):
-      parent.append(vertex)
-      rank.append(0)
-
-    while edge_count < len(self.edges_list):
-      start_vertex, end_vertex, weight = self.edges_list[edge_count]
-      edge_count += 1
-
-      x = self.find(parent, start_vertex)
-      y = self.find(parent, end_vertex)
-
-      if x != y:
-        mst.append((start_vertex,end_vertex,weight))
-        self.union(parent, rank, x, y)
-
-    total_weight = sum(weight for start_vertex,end_vertex, weight in mst)
-    print("Arrestas | Pesos")
-    for start_vertex, end_vertex, weight in mst:
-      print(f"{self.vertex_data[start_vertex]} - {self.vertex_data[end_vertex]} | {weight}")
-
-    print(f"Somatório de pessos da AGPM de Kruskal: {total_weight}")
-
-  def prim(self) -> None:
-    # Criação da lista de adjacência para o algoritmo de Prim
-    adj_list = [[] for _ in range(self.vertex_quantity)]
-    for start, end, weight in self.edges_list:
-        adj_list[start].append((end, weight))
-        adj_list[end].append((start, weight))
-
-    in_mst = [False] * self.vertex_quantity
-    key_values = [float('inf')] * self.vertex_quantity
-    parents = [-1] * self.vertex_quantity
-
-    key_values[0] = 0  # Começa com o primeiro vértice
-
-    print("Arestas\tPesos")
-    for _ in range(self.vertex_quantity):
-        # Escolhe o vértice u com a menor chave que ainda não está na MST
-        u = min((v for v in range(self.vertex_quantity) if not in_mst[v]), key=lambda v: key_values[v])
-        
-        in_mst[u] = True
-
-        if parents[u] != -1:  # Pula o primeiro vértice pois ele não tem pai
-            print(f"{self.vertex_data[parents[u]]} - {self.vertex_data[u]} | {key_values[u]}")
-
-        # Atualiza as chaves dos vizinhos de u
-        for v, weight in adj_list[u]:
-            if not in_mst[v] and weight < key_values[v]:
-                key_values[v] = weight
-                parents[v] = u
-
-    total_weight = sum(key_values)
-    print(f"Somatorio de Pesos da AGPM de Prim: {total_weight}")
-
-  
\ No newline at end of file
+      raise ValueError(f"Backend desconhecido: {backend!r}")
+
+    return MSTResult.from_edges(mst, self.vertex_quantity - len(mst), "Kruskal")
+
+  def _edges_key(self):
+    return (id(self.edges_list), len(self.edges_list), self._version, self.vertex_quantity)
+
+  def adjacency(self):
+    """
+    Lista de adjacência CSR do grafo.
+
+    Fica em cache enquanto a lista de arestas não mudar.
+    """
+    key = self._edges_key()
+    if self._csr_key != key:
+      self._csr = build_csr(self.vertex_quantity, self.edges_list)
+      self._csr_key = key
+    return self._csr
+
+  def set_adjacency(self, adjacency) -> None:
+    """ Usa uma CSR já pronta (ex.: lida de arquivo) para as arestas atuais. """
+    self._csr = adjacency
+    self._csr_key = self._edges_key()
+
+  def prim(self, variant=None, backend: str = 'python') -> MSTResult:
+    """
+    Algoritmo de Prim. Em grafos desconexos produz a floresta geradora mínima.
+
+    Com backend 'python', `variant` escolhe a fila de prioridade: 'lazy' (heapq,
+    padrão), 'indexed' (heap com decrease-key) ou 'dense' (varredura O(V²)).
+    Com backend 'numpy', sem `variant` a versão densa ou esparsa é escolhida pela
+    densidade do grafo.
+    """
+    if backend == 'numpy':
+      mst, components = prim_numpy(self.vertex_quantity, self.edges_list, variant)
+    elif backend == 'python':
+      variant = variant or 'lazy'
+      if variant not in PRIM_VARIANTS:
+        raise ValueError(f"Variante de Prim desconhecida: {variant!r}")
+      mst, components = PRIM_VARIANTS[variant](self.adjacency())
+    else:
+      raise ValueError(f"Backend desconhecido: {backend!r}")
+
+    return MSTResult.from_edges(mst, components, "Prim")
+
+  def boruvka(self, workers=None) -> MSTResult:
+    """
+    Algoritmo de Borůvka, com a busca da aresta mais barata de cada componente
+    dividida entre `workers` processos. O tempo de cada rodada fica em
+    `round_times` do resultado.
+    """
+    mst, components, round_times = boruvka(self.vertex_quantity, self.edges_list, workers)
+    return MSTResult.from_edges(mst, components, "Borůvka", round_times)
+
+  def track_mst(self) -> MSTResult:
+    """
+    Passa a manter a AGPM atualizada a cada add_edge/add_edges/remove_edge,
+    sem recalcular tudo. Retorna a AGPM inicial.
+    """
+    self._dynamic_mst = DynamicMST.from_sorted_edges(self.vertex_quantity, self.sorted_edges())
+    return self._dynamic_mst.result()
+
+  def current_mst(self) -> MSTResult:
+    """ AGPM mantida por track_mst(). """
+    if self._dynamic_mst is None:
+      raise RuntimeError("Chame track_mst() antes de consultar a AGPM incremental")
+    return self._dynamic_mst.result()
@@ -0,0 +1,192 @@
+""" Leitura de listas de arestas grandes
+
+Lê arquivos de texto no formato "origem destino [peso]" (um par por linha, como os
+do SNAP, ex.: facebook_combined.txt.gz), comprimidos com gzip ou não, em blocos de
+tamanho fixo. Cada bloco é convertido direto para os vetores tipados de
+`EdgeArrays`, então a memória usada cresce com o número de arestas e não com o
+tamanho do texto.
+
+Linhas vazias e comentários ('#' ou '%') são ignorados.
+"""
+
+import gzip
+import timeit
+from array import array
+
+from MinimumSpanningTree.csr import build_csr
+from MinimumSpanningTree.edge_store import EdgeArrays
+from MinimumSpanningTree.graph import Graph
+
+CHUNK_BYTES = 1 << 20
+COMMENT_PREFIXES = (b'#', b'%')
+
+
+class LoadStats:
+    """
+    Estatísticas de uma leitura.
+
+    Atributos:
+      vertices (int): Número de vértices do grafo gerado.
+      edges (int): Número de arestas lidas.
+      bytes_read (int): Bytes de texto processados (já descomprimidos).
+      seconds (float): Tempo total da leitura.
+    """
+
+    __slots__ = ('vertices', 'edges', 'bytes_read', 'seconds')
+
+    def __init__(self, vertices: int, edges: int, bytes_read: int, seconds: float) -> None:
+        self.vertices = vertices
+        self.edges = edges
+        self.bytes_read = bytes_read
+        self.seconds = seconds
+
+    @property
+    def edges_per_second(self) -> float:
+        return self.edges / self.seconds if self.seconds else float('inf')
+
+    def __repr__(self) -> str:
+        return (f"LoadStats(vertices={self.vertices}, edges={self.edges}, "
+                f"seconds={self.seconds:.3f}, edges_per_second={self.edges_per_second:,.0f})")
+
+
+def open_edge_file(path):
+    """ Abre o arquivo em modo binário, descomprimindo se for gzip. """
+    with open(path, 'rb') as file:
+        magic = file.read(2)
+    if magic == b'\x1f\x8b':
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def iter_blocks(file, chunk_bytes: int = CHUNK_BYTES):
+    """ Blocos de linhas completas, com no máximo ~chunk_bytes cada. """
+    remainder = b''
+    while True:
+        chunk = file.read(chunk_bytes)
+        if not chunk:
+            break
+        data = remainder + chunk
+        cut = data.rfind(b'\n') + 1
+        if cut == 0:
+            remainder = data
+            continue
+        remainder = data[cut:]
+        yield data[:cut]
+    if remainder:
+        yield remainder
+
+
+def split_columns(block: bytes, columns: int):
+    """
+    Tokens do bloco e o número de colunas por linha. Quando todas as linhas têm o
+    mesmo número de colunas, usa um único `split()`; senão, processa linha a linha.
+    """
+    has_comments = any(prefix in block for prefix in COMMENT_PREFIXES)
+    if not has_comments:
+        tokens = block.split()
+        line_count = block.count(b'\n') + (not block.endswith(b'\n'))
+        if columns and len(tokens) == line_count * columns:
+            return tokens, columns
+
+    rows = [line.split() for line in block.splitlines()]
+    rows = [row for row in rows if row and not row[0].startswith(COMMENT_PREFIXES)]
+    if not rows:
+        return [], columns
+    columns = columns or len(rows[0])
+    tokens = []
+    for row in rows:
+        if len(row) < columns:
+            raise ValueError(f"Linha com {len(row)} colunas, esperado {columns}: {b' '.join(row)!r}")
+        tokens.extend(row[:columns])
+    return tokens, columns
+
+
+def _negative_vertex_line(block: bytes, first_line: int):
+    """ Número e texto da primeira linha do bloco com um vértice negativo. """
+    for line, text in enumerate(block.splitlines(), start=first_line):
+        row = text.split()
+        if row and not row[0].startswith(COMMENT_PREFIXES) and any(int(token) < 0 for token in row[:2]):
+            return line, text.decode(errors='replace')
+    return first_line, block.decode(errors='replace')
+
+
+def read_edges(path, weight_column=None, remap: bool = False, default_weight: float = 1.0,
+               chunk_bytes: int = CHUNK_BYTES):
+    """
+    Lê a lista de arestas para um EdgeArrays.
+
+    `weight_column` é o índice da coluna com o peso (None para usar `default_weight`).
+    Com `remap=True`, os identificadores do arquivo (qualquer texto) viram vértices
+    0..n-1 na ordem em que aparecem.
+
+    Retorna (arestas, número de vértices, identificadores originais ou None, estatísticas).
+    """
+    start_time = timeit.default_timer()
+    edges = EdgeArrays()
+    mapping = {} if remap else None
+    max_vertex = -1
+    bytes_read = 0
+    lines_read = 0
+    columns = 0
+
+    with open_edge_file(path) as file:
+        for block in iter_blocks(file, chunk_bytes):
+            bytes_read += len(block)
+            first_line = lines_read + 1
+            lines_read += block.count(b'\n')
+            tokens, columns = split_columns(block, columns)
+            if not tokens:
+                continue
+            if weight_column is not None and weight_column >= columns:
+                raise ValueError(f"Coluna de peso {weight_column} não existe ({columns} colunas)")
+
+            if remap:
+                index_of = mapping.setdefault
+                src = array('i', [index_of(token, len(mapping)) for token in tokens[0::columns]])
+                dst = array('i', [index_of(token, len(mapping)) for token in tokens[1::columns]])
+            else:
+                src = array('i', map(int, tokens[0::columns]))
+                dst = array('i', map(int, tokens[1::columns]))
+                if min(src) < 0 or min(dst) < 0:
+                    line, text = _negative_vertex_line(block, first_line)
+                    raise ValueError(f"Vértice negativo na linha {line}: {text!r}")
+                max_vertex = max(max_vertex, max(src), max(dst))
+
+            if weight_column is None:
+                weight = array('d', [default_weight]) * len(src)
+            else:
+                weight = array('d', map(float, tokens[weight_column::columns]))
+            edges.extend(src, dst, weight)
+
+    if remap:
+        vertex_ids = [token.decode() for token in mapping]
+        vertex_quantity = len(vertex_ids)
+    else:
+        vertex_ids = None
+        vertex_quantity = max_vertex + 1
+
+    stats = LoadStats(vertex_quantity, len(edges), bytes_read, timeit.default_timer() - start_time)
+    return edges, vertex_quantity, vertex_ids, stats
+
+
+def load_edge_list(path, weight_column=None, remap: bool = False, default_weight: float = 1.0,
+                   chunk_bytes: int = CHUNK_BYTES):
+    """
+    Lê a lista de arestas para um Graph compacto. Os rótulos dos vértices
+    (vertex_data) são os identificadores do arquivo.
+
+    Retorna (grafo, estatísticas).
+    """
+    edges, vertex_quantity, vertex_ids, stats = read_edges(path, weight_column, remap,
+                                                           default_weight, chunk_bytes)
+    graph = Graph.from_edge_arrays(vertex_quantity, edges)
+    graph.vertex_data = vertex_ids if remap else [str(vertex) for vertex in range(vertex_quantity)]
+    return graph, stats
+
+
+def load_csr(path, weight_column=None, remap: bool = False, default_weight: float = 1.0,
+             chunk_bytes: int = CHUNK_BYTES):
+    """ Lê a lista de arestas direto para uma CSR. Retorna (csr, identificadores, estatísticas). """
+    edges, vertex_quantity, vertex_ids, stats = read_edges(path, weight_column, remap,
+                                                           default_weight, chunk_bytes)
+    return build_csr(vertex_quantity, edges), vertex_ids, stats
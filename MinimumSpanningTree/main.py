@@ -1,4 +1,5 @@
 from MinimumSpanningTree.graph import Graph
+from MinimumSpanningTree.result import write_mst
 
 g = Graph(7)
 g.add_vertex_data(0, 'A')
@@ -22,7 +23,7 @@ g.add_edge(4, 6, 6)  #E-G,  6
 g.add_edge(5, 6, 11) #F-G, 11
 
 print("Algoritmo de Kruskal: ")
-g.kruskal()
+write_mst(g.kruskal(), g.vertex_data)
 
 print("Algoritmo de Prim: ")
-g.prim()
\ No newline at end of file
+write_mst(g.prim(), g.vertex_data)
\ No newline at end of file
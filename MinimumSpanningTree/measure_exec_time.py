@@ -1,125 +1,219 @@
+import argparse
+import os
 import timeit
 import random
-import copy
-from graph import Graph
+from MinimumSpanningTree.binary_format import load_graph, save_graph
+from MinimumSpanningTree.graph import Graph
+from MinimumSpanningTree.loader import load_edge_list
 
-def generate_custom_graph(num_nodes, num_edges):
-    graph = Graph(num_nodes)
+def generate_custom_graph(num_nodes, num_edges, compact=False, seed=None):
+    """
+    Grafo aleatório com `num_edges` arestas sem laços (pode ter arestas paralelas)
+    e pesos inteiros de 1 a 100, no armazenamento pedido (`compact`).
+
+    Com NumPy as arestas são sorteadas em lote (generators.gnm); sem NumPy, uma a uma.
+    """
+    try:
+        from MinimumSpanningTree import generators
+    except ImportError:
+        generators = None
+    if generators is not None:
+        graph = generators.gnm(num_nodes, num_edges, seed=seed, dedup=False, labels=True)
+        if compact:
+            return graph
+        edges = graph.edges_list
+        listed = Graph(num_nodes, compact=False)
+        listed.add_edges(edges.src.tolist(), edges.dst.tolist(), [int(weight) for weight in edges.weight])
+        listed.vertex_data = graph.vertex_data
+        return listed
+    
+    rng = random.Random(seed)
+    graph = Graph(num_nodes, compact=compact)
     edges_added = 0
     
     while edges_added < num_edges:
-        u = random.randint(0, num_nodes - 1)
-        v = random.randint(0, num_nodes - 1)
+        u = rng.randint(0, num_nodes - 1)
+        v = rng.randint(0, num_nodes - 1)
         if u != v:
-            weight = random.randint(1, 100)
+            weight = rng.randint(1, 100)
             graph.add_edge(u, v, weight)
             graph.add_vertex_data(u, str(u))  # Add vertex labels
             graph.add_vertex_data(v, str(v))
             edges_added += 1
     return graph
 
-class MeasureTime(Graph):
-    def kruskal(self):
-        mst = []
-        edge_count = 0
-        
-        self.edges_list = sorted(self.edges_list, key=lambda item: item[2])
-        parent, rank = [], []
-        
-        for vertex in range(self.vertex_quantity):
-            parent.append(vertex)
-            rank.append(0)
-            
-        while edge_count < len(self.edges_list):
-            start_vertex, end_vertex, weight = self.edges_list[edge_count]
-            edge_count += 1
-            
-            x = self.find(parent, start_vertex)
-            y = self.find(parent, end_vertex)
-            
-            if x != y:
-                mst.append((start_vertex, end_vertex, weight))
-                self.union(parent, rank, x, y)
-        
-        total_weight = sum(weight for _, _, weight in mst)
-        return total_weight  
+def cached_custom_graph(num_nodes, num_edges, seed=0, cache_dir=None):
+    """
+    Igual a generate_custom_graph com semente fixa, mas guarda o grafo no formato
+    binário em `cache_dir` e, nas execuções seguintes, só mapeia o arquivo.
+    """
+    if cache_dir is None:
+        return generate_custom_graph(num_nodes, num_edges, compact=True, seed=seed)
     
-    def prim(self):
-        adj_list = [[] for _ in range(self.vertex_quantity)]
-        for start, end, weight in self.edges_list:
-            adj_list[start].append((end, weight))
-            adj_list[end].append((start, weight))
-            
-        in_mst = [False] * self.vertex_quantity
-        key_values = [float('inf')] * self.vertex_quantity
-        parents = [-1] * self.vertex_quantity
-        
-        key_values[0] = 0
-        
-        for _ in range(self.vertex_quantity):
-            u = min((v for v in range(self.vertex_quantity) if not in_mst[v]), 
-                   key=lambda v: key_values[v])
-            
-            in_mst[u] = True
-            
-            for v, weight in adj_list[u]:
-                if not in_mst[v] and weight < key_values[v]:
-                    key_values[v] = weight
-                    parents[v] = u
-        
-        total_weight = sum(weight for weight in key_values if weight != float('inf'))
-        return total_weight  
+    path = os.path.join(cache_dir, f"custom_{num_nodes}_{num_edges}_{seed}.mstg")
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        save_graph(generate_custom_graph(num_nodes, num_edges, compact=True, seed=seed), path)
+    return load_graph(path)
 
-def measure_execution_time(graph, algorithm):
-    graph_copy = copy.deepcopy(graph)
-    
-    if not isinstance(graph_copy, MeasureTime):
-        modified_graph = MeasureTime(graph_copy.vertex_quantity)
-        modified_graph.edges_list = graph_copy.edges_list
-        modified_graph.vertex_data = graph_copy.vertex_data
-        graph_copy = modified_graph
-    
+def available_backends():
+    backends = ['python']
+    try:
+        import numpy  # noqa: F401
+        backends.append('numpy')
+    except ImportError:
+        pass
+    return backends
+
+def measure_execution_time(graph, algorithm, backend='python'):
+    # kruskal() e prim() não alteram o grafo, então não é preciso copiá-lo
+    # (grafos mapeados do disco nem podem ser copiados).
     start_time = timeit.default_timer()
     if algorithm == "kruskal":
-        total_weight = graph_copy.kruskal()
+        result = graph.kruskal(backend=backend)
     else:  # prim
-        total_weight = graph_copy.prim()
+        result = graph.prim(backend=backend)
     elapsed_time = timeit.default_timer() - start_time
     
-    return elapsed_time, total_weight
+    return elapsed_time, result.total_weight
 
-def run_performance_analysis():
+def run_performance_analysis(cache_dir=None):
     scenarios = [
         (10, 14),
         (100, 140),
         (1000, 1400),
-        (10000, 14000)
+        (10000, 14000),
+        (1000, 100000)
     ]
+    backends = available_backends()
     
     results = {}
     for num_nodes, num_edges in scenarios:
         print(f"\nGerando grafo com {num_nodes} vertices e {num_edges} arestas...")
-        G = generate_custom_graph(num_nodes, num_edges)
-            
-        time_kruskal, weight_kruskal = measure_execution_time(G, 'kruskal')
+        if cache_dir is None:
+            G = generate_custom_graph(num_nodes, num_edges)
+        else:
+            G = cached_custom_graph(num_nodes, num_edges, cache_dir=cache_dir)
         
-        time_prim, weight_prim = measure_execution_time(G, 'prim')
+        scenario_results = {}
+        for algorithm in ("kruskal", "prim"):
+            for backend in backends:
+                elapsed_time, total_weight = measure_execution_time(G, algorithm, backend)
+                scenario_results[(algorithm.capitalize(), backend)] = {"Time": elapsed_time, "Weight": total_weight}
+        results[(num_nodes, num_edges)] = scenario_results
         
-        results[(num_nodes, num_edges)] = {
-            "Kruskal": {"Time": time_kruskal, "Weight": weight_kruskal},
-            "Prim": {"Time": time_prim, "Weight": weight_prim}
-        }
+        print(f"\nResultados para o grafo com {num_nodes} vertices e {num_edges} arestas:")
+        print(f"{'Algoritmo':<10} {'Backend':<8} {'Tempo (s)':>12}  Peso total da AGPM")
+        for (algorithm, backend), result in scenario_results.items():
+            print(f"{algorithm:<10} {backend:<8} {result['Time']:>12.6f}  {result['Weight']}")
+    
+    return results
+
+def run_boruvka_analysis(num_nodes=200000, num_edges=1000000, workers=None):
+    """ Compara Kruskal com Borůvka sequencial e paralelo no mesmo grafo. """
+    workers = workers or os.cpu_count() or 1
+    print(f"\nGerando grafo com {num_nodes} vertices e {num_edges} arestas...")
+    G = generate_custom_graph(num_nodes, num_edges, compact=True)
+    
+    start_time = timeit.default_timer()
+    kruskal_weight = G.kruskal().total_weight
+    kruskal_time = timeit.default_timer() - start_time
+    
+    results = {"Kruskal": {"Time": kruskal_time, "Weight": kruskal_weight}}
+    for label, process_count in (("Borůvka (1 processo)", 1), (f"Borůvka ({workers} processos)", workers)):
+        start_time = timeit.default_timer()
+        result = G.boruvka(workers=process_count)
+        elapsed_time = timeit.default_timer() - start_time
+        results[label] = {"Time": elapsed_time, "Weight": result.total_weight, "Rounds": result.round_times}
         
+        print(f"\n{label}: {len(result.round_times)} rodadas")
+        for round_number, round_time in enumerate(result.round_times, start=1):
+            print(f"  - Rodada {round_number}: {round_time:.4f} segundos")
+    
+    print(f"\n{'Algoritmo':<24} {'Tempo (s)':>10} {'Speedup':>8}  Peso total da AGPM")
+    for label, result in results.items():
+        speedup = kruskal_time / result["Time"]
+        print(f"{label:<24} {result['Time']:>10.4f} {speedup:>7.2f}x  {result['Weight']}")
+    
+    return results
+
+def run_dynamic_analysis(num_nodes=10000, num_edges=50000, num_updates=200):
+    """
+    Aplica uma sequência de inserções e remoções aleatórias e compara o tempo da
+    AGPM incremental (track_mst) com recalcular o Kruskal após cada atualização.
+    """
+    print(f"\nGerando grafo com {num_nodes} vertices e {num_edges} arestas...")
+    G = generate_custom_graph(num_nodes, num_edges, compact=True)
+    G.track_mst()
+    
+    incremental_time = 0.0
+    full_time = 0.0
+    for _ in range(num_updates):
+        if random.random() < 0.5:
+            u, v, weight = G.edges_list[random.randrange(len(G.edges_list))]
+            start_time = timeit.default_timer()
+            G.remove_edge(u, v, weight)
+        else:
+            u, v = random.randrange(num_nodes), random.randrange(num_nodes)
+            start_time = timeit.default_timer()
+            G.add_edge(u, v, random.randint(1, 100))
+        incremental_time += timeit.default_timer() - start_time
         
-        print(f"\nResultados para o grafo com {num_nodes} vertices e {num_edges} arestas:")
-        print(f"Algoritmo de Kruskal:")
-        print(f"  - Tempo de Execução: {time_kruskal:.6f} segundos")
-        print(f"  - Peso total da AGPM: {weight_kruskal}")
-        print(f"Algoritmo de Prim:")
-        print(f"  - Tempo de Execução: {time_prim:.6f} seconds")
-        print(f"  - Peso total da AGPM: {weight_prim}")
+        start_time = timeit.default_timer()
+        full_weight = G.kruskal().total_weight
+        full_time += timeit.default_timer() - start_time
     
+    incremental_weight = G.current_mst().total_weight
+    print(f"\nResultados para {num_updates} atualizações:")
+    print(f"  - Incremental: {incremental_time:.4f} segundos ({incremental_time / num_updates * 1000:.3f} ms por atualização)")
+    print(f"  - Recalculando: {full_time:.4f} segundos ({full_time / num_updates * 1000:.3f} ms por atualização)")
+    print(f"  - Peso total da AGPM: {incremental_weight} (recalculada: {full_weight})")
+    
+    return {"Incremental": {"Time": incremental_time, "Weight": incremental_weight},
+            "Full": {"Time": full_time, "Weight": full_weight}}
+
+def run_file_analysis(path, weight_column=None, remap=False):
+    """ Lê uma lista de arestas (ex.: facebook_combined.txt.gz) e mede os algoritmos nela. """
+    print(f"\nLendo {path}...")
+    G, stats = load_edge_list(path, weight_column=weight_column, remap=remap)
+    print(f"  - {stats.vertices} vertices e {stats.edges} arestas em {stats.seconds:.3f} segundos "
+          f"({stats.edges_per_second:,.0f} arestas/s)")
+    
+    results = {}
+    for algorithm in ("kruskal", "prim"):
+        for backend in available_backends():
+            elapsed_time, total_weight = measure_execution_time(G, algorithm, backend)
+            results[(algorithm.capitalize(), backend)] = {"Time": elapsed_time, "Weight": total_weight}
+            print(f"{algorithm.capitalize():<10} {backend:<8} {elapsed_time:>12.6f}  {total_weight}")
     return results
 
 if __name__ == "__main__":
-    results = run_performance_analysis()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Tempo de execução dos algoritmos de AGPM")
+    parser.add_argument("--boruvka", action="store_true",
+                        help="compara Kruskal e Borůvka paralelo num grafo grande")
+    parser.add_argument("--edge-list", metavar="ARQUIVO",
+                        help="mede os algoritmos num arquivo de arestas (texto ou .gz)")
+    parser.add_argument("--weight-column", type=int, default=None)
+    parser.add_argument("--remap", action="store_true",
+                        help="renumera os identificadores de vértice do arquivo")
+    parser.add_argument("--dynamic", action="store_true",
+                        help="compara a AGPM incremental com recalcular após cada atualização")
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--cache-dir", metavar="DIRETORIO",
+                        help="guarda os grafos gerados em formato binário e os reutiliza")
+    # Sem --nodes/--edges, cada modo usa os tamanhos padrão da sua função
+    parser.add_argument("--nodes", type=int, default=None)
+    parser.add_argument("--edges", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    sizes = {name: value for name, value in (("num_nodes", args.nodes), ("num_edges", args.edges))
+             if value is not None}
+    
+    if args.edge_list:
+        results = run_file_analysis(args.edge_list, args.weight_column, args.remap)
+    elif args.boruvka:
+        results = run_boruvka_analysis(workers=args.workers, **sizes)
+    elif args.dynamic:
+        results = run_dynamic_analysis(num_updates=args.updates, **sizes)
+    else:
+        results = run_performance_analysis(args.cache_dir)
\ No newline at end of file
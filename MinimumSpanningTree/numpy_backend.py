@@ -0,0 +1,132 @@
+""" Backend NumPy para Kruskal e Prim
+
+O NumPy é opcional: só é importado quando `backend="numpy"` é pedido.
+
+  - Kruskal ordena os pesos com `np.argsort` (estável, a mesma ordem do `sorted`
+    do Python) e roda o Union-Find sobre os vetores de inteiros já ordenados.
+  - Prim escolhe entre duas versões pela densidade E/V²: em grafos densos usa a
+    matriz de adjacência V×V e atualiza todas as chaves de uma vez com
+    `np.minimum`; em grafos esparsos usa o heap sobre uma CSR montada com NumPy.
+
+As arestas retornadas têm o mesmo formato (pai, vértice, peso) dos caminhos em
+Python puro, com o peso no tipo original (int ou float).
+"""
+
+from MinimumSpanningTree.csr import CSRAdjacency
+from MinimumSpanningTree.edge_store import EdgeArrays
+from MinimumSpanningTree.prim import prim_lazy
+from MinimumSpanningTree.union_find import DisjointSet
+
+# A versão densa é usada a partir desta densidade (E/V²)...
+DENSE_THRESHOLD = 0.05
+# ...desde que a matriz V×V de float64 caiba em ~200 MB.
+DENSE_MAX_VERTICES = 5000
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("backend='numpy' requer o pacote numpy (pip install numpy)") from error
+    return numpy
+
+
+def edge_arrays(edges):
+    """ Vetores NumPy (src, dst, peso). Para EdgeArrays não há cópia. """
+    np = _numpy()
+    if isinstance(edges, EdgeArrays):
+        return (np.frombuffer(edges.src, dtype=np.int32),
+                np.frombuffer(edges.dst, dtype=np.int32),
+                np.frombuffer(edges.weight, dtype=np.float64))
+    if len(edges) == 0:
+        return np.zeros(0, np.int32), np.zeros(0, np.int32), np.zeros(0, np.float64)
+    src, dst, weight = zip(*edges)
+    return np.array(src, dtype=np.int32), np.array(dst, dtype=np.int32), np.array(weight)
+
+
+def kruskal_numpy(vertex_quantity: int, edges) -> list:
+    np = _numpy()
+    src, dst, weight = edge_arrays(edges)
+    order = np.argsort(weight, kind='stable')
+
+    mst = []
+    components = DisjointSet(vertex_quantity)
+    max_edges = vertex_quantity - 1
+    for start_vertex, end_vertex, edge_weight in zip(src[order].tolist(),
+                                                      dst[order].tolist(),
+                                                      weight[order].tolist()):
+        if components.union(start_vertex, end_vertex):
+            mst.append((start_vertex, end_vertex, edge_weight))
+            if len(mst) == max_edges:
+                break
+    return mst
+
+
+def csr_numpy(vertex_quantity: int, edges) -> CSRAdjacency:
+    """ CSR montada com operações vetorizadas (ordenação estável por vértice de origem). """
+    np = _numpy()
+    src, dst, weight = edge_arrays(edges)
+    rows = np.concatenate((src, dst))
+    columns = np.concatenate((dst, src))
+    values = np.concatenate((weight, weight))
+    order = np.argsort(rows, kind='stable')
+
+    offsets = np.zeros(vertex_quantity + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=vertex_quantity), out=offsets[1:])
+    return CSRAdjacency(offsets.tolist(), columns[order].tolist(), values[order].tolist())
+
+
+def prim_dense_numpy(vertex_quantity: int, edges):
+    """ Prim O(V²) vetorizado sobre a matriz de adjacência. """
+    np = _numpy()
+    src, dst, weight = edge_arrays(edges)
+    to_weight = int if np.issubdtype(weight.dtype, np.integer) else float
+
+    # Arestas paralelas: a matriz guarda apenas a de menor peso.
+    matrix = np.full((vertex_quantity, vertex_quantity), np.inf)
+    np.minimum.at(matrix, (src, dst), weight)
+    np.minimum.at(matrix, (dst, src), weight)
+
+    key_values = np.full(vertex_quantity, np.inf)
+    parents = np.full(vertex_quantity, -1, dtype=np.int64)
+    in_mst = np.zeros(vertex_quantity, dtype=bool)
+    mst = []
+    components = 0
+
+    for _ in range(vertex_quantity):
+        u = int(np.argmin(np.where(in_mst, np.inf, key_values)))
+        if key_values[u] == np.inf or in_mst[u]:
+            # Nenhum vértice restante é alcançável: começa uma nova árvore.
+            u = int(np.argmin(in_mst))
+            components += 1
+            key_values[u] = 0
+        in_mst[u] = True
+
+        if parents[u] != -1:
+            mst.append((int(parents[u]), u, to_weight(key_values[u])))
+
+        improved = ~in_mst & (matrix[u] < key_values)
+        key_values = np.minimum(key_values, np.where(in_mst, np.inf, matrix[u]))
+        parents[improved] = u
+
+    return mst, components
+
+
+def use_dense(vertex_quantity: int, edge_quantity: int) -> bool:
+    if vertex_quantity == 0 or vertex_quantity > DENSE_MAX_VERTICES:
+        return False
+    return edge_quantity / (vertex_quantity * vertex_quantity) >= DENSE_THRESHOLD
+
+
+def prim_numpy(vertex_quantity: int, edges, variant=None):
+    """
+    Prim com escolha automática entre a versão densa e a esparsa.
+    `variant` pode forçar 'dense' ou 'lazy'.
+    """
+    if variant is None:
+        variant = 'dense' if use_dense(vertex_quantity, len(edges)) else 'lazy'
+    if variant == 'dense':
+        return prim_dense_numpy(vertex_quantity, edges)
+    if variant == 'lazy':
+        return prim_lazy(csr_numpy(vertex_quantity, edges))
+    raise ValueError(f"Variante de Prim desconhecida para o backend numpy: {variant!r}")
@@ -0,0 +1,124 @@
+""" Variantes do algoritmo de Prim
+
+Todas recebem uma lista de adjacência CSR e retornam a floresta geradora mínima
+como uma lista de arestas (pai, vértice, peso), na ordem em que os vértices entram
+na árvore, e o número de componentes. Quando o grafo é desconexo, o algoritmo
+recomeça a partir do próximo vértice ainda fora da floresta.
+
+  - "lazy": heap binário (heapq) com entradas obsoletas descartadas ao sair da fila.
+    O(E log E).
+  - "indexed": heap indexado com "decrease-key"; no máximo uma entrada por vértice.
+    O(E log V).
+  - "dense": escolhe o próximo vértice varrendo todos os vértices. O(V²), adequado
+    apenas para grafos densos.
+"""
+
+import heapq
+
+from MinimumSpanningTree.priority_queue import IndexedMinHeap
+
+INF = float('inf')
+
+
+def prim_lazy(adjacency):
+    offsets, targets, weights = adjacency.offsets, adjacency.targets, adjacency.weights
+    vertex_quantity = adjacency.vertex_quantity
+    in_mst = bytearray(vertex_quantity)
+    mst = []
+    components = 0
+
+    for root in range(vertex_quantity):
+        if in_mst[root]:
+            continue
+        components += 1
+        in_mst[root] = 1
+        heap = [(weights[i], targets[i], root) for i in range(offsets[root], offsets[root + 1])]
+        heapq.heapify(heap)
+
+        while heap:
+            weight, vertex, parent = heapq.heappop(heap)
+            if in_mst[vertex]:
+                continue
+            in_mst[vertex] = 1
+            mst.append((parent, vertex, weight))
+            for i in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = targets[i]
+                if not in_mst[neighbor]:
+                    heapq.heappush(heap, (weights[i], neighbor, vertex))
+
+    return mst, components
+
+
+def prim_indexed(adjacency):
+    offsets, targets, weights = adjacency.offsets, adjacency.targets, adjacency.weights
+    vertex_quantity = adjacency.vertex_quantity
+    in_mst = bytearray(vertex_quantity)
+    key_values = [INF] * vertex_quantity
+    parents = [-1] * vertex_quantity
+    heap = IndexedMinHeap(vertex_quantity)
+    mst = []
+    components = 0
+
+    for root in range(vertex_quantity):
+        if in_mst[root]:
+            continue
+        components += 1
+        key_values[root] = 0
+        heap.push(root, 0)
+
+        while heap:
+            vertex, key = heap.pop()
+            in_mst[vertex] = 1
+            if parents[vertex] != -1:
+                mst.append((parents[vertex], vertex, key))
+
+            for i in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = targets[i]
+                weight = weights[i]
+                if not in_mst[neighbor] and weight < key_values[neighbor]:
+                    key_values[neighbor] = weight
+                    parents[neighbor] = vertex
+                    if neighbor in heap:
+                        heap.decrease_key(neighbor, weight)
+                    else:
+                        heap.push(neighbor, weight)
+
+    return mst, components
+
+
+def prim_dense(adjacency):
+    offsets, targets, weights = adjacency.offsets, adjacency.targets, adjacency.weights
+    vertex_quantity = adjacency.vertex_quantity
+    in_mst = [False] * vertex_quantity
+    key_values = [INF] * vertex_quantity
+    parents = [-1] * vertex_quantity
+    mst = []
+    components = 0
+
+    for _ in range(vertex_quantity):
+        # Escolhe o vértice u com a menor chave que ainda não está na MST
+        u = min((v for v in range(vertex_quantity) if not in_mst[v]), key=lambda v: key_values[v])
+        if key_values[u] == INF:
+            # Nenhum vértice restante é alcançável: começa uma nova árvore.
+            components += 1
+            key_values[u] = 0
+        in_mst[u] = True
+
+        if parents[u] != -1:
+            mst.append((parents[u], u, key_values[u]))
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            weight = weights[i]
+            if not in_mst[v] and weight < key_values[v]:
+                key_values[v] = weight
+                parents[v] = u
+
+    return mst, components
+
+
+PRIM_VARIANTS = {
+    'lazy': prim_lazy,
+    'indexed': prim_indexed,
+    'dense': prim_dense,
+}
@@ -0,0 +1,92 @@
+""" Fila de prioridade indexada
+
+Heap binário mínimo em que cada elemento é um vértice (0..n-1). Além de inserir e
+remover o mínimo, permite diminuir a chave de um vértice que já está na fila
+("decrease-key") em O(log n), pois a posição de cada vértice no heap é guardada
+em `position`.
+"""
+
+from array import array
+
+
+class IndexedMinHeap:
+    """
+    Heap mínimo de vértices com chave.
+
+    Atributos:
+      heap (array): Vértices na ordem do heap.
+      position (array): Índice de cada vértice em `heap`, ou -1 se não está na fila.
+      keys (list): Chave atual de cada vértice.
+    """
+
+    __slots__ = ('heap', 'position', 'keys')
+
+    def __init__(self, capacity: int) -> None:
+        self.heap = array('i')
+        self.position = array('i', [-1]) * capacity
+        self.keys = [0] * capacity
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, vertex: int) -> bool:
+        return self.position[vertex] != -1
+
+    def push(self, vertex: int, key) -> None:
+        self.keys[vertex] = key
+        self.heap.append(vertex)
+        self.position[vertex] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, vertex: int, key) -> None:
+        self.keys[vertex] = key
+        self._sift_up(self.position[vertex])
+
+    def pop(self):
+        """ Remove e retorna o par (vértice, chave) de menor chave. """
+        heap, position = self.heap, self.position
+        vertex = heap[0]
+        last = heap.pop()
+        position[vertex] = -1
+        if heap:
+            heap[0] = last
+            position[last] = 0
+            self._sift_down(0)
+        return vertex, self.keys[vertex]
+
+    def _sift_up(self, index: int) -> None:
+        heap, position, keys = self.heap, self.position, self.keys
+        vertex = heap[index]
+        key = keys[vertex]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if keys[parent] <= key:
+                break
+            heap[index] = parent
+            position[parent] = index
+            index = parent_index
+        heap[index] = vertex
+        position[vertex] = index
+
+    def _sift_down(self, index: int) -> None:
+        heap, position, keys = self.heap, self.position, self.keys
+        size = len(heap)
+        vertex = heap[index]
+        key = keys[vertex]
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            child = heap[child_index]
+            right_index = child_index + 1
+            if right_index < size and keys[heap[right_index]] < keys[child]:
+                child_index = right_index
+                child = heap[child_index]
+            if key <= keys[child]:
+                break
+            heap[index] = child
+            position[child] = index
+            index = child_index
+        heap[index] = vertex
+        position[vertex] = index
@@ -0,0 +1,65 @@
+""" Resultado de uma AGPM
+
+Os algoritmos retornam um `MSTResult` em vez de imprimir as arestas. A impressão
+fica em `write_mst`, que só é chamada quando o usuário quer ver a árvore e pode
+escrever em qualquer arquivo (por padrão, a saída padrão).
+"""
+
+import sys
+
+from MinimumSpanningTree.edge_store import EdgeArrays
+
+
+class MSTResult:
+    """
+    Árvore (ou floresta) geradora mínima.
+
+    Atributos:
+      edges (EdgeArrays): Arestas da árvore, na ordem em que foram escolhidas.
+      total_weight: Soma dos pesos das arestas.
+      component_count (int): Número de componentes; 1 quando o grafo é conexo.
+      algorithm (str): Nome do algoritmo que gerou o resultado.
+      round_times (tuple): Duração de cada rodada, em segundos (só Borůvka).
+    """
+
+    __slots__ = ('edges', 'total_weight', 'component_count', 'algorithm', 'round_times')
+
+    def __init__(self, edges: EdgeArrays, component_count: int, algorithm: str,
+                 round_times: tuple = ()) -> None:
+        self.edges = edges
+        self.total_weight = sum(edges.weight)
+        self.component_count = component_count
+        self.algorithm = algorithm
+        self.round_times = tuple(round_times)
+
+    @classmethod
+    def from_edges(cls, mst: list, component_count: int, algorithm: str,
+                   round_times: tuple = ()) -> 'MSTResult':
+        """ Constrói o resultado a partir de uma lista de tuplas (início, fim, peso). """
+        integer_weights = all(type(weight) is int for _, _, weight in mst)
+        edges = EdgeArrays(weight_typecode='q' if integer_weights else 'd')
+        if mst:
+            start, end, weight = zip(*mst)
+            edges.extend(start, end, weight)
+        return cls(edges, component_count, algorithm, round_times)
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def __iter__(self):
+        return iter(self.edges)
+
+    def __repr__(self) -> str:
+        return (f"MSTResult(algorithm={self.algorithm!r}, edges={len(self.edges)}, "
+                f"total_weight={self.total_weight}, component_count={self.component_count})")
+
+
+def write_mst(result: MSTResult, vertex_data: list, file=None) -> None:
+    """ Escreve as arestas e o peso total da AGPM, uma aresta por linha. """
+    file = file or sys.stdout
+    file.write("Arestas | Pesos\n")
+    file.writelines(f"{vertex_data[start]} - {vertex_data[end]} | {weight}\n"
+                    for start, end, weight in result)
+    if result.component_count > 1:
+        file.write(f"Grafo desconexo: floresta com {result.component_count} componentes\n")
+    file.write(f"Somatório de pesos da AGPM de {result.algorithm}: {result.total_weight}\n")
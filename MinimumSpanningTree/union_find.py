@@ -0,0 +1,79 @@
+""" Estrutura Union-Find (conjuntos disjuntos)
+
+Implementação iterativa usada pelo algoritmo de Kruskal para detectar ciclos.
+Os pais e tamanhos ficam em vetores de inteiros, e a busca usa compressão de
+caminho por divisão ao meio ("path halving"): cada vértice visitado passa a
+apontar para o avô. Junto com a união por tamanho, o custo amortizado de cada
+operação fica praticamente constante e não há recursão.
+"""
+
+from array import array
+
+
+class DisjointSet:
+    """
+    Conjuntos disjuntos sobre os vértices 0..n-1.
+
+    Atributos:
+      parent (array): Pai de cada vértice; a raiz aponta para si mesma.
+      size (array): Tamanho do conjunto de cada raiz.
+      component_count (int): Número de conjuntos distintos.
+    """
+
+    __slots__ = ('parent', 'size', 'component_count')
+
+    def __init__(self, vertex_quantity: int) -> None:
+        self.parent = array('i', range(vertex_quantity))
+        self.size = array('i', [1]) * vertex_quantity
+        self.component_count = vertex_quantity
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, vertex: int) -> int:
+        parent = self.parent
+        while parent[vertex] != vertex:
+            parent[vertex] = parent[parent[vertex]]
+            vertex = parent[vertex]
+        return vertex
+
+    def union(self, x: int, y: int) -> bool:
+        """ Une os conjuntos de `x` e `y`. Retorna False se já estavam juntos. """
+        x_root = self.find(x)
+        y_root = self.find(y)
+        if x_root == y_root:
+            return False
+
+        size = self.size
+        if size[x_root] < size[y_root]:
+            x_root, y_root = y_root, x_root
+        self.parent[y_root] = x_root
+        size[x_root] += size[y_root]
+        self.component_count -= 1
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    def find_many(self, vertices) -> array:
+        """ Raiz de cada vértice de `vertices`. """
+        find = self.find
+        return array('i', [find(vertex) for vertex in vertices])
+
+    def union_many(self, xs, ys) -> array:
+        """
+        Aplica `union(x, y)` para cada par, em ordem.
+
+        Retorna um vetor de bytes em que 1 indica que o par uniu dois conjuntos
+        (ou seja, a aresta correspondente não forma ciclo).
+        """
+        union = self.union
+        return array('b', [union(x, y) for x, y in zip(xs, ys)])
+
+    def component_size(self, vertex: int) -> int:
+        return self.size[self.find(vertex)]
+
+    def component_sizes(self) -> dict:
+        """ Tamanho de cada conjunto, indexado pela raiz. """
+        parent, size = self.parent, self.size
+        return {vertex: size[vertex] for vertex in range(len(parent)) if parent[vertex] == vertex}
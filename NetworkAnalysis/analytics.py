@@ -0,0 +1,336 @@
+""" Estatísticas de caminhos mais curtos (diâmetro, caminho médio, histograma)
+
+Em vez de guardar a matriz de distâncias de todos os pares (o que
+`dict(nx.all_pairs_shortest_path_length(G))` faz: ~16 milhões de entradas no
+grafo do Facebook), cada origem roda uma BFS sobre a CSR e soma o número de nós
+em cada nível direto num histograma. A memória fica em O(V) por processo,
+independente do número de pares.
+
+  - path_length_statistics: histograma de comprimentos, caminho médio e
+    excentricidades. As origens são divididas entre processos; com `sample`, só
+    uma amostra aleatória de origens é usada e o resultado traz as margens de erro.
+  - diameter: diâmetro exato com o iFUB (a origem vem de uma varredura dupla),
+    que costuma precisar de poucas BFS em redes reais.
+
+As distâncias são em número de arestas (o grafo é tratado como não ponderado).
+O caminho médio considera os pares ordenados (u, v) com u != v e v alcançável.
+
+    python -m NetworkAnalysis.analytics facebook_combined.txt.gz
+    python -m NetworkAnalysis.analytics facebook_combined.txt.gz --sample 200
+"""
+
+import argparse
+import math
+import os
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from NetworkAnalysis.csr_graph import CSRGraph
+
+# Valor z da normal para cada nível de confiança aceito no modo amostrado.
+Z_SCORES = {0.90: 1.645, 0.95: 1.960, 0.99: 2.576}
+
+# Vetores (offsets, targets) usados pelos processos do pool.
+_worker_arrays = None
+
+
+def csr_arrays(graph: CSRGraph):
+    """ offsets e targets como vetores NumPy (sem cópia quando já são contíguos). """
+    return (np.asarray(graph.offsets, dtype=np.int64),
+            np.asarray(graph.targets, dtype=np.int64))
+
+
+def bfs_levels(offsets, targets, source: int, distance):
+    """
+    BFS por níveis a partir de `source`, expandindo a fronteira inteira de uma vez.
+
+    Preenche `distance` (vetor int32 de tamanho V, -1 = não visitado) e retorna a
+    quantidade de nós em cada nível: counts[d] nós estão a distância d.
+    """
+    distance.fill(-1)
+    distance[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    counts = [1]
+
+    while True:
+        starts = offsets[frontier]
+        lengths = offsets[frontier + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            break
+        # Posição de cada vizinho na CSR: start do nó + deslocamento dentro da linha.
+        shift = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        neighbors = targets[shift + np.arange(total)]
+        neighbors = np.unique(neighbors[distance[neighbors] < 0])
+        if not len(neighbors):
+            break
+        distance[neighbors] = len(counts)
+        counts.append(len(neighbors))
+        frontier = neighbors
+
+    return counts
+
+
+def _set_worker_arrays(offsets, targets) -> None:
+    global _worker_arrays
+    _worker_arrays = (offsets, targets)
+
+
+def _fold_sources(sources):
+    """
+    Roda a BFS de cada origem e soma os níveis num único histograma.
+
+    Retorna (histograma, níveis de cada origem); os níveis têm tamanho
+    excentricidade + 1, então a memória não depende do número de pares.
+    """
+    offsets, targets = _worker_arrays
+    distance = np.empty(len(offsets) - 1, dtype=np.int32)
+    histogram = np.zeros(0, dtype=np.int64)
+    levels = []
+
+    for source in sources:
+        counts = bfs_levels(offsets, targets, source, distance)
+        if len(counts) > len(histogram):
+            histogram = np.concatenate((histogram, np.zeros(len(counts) - len(histogram), dtype=np.int64)))
+        histogram[:len(counts)] += counts
+        levels.append(counts)
+
+    return histogram, levels
+
+
+class PathStatistics:
+    """
+    Resultado de path_length_statistics.
+
+    Atributos:
+      histogram (np.ndarray): histogram[d] = número de pares ordenados a distância d
+        (histogram[0] é o número de origens).
+      sources (np.ndarray): Origens usadas.
+      eccentricity (np.ndarray): Excentricidade de cada origem (no seu componente).
+      vertex_quantity (int): Número de nós do grafo.
+      sampled (bool): True se só uma amostra das origens foi usada.
+      confidence (float): Nível de confiança das margens de erro.
+      average_error (float): Margem de erro do caminho médio (0 no modo exato).
+      distribution_error (np.ndarray): Margem de erro, em pontos percentuais, de
+        cada valor de distribution() (zeros no modo exato).
+    """
+
+    __slots__ = ('histogram', 'sources', 'eccentricity', 'vertex_quantity', 'sampled',
+                 'confidence', 'average_error', 'distribution_error')
+
+    def __init__(self, histogram, sources, levels, vertex_quantity: int, sampled: bool,
+                 confidence: float) -> None:
+        self.histogram = histogram
+        self.sources = sources
+        self.eccentricity = np.array([len(counts) - 1 for counts in levels], dtype=np.int32)
+        self.vertex_quantity = vertex_quantity
+        self.sampled = sampled
+        self.confidence = confidence
+        self.average_error = 0.0
+        self.distribution_error = np.zeros(max(len(histogram) - 1, 0))
+        if sampled and len(levels) > 1:
+            self._estimate_errors(levels)
+
+    def _estimate_errors(self, levels) -> None:
+        """
+        Margens pela aproximação normal: cada estimativa é a média de um valor por
+        origem (caminho médio da origem, fração de pares em cada comprimento).
+        """
+        sample_size = len(levels)
+        per_source = np.zeros((sample_size, len(self.histogram)))
+        for row, counts in enumerate(levels):
+            per_source[row, :len(counts)] = counts
+        reached = per_source[:, 1:].sum(axis=1)
+        valid = reached > 0
+        fractions = per_source[valid, 1:] / reached[valid, None]
+        means = fractions @ np.arange(1, len(self.histogram))
+
+        # Correção de população finita: amostrar todas as origens dá erro zero.
+        scale = (Z_SCORES[self.confidence] / math.sqrt(sample_size) *
+                 math.sqrt(max(0.0, 1 - sample_size / self.vertex_quantity)))
+        if len(means) > 1:
+            self.average_error = float(np.std(means, ddof=1)) * scale
+            self.distribution_error = 100 * np.std(fractions, axis=0, ddof=1) * scale
+
+    @property
+    def pairs(self) -> int:
+        """ Pares ordenados (u, v), u != v, com v alcançável a partir de u. """
+        return int(self.histogram[1:].sum())
+
+    @property
+    def average_path_length(self) -> float:
+        if not self.pairs:
+            return 0.0
+        return float((np.arange(len(self.histogram)) * self.histogram).sum() / self.pairs)
+
+    @property
+    def max_eccentricity(self) -> int:
+        """ Maior excentricidade entre as origens (o diâmetro, no modo exato). """
+        return int(self.eccentricity.max()) if len(self.eccentricity) else 0
+
+    def distribution(self) -> np.ndarray:
+        """ Porcentagem dos pares em cada comprimento 1..max (índice 0 = comprimento 1). """
+        pairs = self.pairs
+        return 100 * self.histogram[1:] / pairs if pairs else np.zeros(0)
+
+    def __repr__(self) -> str:
+        mode = f"amostra de {len(self.sources)} origens" if self.sampled else "exato"
+        return (f"PathStatistics({mode}, average_path_length={self.average_path_length:.4f}"
+                f" ± {self.average_error:.4f}, max_eccentricity={self.max_eccentricity})")
+
+
+def path_length_statistics(graph: CSRGraph, workers=None, sample=None, seed=None,
+                           confidence: float = 0.95) -> PathStatistics:
+    """
+    Histograma de comprimentos de caminho, caminho médio e excentricidades.
+
+    Com `sample`, usa só essa quantidade de origens sorteadas; `confidence`
+    (0.90, 0.95 ou 0.99) define as margens de erro.
+    """
+    if confidence not in Z_SCORES:
+        raise ValueError(f"Nível de confiança deve ser um de {sorted(Z_SCORES)}")
+    vertex_quantity = graph.vertex_quantity
+    if sample is not None and sample < vertex_quantity:
+        sources = np.sort(np.random.default_rng(seed).choice(vertex_quantity, sample, replace=False))
+        sampled = True
+    else:
+        sources = np.arange(vertex_quantity)
+        sampled = False
+
+    offsets, targets = csr_arrays(graph)
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, -(-len(sources) // (workers * 4)))
+    chunks = [sources[start:start + chunk_size].tolist() for start in range(0, len(sources), chunk_size)]
+
+    if workers == 1 or len(chunks) == 1:
+        _set_worker_arrays(offsets, targets)
+        partials = map(_fold_sources, chunks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_set_worker_arrays,
+                                       initargs=(offsets, targets))
+        partials = executor.map(_fold_sources, chunks)
+
+    histogram = np.zeros(1, dtype=np.int64)
+    levels = []
+    try:
+        for part_histogram, part_levels in partials:
+            if len(part_histogram) > len(histogram):
+                histogram = np.concatenate((histogram, np.zeros(len(part_histogram) - len(histogram),
+                                                                dtype=np.int64)))
+            histogram[:len(part_histogram)] += part_histogram
+            levels.extend(part_levels)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return PathStatistics(histogram, sources, levels, vertex_quantity, sampled, confidence)
+
+
+def double_sweep(offsets, targets, start: int, distance):
+    """
+    Varredura dupla: BFS de `start` até o nó mais distante a, e de a até o mais
+    distante b. Retorna (ecc(a), nó do meio do caminho a-b, BFS feitas).
+
+    ecc(a) é um limite inferior do diâmetro do componente.
+    """
+    bfs_levels(offsets, targets, start, distance)
+    a = int(np.argmax(distance))
+    from_a = distance.copy()
+    lower = len(bfs_levels(offsets, targets, a, from_a)) - 1
+    b = int(np.argmax(from_a))
+    bfs_levels(offsets, targets, b, distance)
+    # O meio está a lower // 2 de a e sobre um caminho mínimo a-b.
+    middle = np.flatnonzero((from_a == lower // 2) & (from_a + distance == lower))
+    return lower, int(middle[0]), 3
+
+
+def _component_diameter(offsets, targets, start: int, distance):
+    """ iFUB num componente; retorna (diâmetro, BFS feitas). """
+    lower, root, bfs_count = double_sweep(offsets, targets, start, distance)
+    from_root = distance.copy()
+    levels = bfs_levels(offsets, targets, root, from_root)
+    bfs_count += 1
+    level = len(levels) - 1
+    lower = max(lower, level)
+    upper = 2 * level
+
+    # Nós na "franja" i (a distância i da raiz) só podem formar pares de distância
+    # > 2(i-1) entre si ou com franjas mais externas; quando o melhor limite inferior
+    # passa disso, as franjas internas não precisam ser visitadas.
+    while upper > lower and level > 0:
+        for node in np.flatnonzero(from_root == level).tolist():
+            lower = max(lower, len(bfs_levels(offsets, targets, node, distance)) - 1)
+            bfs_count += 1
+        if lower > 2 * (level - 1):
+            break
+        upper = 2 * (level - 1)
+        level -= 1
+    return lower, bfs_count
+
+
+def diameter(graph: CSRGraph):
+    """
+    Diâmetro exato (maior excentricidade entre todos os componentes) pelo iFUB.
+
+    Retorna (diâmetro, número de BFS feitas). Componentes com no máximo
+    diâmetro + 1 nós são pulados, já que não podem superá-lo.
+    """
+    offsets, targets = csr_arrays(graph)
+    vertex_quantity = graph.vertex_quantity
+    distance = np.empty(vertex_quantity, dtype=np.int32)
+    unvisited = np.ones(vertex_quantity, dtype=bool)
+    best, bfs_count = 0, 0
+
+    # O primeiro componente começa pelo nó de maior grau, que costuma estar no maior componente.
+    start = int(np.argmax(np.diff(offsets))) if vertex_quantity else None
+    while start is not None:
+        counts = bfs_levels(offsets, targets, start, distance)
+        bfs_count += 1
+        component = distance >= 0
+        unvisited &= ~component
+        if sum(counts) - 1 > best:
+            component_diameter, count = _component_diameter(offsets, targets, start, distance)
+            best = max(best, component_diameter)
+            bfs_count += count
+        remaining = np.flatnonzero(unvisited)
+        start = int(remaining[0]) if len(remaining) else None
+
+    return best, bfs_count
+
+
+def main(argv=None):
+    from MinimumSpanningTree.loader import load_csr
+
+    parser = argparse.ArgumentParser(description="Diâmetro, caminho médio e histograma de caminhos")
+    parser.add_argument("edge_list", help="lista de arestas (texto, opcionalmente .gz)")
+    parser.add_argument("--sample", type=int, help="número de origens sorteadas (padrão: todas)")
+    parser.add_argument("--confidence", type=float, default=0.95, choices=sorted(Z_SCORES))
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    csr, vertex_ids, _ = load_csr(args.edge_list, remap=True)
+    graph = CSRGraph(csr.offsets, csr.targets, csr.weights, vertex_ids)
+    print(f"{graph.vertex_quantity} nós, {graph.edge_quantity} arestas")
+
+    start_time = timeit.default_timer()
+    graph_diameter, bfs_count = diameter(graph)
+    print(f"Diâmetro: {graph_diameter} ({bfs_count} BFS, {timeit.default_timer() - start_time:.2f}s)")
+
+    start_time = timeit.default_timer()
+    stats = path_length_statistics(graph, args.workers, args.sample, args.seed, args.confidence)
+    elapsed = timeit.default_timer() - start_time
+    margin = f" ± {stats.average_error:.4f}" if stats.sampled else ""
+    print(f"Caminho médio: {stats.average_path_length:.4f}{margin} "
+          f"({len(stats.sources)} origens, {elapsed:.2f}s)")
+    for length, (percent, error) in enumerate(zip(stats.distribution(), stats.distribution_error), start=1):
+        print(f"  {length:3d}: {percent:6.2f}%" + (f" ± {error:.2f}" if stats.sampled else ""))
+    if stats.sampled:
+        print(f"Margens de erro com {stats.confidence:.0%} de confiança")
+
+
+if __name__ == "__main__":
+    main()
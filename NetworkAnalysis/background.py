@@ -0,0 +1,162 @@
+""" Execução em segundo plano para a interface Tk
+
+O Tk só pode ser usado pela thread principal, e um callback demorado congela a
+janela inteira. O BackgroundRunner roda as funções num pool (threads por padrão,
+ou qualquer Executor, como um ProcessPoolExecutor) e devolve os resultados por
+uma fila que a thread principal lê a cada `poll_ms` com `root.after`; os
+callbacks `on_done` / `on_error` sempre rodam na thread do Tk. O erro de uma
+tarefa sem `on_error` (ou de um callback) vai para
+`root.report_callback_exception`, como nos callbacks do próprio Tk, e não
+interrompe a entrega das demais.
+
+Cada tarefa tem uma chave. Enviar outra tarefa com a mesma chave cancela a
+anterior: se ela ainda não começou, nem chega a rodar; se já está rodando, o
+resultado é descartado, e a função pode parar antes consultando `task.cancelled`
+(quando enviada com `progress=True`, ela recebe a tarefa como primeiro argumento
+e também pode informar o andamento com `task.report(fração)`, que interrompe a
+função com CancelledError se a tarefa foi cancelada). Como a tarefa não pode ser
+enviada a outro processo, `progress=True` exige o pool de threads.
+"""
+
+import queue
+import threading
+import traceback
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+
+class Task:
+    """
+    Uma execução enviada ao BackgroundRunner.
+
+    Atributos:
+      key (str): Chave da tarefa; uma nova tarefa com a mesma chave a substitui.
+      progress (float | None): Última fração (0 a 1) informada pela função.
+    """
+
+    __slots__ = ('key', 'progress', 'future', '_cancelled', '_events')
+
+    def __init__(self, key: str, events) -> None:
+        self.key = key
+        self.progress = None
+        self.future = None
+        self._cancelled = threading.Event()
+        self._events = events
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def report(self, fraction: float) -> None:
+        """ Informa o andamento (chamado pela função, em qualquer thread). """
+        if self.cancelled:
+            raise CancelledError(f"Tarefa {self.key!r} cancelada")
+        self._events.put((self, 'progress', fraction))
+
+
+class BackgroundRunner:
+    """
+    Pool de execução com resultados entregues na thread do Tk.
+
+    `on_busy(ocupado, andamento)` é chamado quando o conjunto de tarefas
+    pendentes muda, para mostrar um indicador de progresso; `andamento` é a
+    fração informada pela tarefa mais recente, ou None se nenhuma informou.
+    """
+
+    def __init__(self, root, executor=None, workers: int = 2, poll_ms: int = 50, on_busy=None) -> None:
+        self.root = root
+        self.executor = executor or ThreadPoolExecutor(max_workers=workers)
+        self.poll_ms = poll_ms
+        self.on_busy = on_busy
+        self._events = queue.Queue()
+        self._tasks = {}
+        self._callbacks = {}
+        self._polling = False
+
+    def submit(self, key: str, function, *args, on_done=None, on_error=None, progress: bool = False) -> Task:
+        """ Roda `function(*args)` em segundo plano, cancelando a tarefa anterior com a mesma chave. """
+        self.cancel(key)
+        task = Task(key, self._events)
+        if progress:
+            args = (task, *args)
+        self._tasks[key] = task
+        self._callbacks[task] = (on_done, on_error)
+        task.future = self.executor.submit(function, *args)
+        task.future.add_done_callback(lambda future: self._events.put((task, 'done', future)))
+        self._notify()
+        self._schedule()
+        return task
+
+    def cancel(self, key: str) -> None:
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+            self._callbacks.pop(task, None)
+            self._notify()
+
+    def cancel_all(self) -> None:
+        for key in list(self._tasks):
+            self.cancel(key)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._tasks)
+
+    def shutdown(self) -> None:
+        self.cancel_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule(self) -> None:
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self) -> None:
+        self._polling = False
+        while True:
+            try:
+                task, kind, value = self._events.get_nowait()
+            except queue.Empty:
+                break
+            # Tarefas canceladas ou substituídas não entregam nada.
+            if task.cancelled or self._tasks.get(task.key) is not task:
+                continue
+            if kind == 'progress':
+                task.progress = value
+                self._notify()
+                continue
+
+            del self._tasks[task.key]
+            on_done, on_error = self._callbacks.pop(task)
+            self._notify()
+            try:
+                error = value.exception()
+                if error is None:
+                    if on_done is not None:
+                        on_done(value.result())
+                elif on_error is not None:
+                    on_error(error)
+                else:
+                    raise error
+            except Exception as error:
+                self._report(error)
+
+        if self._tasks:
+            self._schedule()
+
+    def _report(self, error: Exception) -> None:
+        report = getattr(self.root, 'report_callback_exception', None)
+        if report is not None:
+            report(type(error), error, error.__traceback__)
+        else:
+            traceback.print_exception(type(error), error, error.__traceback__)
+
+    def _notify(self) -> None:
+        if self.on_busy is None:
+            return
+        fractions = [task.progress for task in self._tasks.values() if task.progress is not None]
+        self.on_busy(self.busy, fractions[-1] if fractions else None)
@@ -0,0 +1,51 @@
+""" Grafo CSR com nomes de nós
+
+Versão da `CSRAdjacency` (MinimumSpanningTree.csr) para grafos cujos nós têm
+nomes, como os do networkx: os nós viram índices 0..n-1 e os nomes ficam em
+`nodes` (índice -> nome) e `index` (nome -> índice). Os algoritmos de caminho
+trabalham só com os índices e os vetores contíguos.
+"""
+
+from array import array
+
+from MinimumSpanningTree.csr import CSRAdjacency, build_csr
+
+
+class CSRGraph(CSRAdjacency):
+    """
+    Atributos (além de offsets, targets e weights):
+      nodes (list): Nome de cada nó.
+      index (dict): Índice de cada nome.
+    """
+
+    __slots__ = ('nodes', 'index')
+
+    def __init__(self, offsets, targets, weights, nodes=None) -> None:
+        super().__init__(offsets, targets, weights)
+        self.nodes = list(range(len(offsets) - 1)) if nodes is None else list(nodes)
+        self.index = {node: position for position, node in enumerate(self.nodes)}
+
+    @classmethod
+    def from_networkx(cls, graph, weight: str = 'weight', default_weight: float = 1.0) -> 'CSRGraph':
+        """ Converte um nx.Graph (não direcionado); arestas sem peso valem `default_weight`. """
+        nodes = list(graph)
+        index = {node: position for position, node in enumerate(nodes)}
+        offsets = array('q', [0])
+        targets = array('i')
+        weights = array('d')
+        for node in nodes:
+            for neighbor, attributes in graph.adj[node].items():
+                targets.append(index[neighbor])
+                weights.append(attributes.get(weight, default_weight))
+            offsets.append(len(targets))
+        return cls(offsets, targets, weights, nodes)
+
+    @classmethod
+    def from_edges(cls, vertex_quantity: int, edges, nodes=None) -> 'CSRGraph':
+        """ Constrói a partir de uma lista de arestas (ex.: lida por MinimumSpanningTree.loader). """
+        csr = build_csr(vertex_quantity, edges)
+        return cls(csr.offsets, csr.targets, csr.weights, nodes)
+
+    @property
+    def edge_quantity(self) -> int:
+        return len(self.targets) // 2
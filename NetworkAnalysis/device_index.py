@@ -0,0 +1,40 @@
+""" Busca de dispositivos por prefixo para os comboboxes
+
+Colocar dezenas de milhares de nomes em `values` de um ttk.Combobox deixa a
+interface lenta. O DeviceIndex mantém os nomes ordenados (sem diferenciar
+maiúsculas) e devolve só os primeiros que começam com o texto digitado, com
+busca binária.
+"""
+
+from bisect import bisect_left
+
+# Quantidade máxima de nomes exibidos na lista do combobox.
+SUGGESTION_LIMIT = 200
+
+
+class DeviceIndex:
+    """
+    Atributos:
+      names (list): Nomes ordenados pela chave em minúsculas.
+      keys (list): Nomes em minúsculas, na mesma ordem.
+    """
+
+    __slots__ = ('names', 'keys')
+
+    def __init__(self, names=()) -> None:
+        self.names = sorted(map(str, names), key=str.casefold)
+        self.keys = [name.casefold() for name in self.names]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(self, text: str, limit: int = SUGGESTION_LIMIT) -> list:
+        """ Até `limit` nomes que começam com `text` (todos do início se vazio). """
+        prefix = text.casefold()
+        start = bisect_left(self.keys, prefix)
+        matches = []
+        for position in range(start, min(start + limit, len(self.keys))):
+            if not self.keys[position].startswith(prefix):
+                break
+            matches.append(self.names[position])
+        return matches
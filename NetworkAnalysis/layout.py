@@ -0,0 +1,192 @@
+""" Layout da rede com cache e atualização incremental
+
+O `nx.spring_layout` sem semente recalcula tudo a cada desenho e muda a figura
+toda vez. Aqui:
+
+  - LayoutCache guarda as posições da última versão da topologia; redesenhar a
+    mesma versão não recalcula nada.
+  - incremental_layout parte das posições anteriores quando a topologia muda:
+    nós que já existiam ficam onde estavam, nós novos nascem perto dos vizinhos,
+    e poucas iterações bastam para acomodar a mudança.
+  - force_layout é um Fruchterman–Reingold vetorizado com NumPy para grafos
+    grandes. A repulsão entre todos os pares (O(V²)) é aproximada numa grade
+    (método partícula-malha): as massas são distribuídas nas células e a
+    convolução com o campo de repulsão é feita por FFT, em O(V + G² log G) por
+    iteração para uma grade G × G. Com 10 mil nós o layout sai em poucos segundos.
+
+Acima de FORCE_LAYOUT_MIN_NODES nós, incremental_layout usa force_layout; abaixo,
+o spring_layout do networkx com semente fixa.
+"""
+
+import networkx as nx
+import numpy as np
+
+from NetworkAnalysis.csr_graph import CSRGraph
+
+FORCE_LAYOUT_MIN_NODES = 1000
+
+# Iterações do layout completo e do ajuste depois de uma mudança pequena.
+FULL_ITERATIONS = 50
+INCREMENTAL_ITERATIONS = 15
+
+# Intensidade da atração para o centro de um nó isolado (dividida por grau + 1).
+GRAVITY = 2
+
+
+def _edge_endpoints(graph: CSRGraph):
+    """ Cada aresta uma única vez, como dois vetores de índices. """
+    offsets = np.asarray(graph.offsets, dtype=np.int64)
+    targets = np.asarray(graph.targets, dtype=np.int64)
+    sources = np.repeat(np.arange(graph.vertex_quantity), np.diff(offsets))
+    once = sources < targets
+    return sources[once], targets[once]
+
+
+def _repulsion_kernel(cells: int):
+    """
+    Transformadas do campo de repulsão de uma massa unitária, (dx, dy) / d², numa
+    grade 2·cells × 2·cells com espaçamento 1 (o preenchimento evita que a
+    convolução circular dê a volta).
+    """
+    size = 2 * cells
+    offset = np.fft.fftfreq(size, 1 / size)
+    dx, dy = np.meshgrid(offset, offset, indexing='ij')
+    distance2 = dx ** 2 + dy ** 2
+    distance2[0, 0] = np.inf
+    return np.fft.rfft2(dx / distance2), np.fft.rfft2(dy / distance2)
+
+
+def _repulsion(positions, cells: int, kernel, k: float):
+    """
+    Deslocamento de repulsão de cada nó pelo método partícula-malha: as massas
+    vão para a célula mais próxima da grade, a convolução com o campo de uma
+    massa unitária é feita por FFT e cada nó lê a força da sua célula. Dentro da
+    célula, a repulsão vem do centro de massa dos outros nós dela.
+    """
+    low = positions.min(axis=0)
+    spacing = float((positions.max(axis=0) - low).max()) / (cells - 1) or 1.0
+    cell_xy = np.clip(np.rint((positions - low) / spacing).astype(np.int64), 0, cells - 1)
+    cell = cell_xy[:, 0] * cells + cell_xy[:, 1]
+
+    size = 2 * cells
+    density = np.bincount(cell, minlength=cells * cells).reshape(cells, cells)
+    transform = np.fft.rfft2(density, s=(size, size))
+    kernel_x, kernel_y = kernel
+    # O campo de uma massa cai com 1/d: com espaçamento h, divide-se por h.
+    force_x = np.fft.irfft2(transform * kernel_x, s=(size, size))[:cells, :cells].ravel()
+    force_y = np.fft.irfft2(transform * kernel_y, s=(size, size))[:cells, :cells].ravel()
+    far = np.stack((force_x[cell], force_y[cell]), axis=1) / spacing
+
+    # A grade não separa nós da mesma célula: cada um é repelido pelo centro de
+    # massa dos outros nós da sua célula.
+    mass = density.ravel()[cell]
+    others = (mass - 1).astype(np.float64)
+    cell_sum = np.stack((np.bincount(cell, positions[:, 0], cells * cells)[cell],
+                         np.bincount(cell, positions[:, 1], cells * cells)[cell]), axis=1)
+    delta = positions - (cell_sum - positions) / np.maximum(others, 1)[:, None]
+    near = delta * (others / ((delta ** 2).sum(axis=1) + (spacing / 100) ** 2))[:, None]
+    return k * k * (far + near)
+
+
+def force_layout(graph: CSRGraph, positions=None, iterations: int = FULL_ITERATIONS, seed=None,
+                 cells=None, temperature: float = 0.1) -> np.ndarray:
+    """
+    Posições (V × 2, em [-1, 1]) por Fruchterman–Reingold com repulsão em grade.
+
+    `positions` é o ponto de partida (aleatório com `seed` se omitido) e
+    `temperature`, o maior deslocamento por iteração no início (cai linearmente).
+    """
+    vertex_quantity = graph.vertex_quantity
+    rng = np.random.default_rng(seed)
+    if positions is None:
+        positions = rng.random((vertex_quantity, 2))
+    positions = np.array(positions, dtype=np.float64)
+    if vertex_quantity < 2:
+        return positions * 0
+
+    cells = cells or int(np.clip(2 * np.sqrt(vertex_quantity), 32, 256))
+    kernel = _repulsion_kernel(cells)
+    src, dst = _edge_endpoints(graph)
+    # Escala do layout: normaliza para a caixa unitária antes de começar.
+    positions -= positions.min(axis=0)
+    positions /= float(positions.max()) or 1.0
+    k = np.sqrt(1.0 / vertex_quantity)
+    gravity = GRAVITY / (np.diff(np.asarray(graph.offsets, dtype=np.int64)) + 1)
+
+    for iteration in range(iterations):
+        displacement = _repulsion(positions, cells, kernel, k)
+        delta = positions[src] - positions[dst]
+        distance = np.sqrt((delta ** 2).sum(axis=1))
+        pull = delta * (distance / k)[:, None]
+        for axis in range(2):
+            displacement[:, axis] -= np.bincount(src, pull[:, axis], vertex_quantity)
+            displacement[:, axis] += np.bincount(dst, pull[:, axis], vertex_quantity)
+        # Gravidade de intensidade constante para o centro, mais fraca em nós de
+        # grau alto: sem ela, nós isolados e componentes pequenos são empurrados
+        # para longe e achatam o resto da figura.
+        offset = positions - positions.mean(axis=0)
+        displacement -= (gravity / np.maximum(np.sqrt((offset ** 2).sum(axis=1)), 1e-12))[:, None] * offset
+
+        limit = temperature * (1 - iteration / iterations)
+        length = np.sqrt((displacement ** 2).sum(axis=1))
+        positions += displacement * (np.minimum(length, limit) / np.maximum(length, 1e-12))[:, None]
+
+    return nx.rescale_layout(positions)
+
+
+def _initial_positions(graph, nodes, previous, rng):
+    """ Posições anteriores; nós novos vão para a média dos vizinhos já posicionados. """
+    positions = {node: np.asarray(previous[node], dtype=np.float64) for node in nodes if node in previous}
+    for node in nodes:
+        if node in positions:
+            continue
+        placed = [positions[neighbor] for neighbor in graph.adj[node] if neighbor in positions]
+        center = np.mean(placed, axis=0) if placed else rng.uniform(-1, 1, 2)
+        positions[node] = center + rng.normal(0, 0.05, 2)
+    return positions
+
+
+def incremental_layout(graph, previous=None, seed: int = 0,
+                       threshold: int = FORCE_LAYOUT_MIN_NODES) -> dict:
+    """
+    Posições {nó: (x, y)} para um nx.Graph, partindo de `previous` (posições de
+    uma versão anterior) quando houver.
+    """
+    nodes = list(graph)
+    if not nodes:
+        return {}
+    rng = np.random.default_rng(seed)
+    initial = _initial_positions(graph, nodes, previous, rng) if previous else None
+    iterations = INCREMENTAL_ITERATIONS if initial else FULL_ITERATIONS
+
+    if len(nodes) < threshold:
+        return nx.spring_layout(graph, pos=initial, iterations=iterations, seed=seed)
+
+    csr = CSRGraph.from_networkx(graph)
+    start = np.array([initial[node] for node in nodes]) if initial else None
+    # Partindo de um layout pronto, a temperatura menor evita desmanchar a figura.
+    temperature = 0.02 if initial else 0.1
+    positions = force_layout(csr, start, iterations, seed, temperature=temperature)
+    return dict(zip(nodes, positions))
+
+
+class LayoutCache:
+    """
+    Posições da última versão da topologia desenhada.
+
+    Atributos:
+      version: Versão da topologia das posições guardadas.
+      positions (dict | None): Posições {nó: (x, y)}.
+    """
+
+    def __init__(self) -> None:
+        self.version = None
+        self.positions = None
+
+    def lookup(self, version):
+        """ Posições guardadas se forem desta versão, senão None. """
+        return self.positions if self.positions is not None and self.version == version else None
+
+    def store(self, version, positions) -> None:
+        self.version = version
+        self.positions = positions
@@ -0,0 +1,110 @@
+""" Serviço de caminhos mais curtos com cache
+
+Roda um único Dijkstra por origem e guarda a árvore de caminhos mais curtos
+resultante (distância e predecessor de cada nó). Qualquer consulta a partir da
+mesma origem é respondida pela árvore em O(tamanho do caminho), sem nova busca.
+
+As árvores ficam num cache LRU com no máximo `cache_size` origens. Quando a
+topologia muda (troca de cenário ou alteração de aresta), `invalidate()` descarta
+todas as árvores.
+"""
+
+import heapq
+from collections import OrderedDict
+from itertools import count
+
+import networkx as nx
+
+
+class ShortestPathService:
+    """
+    Consultas de caminho mais curto sobre um grafo do networkx.
+
+    Atributos:
+      graph (nx.Graph): Grafo consultado; os pesos ficam no atributo `weight`.
+      cache_size (int): Número máximo de árvores guardadas.
+      hits, misses (int): Consultas respondidas com e sem o cache.
+    """
+
+    def __init__(self, graph, cache_size: int = 128, weight: str = 'weight') -> None:
+        self.graph = graph
+        self.cache_size = cache_size
+        self.weight = weight
+        self.hits = 0
+        self.misses = 0
+        self._trees = OrderedDict()
+
+    def invalidate(self) -> None:
+        """ Descarta as árvores em cache; chamar sempre que a topologia mudar. """
+        self._trees.clear()
+
+    def dijkstra(self, source):
+        """ Distância e predecessor de cada nó alcançável a partir de `source`. """
+        weight = self.weight
+        adjacency = self.graph.adj
+        distances = {}
+        predecessors = {source: None}
+        seen = {source: 0}
+        tie_breaker = count()
+        heap = [(0, next(tie_breaker), source)]
+
+        while heap:
+            distance, _, node = heapq.heappop(heap)
+            if node in distances:
+                continue
+            distances[node] = distance
+            for neighbor, attributes in adjacency[node].items():
+                candidate = distance + attributes.get(weight, 1)
+                if neighbor not in distances and (neighbor not in seen or candidate < seen[neighbor]):
+                    seen[neighbor] = candidate
+                    predecessors[neighbor] = node
+                    heapq.heappush(heap, (candidate, next(tie_breaker), neighbor))
+
+        return distances, predecessors
+
+    def shortest_path_tree(self, source):
+        """ Árvore de caminhos mais curtos de `source`, do cache quando possível. """
+        if source not in self.graph:
+            raise nx.NodeNotFound(f"O nó {source} não está no grafo")
+
+        tree = self._trees.get(source)
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(source)
+            return tree
+
+        self.misses += 1
+        tree = self.dijkstra(source)
+        self._trees[source] = tree
+        if len(self._trees) > self.cache_size:
+            self._trees.popitem(last=False)
+        return tree
+
+    def query(self, source, target):
+        """
+        Caminho mais curto e distância total de `source` até `target`.
+
+        Lança nx.NetworkXNoPath quando não há caminho.
+        """
+        if target not in self.graph:
+            raise nx.NodeNotFound(f"O nó {target} não está no grafo")
+        distances, predecessors = self.shortest_path_tree(source)
+        if target not in distances:
+            raise nx.NetworkXNoPath(f"Não há caminho entre {source} e {target}")
+
+        path = []
+        node = target
+        while node is not None:
+            path.append(node)
+            node = predecessors[node]
+        path.reverse()
+        return path, distances[target]
+
+    def set_edge(self, start, end, weight) -> None:
+        """ Adiciona a aresta ou troca o seu peso. """
+        self.graph.add_edge(start, end, **{self.weight: weight})
+        self.invalidate()
+
+    def remove_edge(self, start, end) -> None:
+        self.graph.remove_edge(start, end)
+        self.invalidate()
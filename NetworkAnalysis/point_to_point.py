@@ -0,0 +1,330 @@
+""" Consultas ponto a ponto: Dijkstra bidirecional e A* com landmarks (ALT)
+
+Para responder "qual o caminho de s até t" num grafo grande não é preciso
+calcular a árvore inteira de s. Três modos, todos sobre uma CSRGraph:
+
+  - "dijkstra": Dijkstra de s que para assim que t é fixado.
+  - "bidirectional": duas buscas, de s e de t, alternando pela menor fronteira;
+    para quando a soma dos topos das duas filas não melhora o melhor caminho.
+  - "alt": A* cuja heurística vem de distâncias pré-calculadas a alguns nós
+    "landmark" L. Pela desigualdade triangular, d(v, t) >= |d(L, t) - d(L, v)|,
+    e o maior desses limites entre os landmarks é admissível e consistente.
+
+Cada consulta informa quantos nós foram fixados ("settled"), que mede a poda em
+relação ao Dijkstra completo.
+
+Comparação no grafo do Facebook (facebook_combined.txt.gz):
+
+    python -m NetworkAnalysis.point_to_point facebook_combined.txt.gz --queries 200
+"""
+
+import argparse
+import heapq
+import math
+import random
+import timeit
+
+import networkx as nx
+import numpy as np
+
+from NetworkAnalysis.csr_graph import CSRGraph
+from NetworkAnalysis.routing_table import dijkstra_row
+
+# Distância usada no lugar de inf nas tabelas dos landmarks: mantém |a - b| = 0
+# quando os dois nós são inalcançáveis e evita inf - inf.
+UNREACHABLE = 1e300
+
+METHODS = ("dijkstra", "bidirectional", "alt")
+
+
+class QueryResult:
+    """
+    Resultado de uma consulta ponto a ponto (índices da CSR).
+
+    Atributos:
+      path (list): Nós do caminho, de source até target; vazio sem caminho.
+      distance (float): Distância total; inf sem caminho.
+      settled (int): Nós fixados pela busca.
+      method (str): Modo usado.
+    """
+
+    __slots__ = ('path', 'distance', 'settled', 'method')
+
+    def __init__(self, path, distance, settled, method) -> None:
+        self.path = path
+        self.distance = distance
+        self.settled = settled
+        self.method = method
+
+    def __repr__(self) -> str:
+        return (f"QueryResult(method={self.method!r}, distance={self.distance}, "
+                f"hops={max(len(self.path) - 1, 0)}, settled={self.settled})")
+
+
+def _walk(predecessors, node):
+    """ Nós de `node` até a raiz seguindo os predecessores (na ordem da caminhada). """
+    path = []
+    while node is not None:
+        path.append(node)
+        node = predecessors[node]
+    return path
+
+
+def dijkstra(graph: CSRGraph, source: int, target: int) -> QueryResult:
+    """ Dijkstra de `source` que para ao fixar `target`. """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    best = {source: 0.0}
+    predecessors = {source: None}
+    settled = set()
+    heap = [(0.0, source)]
+
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        settled.add(node)
+        if node == target:
+            path = _walk(predecessors, target)
+            path.reverse()
+            return QueryResult(path, distance, len(settled), "dijkstra")
+        for position in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[position]
+            candidate = distance + weights[position]
+            if candidate < best.get(neighbor, UNREACHABLE):
+                best[neighbor] = candidate
+                predecessors[neighbor] = node
+                heapq.heappush(heap, (candidate, neighbor))
+
+    return QueryResult([], float('inf'), len(settled), "dijkstra")
+
+
+def bidirectional_dijkstra(graph: CSRGraph, source: int, target: int) -> QueryResult:
+    """
+    Dijkstra a partir das duas pontas. O grafo é não direcionado, então a busca
+    reversa usa a mesma CSR.
+    """
+    if source == target:
+        return QueryResult([source], 0.0, 1, "bidirectional")
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    best = ({source: 0.0}, {target: 0.0})
+    predecessors = ({source: None}, {target: None})
+    settled = (set(), set())
+    heaps = ([(0.0, source)], [(0.0, target)])
+    shortest = float('inf')
+    meeting = None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= shortest:
+            break
+        # Avança a direção com a menor fronteira.
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        distance, node = heapq.heappop(heaps[side])
+        if node in settled[side]:
+            continue
+        settled[side].add(node)
+
+        side_best, other_best = best[side], best[1 - side]
+        side_predecessors = predecessors[side]
+        for position in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[position]
+            candidate = distance + weights[position]
+            if candidate < side_best.get(neighbor, UNREACHABLE):
+                side_best[neighbor] = candidate
+                side_predecessors[neighbor] = node
+                heapq.heappush(heaps[side], (candidate, neighbor))
+            if neighbor in other_best:
+                total = side_best[neighbor] + other_best[neighbor]
+                if total < shortest:
+                    shortest = total
+                    meeting = neighbor
+
+    settled_count = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return QueryResult([], float('inf'), settled_count, "bidirectional")
+    path = _walk(predecessors[0], meeting)
+    path.reverse()
+    path.extend(_walk(predecessors[1], meeting)[1:])
+    return QueryResult(path, shortest, settled_count, "bidirectional")
+
+
+class Landmarks:
+    """
+    Distâncias de alguns landmarks a todos os nós, usadas como heurística do A*.
+
+    Atributos:
+      nodes (list): Índices dos landmarks.
+      distances (list): Uma lista por landmark com a distância a cada nó
+        (UNREACHABLE quando não há caminho).
+    """
+
+    __slots__ = ('nodes', 'distances')
+
+    def __init__(self, nodes, distances) -> None:
+        self.nodes = nodes
+        self.distances = distances
+
+    @classmethod
+    def farthest(cls, graph: CSRGraph, count: int = 8, seed=None) -> 'Landmarks':
+        """
+        Escolha "farthest": o primeiro landmark é sorteado e cada próximo é o nó
+        mais distante dos já escolhidos (nós em outros componentes entram primeiro,
+        assim cada componente ganha um landmark).
+        """
+        vertex_quantity = graph.vertex_quantity
+        count = min(count, vertex_quantity)
+        nodes, distances = [], []
+        nearest = np.full(vertex_quantity, np.inf)
+        candidate = random.Random(seed).randrange(vertex_quantity) if vertex_quantity else None
+
+        for _ in range(count):
+            distance, _ = dijkstra_row(graph, candidate)
+            nodes.append(candidate)
+            distances.append(np.where(np.isfinite(distance), distance, UNREACHABLE).tolist())
+            nearest = np.minimum(nearest, distance)
+            nearest[candidate] = -1
+            candidate = int(np.argmax(nearest))
+            if nearest[candidate] <= 0:
+                break
+        return cls(nodes, distances)
+
+    def heuristic(self, target: int):
+        """ Função h(v), limite inferior de d(v, target); cada nó é calculado uma vez. """
+        pairs = [(distance, distance[target]) for distance in self.distances]
+        bounds = {}
+
+        def lower_bound(node: int) -> float:
+            bound = bounds.get(node)
+            if bound is None:
+                bound = 0.0
+                for distance, target_distance in pairs:
+                    difference = abs(target_distance - distance[node])
+                    if difference > bound:
+                        bound = difference
+                bounds[node] = bound
+            return bound
+
+        return lower_bound
+
+
+def alt_astar(graph: CSRGraph, source: int, target: int, landmarks: Landmarks) -> QueryResult:
+    """ A* de `source` até `target` com a heurística dos landmarks. """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    heuristic = landmarks.heuristic(target)
+    best = {source: 0.0}
+    predecessors = {source: None}
+    settled = set()
+    # Em empates de f, o nó mais distante da origem (mais perto do destino) sai
+    # primeiro: a chave guarda -g.
+    heap = [(heuristic(source), -0.0, source)]
+
+    while heap:
+        _, distance, node = heapq.heappop(heap)
+        distance = -distance
+        if node in settled:
+            continue
+        settled.add(node)
+        if node == target:
+            path = _walk(predecessors, target)
+            path.reverse()
+            return QueryResult(path, distance, len(settled), "alt")
+        for position in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[position]
+            candidate = distance + weights[position]
+            if candidate < best.get(neighbor, UNREACHABLE):
+                best[neighbor] = candidate
+                predecessors[neighbor] = node
+                heapq.heappush(heap, (candidate + heuristic(neighbor), -candidate, neighbor))
+
+    return QueryResult([], float('inf'), len(settled), "alt")
+
+
+class PointToPointRouter:
+    """
+    Consultas ponto a ponto por nome de nó sobre uma CSRGraph.
+
+    Os landmarks só são calculados na primeira consulta "alt".
+    """
+
+    def __init__(self, graph: CSRGraph, landmark_count: int = 8, seed=None) -> None:
+        self.graph = graph
+        self.landmark_count = landmark_count
+        self.seed = seed
+        self._landmarks = None
+
+    @classmethod
+    def from_networkx(cls, graph, weight: str = 'weight', **options) -> 'PointToPointRouter':
+        return cls(CSRGraph.from_networkx(graph, weight), **options)
+
+    @property
+    def landmarks(self) -> Landmarks:
+        if self._landmarks is None:
+            self._landmarks = Landmarks.farthest(self.graph, self.landmark_count, self.seed)
+        return self._landmarks
+
+    def query_index(self, source: int, target: int, method: str = 'bidirectional') -> QueryResult:
+        if method == 'dijkstra':
+            return dijkstra(self.graph, source, target)
+        if method == 'bidirectional':
+            return bidirectional_dijkstra(self.graph, source, target)
+        if method == 'alt':
+            return alt_astar(self.graph, source, target, self.landmarks)
+        raise ValueError(f"Modo de consulta desconhecido: {method!r}")
+
+    def query(self, source, target, method: str = 'bidirectional'):
+        """
+        Caminho (com os nomes dos nós), distância e resultado completo da busca.
+
+        Lança nx.NodeNotFound / nx.NetworkXNoPath como o ShortestPathService.
+        """
+        index = self.graph.index
+        for node in (source, target):
+            if node not in index:
+                raise nx.NodeNotFound(f"O nó {node} não está no grafo")
+        result = self.query_index(index[source], index[target], method)
+        if not result.path:
+            raise nx.NetworkXNoPath(f"Não há caminho entre {source} e {target}")
+        nodes = self.graph.nodes
+        return [nodes[node] for node in result.path], result.distance, result
+
+
+def main(argv=None):
+    from MinimumSpanningTree.loader import load_csr
+
+    parser = argparse.ArgumentParser(description="Compara os modos de consulta ponto a ponto")
+    parser.add_argument("edge_list", help="lista de arestas (texto, opcionalmente .gz)")
+    parser.add_argument("--weight-column", type=int, help="coluna dos pesos (padrão: peso 1)")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--landmarks", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    csr, vertex_ids, stats = load_csr(args.edge_list, args.weight_column, remap=True)
+    graph = CSRGraph(csr.offsets, csr.targets, csr.weights, vertex_ids)
+    print(f"{graph.vertex_quantity} nós, {graph.edge_quantity} arestas")
+
+    router = PointToPointRouter(graph, args.landmarks, args.seed)
+    start_time = timeit.default_timer()
+    router.landmarks
+    print(f"{len(router.landmarks.nodes)} landmarks em {timeit.default_timer() - start_time:.3f}s")
+
+    rng = random.Random(args.seed)
+    pairs = [(rng.randrange(graph.vertex_quantity), rng.randrange(graph.vertex_quantity))
+             for _ in range(args.queries)]
+    reference = None
+    for method in METHODS:
+        start_time = timeit.default_timer()
+        results = [router.query_index(source, target, method) for source, target in pairs]
+        elapsed = timeit.default_timer() - start_time
+        distances = [result.distance for result in results]
+        if reference is None:
+            reference = distances
+        elif not all(math.isclose(a, b) for a, b in zip(distances, reference)):
+            raise AssertionError(f"{method} encontrou distâncias diferentes do Dijkstra")
+        settled = sum(result.settled for result in results) / len(results)
+        print(f"{method:<14} {elapsed / len(results) * 1000:8.3f} ms/consulta "
+              f"{settled:10.1f} nós fixados em média")
+
+
+if __name__ == "__main__":
+    main()
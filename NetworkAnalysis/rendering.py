@@ -0,0 +1,93 @@
+""" Desenho da topologia em lote, com nível de detalhe
+
+Desenhar cada tipo de dispositivo com uma chamada do networkx e todos os rótulos
+de aresta trava o matplotlib em topologias com milhares de arestas. Aqui:
+
+  - todas as arestas vão numa única LineCollection;
+  - todos os nós num único scatter, com a cor de cada nó;
+  - rótulos dos nós e pesos das arestas só são desenhados para o que está
+    visível, e só quando a quantidade visível é pequena (rede pequena ou zoom).
+    A cada zoom/arrasto os rótulos são refeitos para a nova área.
+"""
+
+import numpy as np
+from matplotlib.collections import LineCollection
+
+DEVICE_COLORS = {'router': 'red', 'switch': 'green', 'server': 'blue'}
+
+# Máximo de rótulos de nós / pesos de arestas desenhados de uma vez.
+NODE_LABEL_LIMIT = 150
+EDGE_LABEL_LIMIT = 100
+
+
+def node_size(node_quantity: int) -> float:
+    """ Tamanho dos marcadores: 500 em redes pequenas, menor conforme a rede cresce. """
+    return float(np.clip(50000 / max(node_quantity, 1), 4, 500))
+
+
+class TopologyRenderer:
+    """
+    Desenha um nx.Graph num Axes e mantém os rótulos de acordo com a área visível.
+
+    Atributos:
+      nodes (list): Nós na ordem das posições.
+      positions (np.ndarray): Posições V × 2.
+      edges (np.ndarray): Índices (u, v) de cada aresta.
+      weights (list): Peso de cada aresta (None se não tiver).
+    """
+
+    def __init__(self, ax, graph, pos, weight: str = 'weight', node_label_limit: int = NODE_LABEL_LIMIT,
+                 edge_label_limit: int = EDGE_LABEL_LIMIT) -> None:
+        self.ax = ax
+        self.nodes = list(graph)
+        index = {node: position for position, node in enumerate(self.nodes)}
+        self.positions = np.array([pos[node] for node in self.nodes], dtype=np.float64).reshape(-1, 2)
+        self.edges = np.array([(index[u], index[v]) for u, v in graph.edges()], dtype=np.int64).reshape(-1, 2)
+        self.weights = [attributes.get(weight) for _, _, attributes in graph.edges(data=True)]
+        self.node_label_limit = node_label_limit
+        self.edge_label_limit = edge_label_limit
+        self._labels = []
+
+        colors = [DEVICE_COLORS.get(graph.nodes[node].get('type', 'server'), 'blue') for node in self.nodes]
+        segments = self.positions[self.edges]
+        ax.add_collection(LineCollection(segments, colors='gray', linewidths=1, zorder=1))
+        ax.scatter(self.positions[:, 0], self.positions[:, 1], s=node_size(len(self.nodes)),
+                   c=colors, zorder=2)
+        ax.autoscale_view()
+        # O matplotlib guarda métodos só por referência fraca; a função mantém o
+        # renderizador vivo enquanto o Axes existir.
+        ax.callbacks.connect('xlim_changed', lambda changed: self._limits_changed(changed))
+        ax.callbacks.connect('ylim_changed', lambda changed: self._limits_changed(changed))
+        self.update_labels()
+
+    def _limits_changed(self, ax) -> None:
+        self.update_labels()
+        ax.figure.canvas.draw_idle()
+
+    def update_labels(self) -> None:
+        """ Refaz os rótulos para os nós e arestas dentro da área visível. """
+        for label in self._labels:
+            label.remove()
+        self._labels = []
+
+        (x_min, x_max), (y_min, y_max) = self.ax.get_xlim(), self.ax.get_ylim()
+        x, y = self.positions[:, 0], self.positions[:, 1]
+        visible = (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+        shown = np.flatnonzero(visible)
+        if len(shown) <= self.node_label_limit:
+            for node in shown.tolist():
+                self._labels.append(self.ax.text(x[node], y[node], str(self.nodes[node]), fontsize=9,
+                                                 ha='center', va='center', color='white', zorder=3,
+                                                 clip_on=True))
+
+        if not len(self.edges):
+            return
+        shown_edges = np.flatnonzero(visible[self.edges[:, 0]] & visible[self.edges[:, 1]])
+        if len(shown_edges) <= self.edge_label_limit:
+            middle = self.positions[self.edges].mean(axis=1)
+            for edge in shown_edges.tolist():
+                if self.weights[edge] is None:
+                    continue
+                self._labels.append(self.ax.text(middle[edge, 0], middle[edge, 1], str(self.weights[edge]),
+                                                 fontsize=8, ha='center', va='center', zorder=3, clip_on=True,
+                                                 bbox={'boxstyle': 'round', 'fc': 'white', 'ec': 'none'}))
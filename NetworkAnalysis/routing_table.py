@@ -0,0 +1,240 @@
+""" Tabela de rotas pré-calculada (todos os pares)
+
+Para topologias de centenas de dispositivos vale a pena calcular de uma vez a
+distância entre todos os pares de nós e o próximo salto de cada rota. Depois
+disso, qualquer consulta de caminho é só seguir a tabela de próximos saltos.
+
+A tabela fica em duas matrizes V×V compactas:
+
+  - distance (float32): distância mínima; inf quando não há caminho.
+  - next_hop (int32): índice do próximo nó na rota de i até j; -1 sem caminho.
+
+Duas formas de construção:
+
+  - "floyd_warshall": Floyd–Warshall vetorizado com NumPy, O(V³) em operações
+    de matriz; bom para topologias pequenas e densas.
+  - "dijkstra": um Dijkstra por origem sobre a CSR, distribuído entre processos.
+
+Quando o peso de uma única aresta muda, `update_edge` atualiza a tabela sem
+refazê-la: uma redução de peso é propagada em O(V²) com operações vetorizadas, e
+um aumento (ou remoção) recalcula só as origens cujas rotas usavam a aresta.
+"""
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+import numpy as np
+
+from NetworkAnalysis.csr_graph import CSRGraph
+
+# Até este número de nós, "auto" usa Floyd–Warshall.
+FLOYD_WARSHALL_MAX_NODES = 500
+
+# Múltiplo do épsilon do float32 tolerado ao comparar distâncias da tabela.
+ROUNDING_MARGIN = 8
+
+# CSR usada pelos processos do pool (preenchida por _set_worker_graph).
+_worker_graph = None
+
+
+def dijkstra_row(graph: CSRGraph, source: int):
+    """ Distância e primeiro salto de `source` até cada nó. """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    vertex_quantity = graph.vertex_quantity
+    distance = np.full(vertex_quantity, np.inf)
+    first_hop = np.full(vertex_quantity, -1, dtype=np.int32)
+    settled = bytearray(vertex_quantity)
+    best = {source: 0.0}
+    hops = {source: source}
+    heap = [(0.0, source)]
+
+    while heap:
+        node_distance, node = heapq.heappop(heap)
+        if settled[node]:
+            continue
+        settled[node] = 1
+        distance[node] = node_distance
+        first_hop[node] = hops[node]
+        for position in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[position]
+            candidate = node_distance + weights[position]
+            if not settled[neighbor] and candidate < best.get(neighbor, np.inf):
+                best[neighbor] = candidate
+                hops[neighbor] = neighbor if node == source else hops[node]
+                heapq.heappush(heap, (candidate, neighbor))
+
+    return distance, first_hop
+
+
+def _set_worker_graph(graph: CSRGraph) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _worker_rows(sources):
+    return [(source, *dijkstra_row(_worker_graph, source)) for source in sources]
+
+
+class RoutingTable:
+    """
+    Distâncias e próximos saltos entre todos os pares de nós.
+
+    Atributos:
+      nodes (list): Nome de cada nó (índice -> nome).
+      index (dict): Índice de cada nome.
+      distance (np.ndarray): Matriz V×V float32 de distâncias.
+      next_hop (np.ndarray): Matriz V×V int32 de próximos saltos.
+    """
+
+    def __init__(self, nodes, distance, next_hop) -> None:
+        self.nodes = list(nodes)
+        self.index = {node: position for position, node in enumerate(self.nodes)}
+        self.distance = distance.astype(np.float32, copy=False)
+        self.next_hop = next_hop.astype(np.int32, copy=False)
+
+    @classmethod
+    def build(cls, graph, method: str = 'auto', workers=None, weight: str = 'weight',
+              progress=None) -> 'RoutingTable':
+        """
+        Calcula a tabela para um nx.Graph. `progress(fração)`, se dado, é chamado
+        periodicamente com o andamento entre 0 e 1.
+        """
+        csr = CSRGraph.from_networkx(graph, weight)
+        if method == 'auto':
+            method = 'floyd_warshall' if csr.vertex_quantity <= FLOYD_WARSHALL_MAX_NODES else 'dijkstra'
+        if method == 'floyd_warshall':
+            distance, next_hop = floyd_warshall(csr, progress)
+        elif method == 'dijkstra':
+            distance, next_hop = all_pairs_dijkstra(csr, workers, progress)
+        else:
+            raise ValueError(f"Método desconhecido: {method!r}")
+        return cls(csr.nodes, distance, next_hop)
+
+    def __contains__(self, node) -> bool:
+        return node in self.index
+
+    def path(self, source, target):
+        """ Caminho e distância de `source` até `target`, seguindo os próximos saltos. """
+        for node in (source, target):
+            if node not in self.index:
+                raise nx.NodeNotFound(f"O nó {node} não está na tabela de rotas")
+        current, goal = self.index[source], self.index[target]
+        distance = self.distance[current, goal]
+        if not np.isfinite(distance):
+            raise nx.NetworkXNoPath(f"Não há caminho entre {source} e {target}")
+
+        path = [source]
+        next_hop = self.next_hop
+        while current != goal:
+            current = int(next_hop[current, goal])
+            path.append(self.nodes[current])
+        return path, distance.item()
+
+    def update_edge(self, graph, start, end, old_weight, new_weight, weight: str = 'weight') -> None:
+        """
+        Ajusta a tabela depois que o peso da aresta start-end mudou de `old_weight`
+        para `new_weight` em `graph` (use inf para aresta criada ou removida).
+        """
+        u, v = self.index[start], self.index[end]
+        if new_weight < old_weight:
+            self._decrease(u, v, new_weight)
+        elif new_weight > old_weight:
+            self._increase(graph, u, v, old_weight, weight)
+
+    def _decrease(self, u: int, v: int, weight: float) -> None:
+        distance = self.distance.astype(np.float64)
+        next_hop = self.next_hop
+        for a, b in ((u, v), (v, u)):
+            # Rotas i -> a -> b -> j passando pela aresta barateada.
+            via = distance[:, a, None] + weight + distance[None, b, :]
+            better = via < distance
+            if not better.any():
+                continue
+            hop_to_a = next_hop[:, a].copy()
+            hop_to_a[a] = b
+            distance = np.where(better, via, distance)
+            next_hop = np.where(better, hop_to_a[:, None], next_hop)
+        self.distance = distance.astype(np.float32)
+        self.next_hop = next_hop.astype(np.int32, copy=False)
+
+    def _increase(self, graph, u: int, v: int, old_weight: float, weight: str) -> None:
+        to_u = self.distance[:, u].astype(np.float64)
+        to_v = self.distance[:, v].astype(np.float64)
+        # Origens em que a aresta fazia parte de alguma rota mínima. As distâncias
+        # guardadas em float32 têm erro proporcional ao seu tamanho, então a
+        # tolerância também é (com folga: incluir uma origem a mais só custa um
+        # Dijkstra).
+        tolerance = ROUNDING_MARGIN * np.finfo(np.float32).eps * (np.abs(to_u) + np.abs(to_v) + old_weight)
+        with np.errstate(invalid='ignore'):
+            uses_edge = ((np.abs(to_v - (to_u + old_weight)) <= tolerance) |
+                         (np.abs(to_u - (to_v + old_weight)) <= tolerance))
+        affected = np.flatnonzero(uses_edge & np.isfinite(to_u))
+        if not len(affected):
+            return
+
+        # As demais origens não usavam a aresta em nenhuma rota, então suas linhas
+        # continuam corretas.
+        csr = CSRGraph.from_networkx(graph, weight)
+        if csr.nodes != self.nodes:
+            raise ValueError("Os nós do grafo mudaram; reconstrua a tabela com RoutingTable.build")
+        for source in affected.tolist():
+            self.distance[source], self.next_hop[source] = dijkstra_row(csr, source)
+
+
+def floyd_warshall(graph: CSRGraph, progress=None):
+    """ Floyd–Warshall vetorizado: cada iteração relaxa a matriz inteira pelo nó k. """
+    vertex_quantity = graph.vertex_quantity
+    distance = np.full((vertex_quantity, vertex_quantity), np.inf)
+    next_hop = np.full((vertex_quantity, vertex_quantity), -1, dtype=np.int32)
+
+    offsets = np.asarray(graph.offsets, dtype=np.int64)
+    rows = np.repeat(np.arange(vertex_quantity), np.diff(offsets))
+    columns = np.asarray(graph.targets, dtype=np.int64)
+    weights = np.asarray(graph.weights, dtype=np.float64)
+    np.minimum.at(distance, (rows, columns), weights)
+    next_hop[rows, columns] = columns
+    diagonal = np.arange(vertex_quantity)
+    distance[diagonal, diagonal] = 0
+    next_hop[diagonal, diagonal] = diagonal
+
+    step = max(1, vertex_quantity // 100)
+    for k in range(vertex_quantity):
+        if progress is not None and k % step == 0:
+            progress(k / vertex_quantity)
+        via = distance[:, k, None] + distance[None, k, :]
+        better = via < distance
+        distance = np.where(better, via, distance)
+        next_hop = np.where(better, next_hop[:, k, None], next_hop)
+
+    return distance, next_hop
+
+
+def all_pairs_dijkstra(graph: CSRGraph, workers=None, progress=None):
+    """ Um Dijkstra por origem; as origens são divididas entre `workers` processos. """
+    vertex_quantity = graph.vertex_quantity
+    distance = np.empty((vertex_quantity, vertex_quantity), dtype=np.float32)
+    next_hop = np.empty((vertex_quantity, vertex_quantity), dtype=np.int32)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or vertex_quantity < 64:
+        step = max(1, vertex_quantity // 100)
+        for source in range(vertex_quantity):
+            if progress is not None and source % step == 0:
+                progress(source / vertex_quantity)
+            distance[source], next_hop[source] = dijkstra_row(graph, source)
+        return distance, next_hop
+
+    chunk_size = -(-vertex_quantity // (workers * 4))
+    chunks = [range(start, min(start + chunk_size, vertex_quantity))
+              for start in range(0, vertex_quantity, chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_set_worker_graph,
+                             initargs=(graph,)) as executor:
+        for done, rows in enumerate(executor.map(_worker_rows, chunks), start=1):
+            for source, row_distance, row_hop in rows:
+                distance[source] = row_distance
+                next_hop[source] = row_hop
+            if progress is not None:
+                progress(done / len(chunks))
+    return distance, next_hop
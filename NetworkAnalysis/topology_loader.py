@@ -0,0 +1,165 @@
+""" Leitura de topologias de rede a partir de arquivos
+
+Formatos aceitos (escolhidos pela extensão):
+
+  - JSON (.json): {"nodes": [{"id": "R1", "type": "router"}, ...],
+                   "edges": [{"source": "R1", "target": "SW1", "weight": 1}, ...]}
+    Também aceita "links" no lugar de "edges" (formato node-link do networkx) e
+    arestas como listas [origem, destino, peso].
+  - CSV (.csv): cabeçalho com source,target e, opcionalmente, weight,
+    source_type e target_type.
+  - Lista de arestas (qualquer outra extensão, .gz aceito): "origem destino [peso]"
+    por linha; '#' e '%' iniciam comentários.
+
+Os nomes dos nós viram texto (é o que a interface compara), nós sem tipo são
+"server" e arestas sem peso valem 1. Nós e arestas são lidos numa única passada e
+inseridos no grafo de uma vez só (add_nodes_from / add_weighted_edges_from).
+"""
+
+import argparse
+import csv
+import json
+import os
+import timeit
+import tracemalloc
+
+import networkx as nx
+
+from MinimumSpanningTree.loader import COMMENT_PREFIXES, open_edge_file
+
+DEFAULT_TYPE = 'server'
+DEFAULT_WEIGHT = 1
+
+
+class TopologyStats:
+    """
+    Estatísticas de uma leitura.
+
+    Atributos:
+      nodes (int): Número de dispositivos.
+      edges (int): Número de ligações.
+      seconds (float): Tempo total da leitura.
+      peak_memory (int | None): Pico de memória alocada durante a leitura, em bytes
+        (None quando a medição não foi pedida).
+    """
+
+    __slots__ = ('nodes', 'edges', 'seconds', 'peak_memory')
+
+    def __init__(self, nodes: int, edges: int, seconds: float, peak_memory=None) -> None:
+        self.nodes = nodes
+        self.edges = edges
+        self.seconds = seconds
+        self.peak_memory = peak_memory
+
+    def __str__(self) -> str:
+        text = f"{self.nodes} dispositivos, {self.edges} ligações em {self.seconds:.2f}s"
+        if self.peak_memory is not None:
+            text += f", pico de {self.peak_memory / 1e6:.1f} MB"
+        return text
+
+
+def _weight(value):
+    """ Peso lido do arquivo: int quando possível, para exibir "2" e não "2.0". """
+    if value is None or value == '':
+        return DEFAULT_WEIGHT
+    if isinstance(value, (int, float)):
+        return value
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def read_json(file):
+    data = json.load(file)
+    types = {str(node['id']): node.get('type', DEFAULT_TYPE) for node in data.get('nodes', ())}
+    edges = []
+    for edge in data.get('edges', data.get('links', ())):
+        if isinstance(edge, dict):
+            edges.append((str(edge['source']), str(edge['target']), _weight(edge.get('weight'))))
+        else:
+            edges.append((str(edge[0]), str(edge[1]), _weight(edge[2] if len(edge) > 2 else None)))
+    return types, edges
+
+
+def read_csv(file):
+    types = {}
+    edges = []
+    for row in csv.DictReader(file):
+        source, target = row['source'], row['target']
+        for node, node_type in ((source, row.get('source_type')), (target, row.get('target_type'))):
+            if node_type:
+                types[node] = node_type
+        edges.append((source, target, _weight(row.get('weight'))))
+    return types, edges
+
+
+def read_edge_list(file):
+    edges = []
+    for lineno, line in enumerate(file, start=1):
+        if not line.strip() or line.lstrip().startswith(COMMENT_PREFIXES):
+            continue
+        fields = line.split()
+        if len(fields) < 2:
+            raise ValueError(f"Linha {lineno}: esperado \"origem destino [peso]\", "
+                             f"encontrado {line.strip().decode()!r}")
+        try:
+            weight = _weight(fields[2].decode() if len(fields) > 2 else None)
+        except ValueError:
+            raise ValueError(f"Linha {lineno}: peso inválido {fields[2].decode()!r}") from None
+        edges.append((fields[0].decode(), fields[1].decode(), weight))
+    return {}, edges
+
+
+def read_topology(path):
+    """ Tipos dos nós ({nome: tipo}) e arestas [(origem, destino, peso)] do arquivo. """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.json':
+        with open(path, encoding='utf-8') as file:
+            return read_json(file)
+    if extension == '.csv':
+        with open(path, newline='', encoding='utf-8') as file:
+            return read_csv(file)
+    with open_edge_file(path) as file:
+        return read_edge_list(file)
+
+
+def load_topology(path, measure_memory: bool = False):
+    """
+    Lê a topologia para um nx.Graph. Retorna (grafo, estatísticas).
+
+    Com `measure_memory`, o pico de memória é medido com tracemalloc, o que deixa a
+    leitura algumas vezes mais lenta e rastreia as alocações de todas as threads
+    do processo; use só em medições (python -m NetworkAnalysis.topology_loader).
+    """
+    if measure_memory:
+        tracemalloc.start()
+    start_time = timeit.default_timer()
+    try:
+        types, edges = read_topology(path)
+        graph = nx.Graph()
+        graph.add_nodes_from((node, {'type': node_type}) for node, node_type in types.items())
+        graph.add_weighted_edges_from(edges)
+        # Nós que só aparecem nas arestas ficam com o tipo padrão.
+        for node, attributes in graph.nodes(data=True):
+            attributes.setdefault('type', DEFAULT_TYPE)
+        peak_memory = tracemalloc.get_traced_memory()[1] if measure_memory else None
+    finally:
+        if measure_memory:
+            tracemalloc.stop()
+
+    stats = TopologyStats(graph.number_of_nodes(), graph.number_of_edges(),
+                          timeit.default_timer() - start_time, peak_memory)
+    return graph, stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede a leitura de topologias (tempo e pico de memória)")
+    parser.add_argument("paths", nargs="+", help="arquivos de topologia (.json, .csv ou lista de arestas)")
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        _, stats = load_topology(path, measure_memory=True)
+        print(f"{path}: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,44 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 from tkinter import *
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+from NetworkAnalysis.background import BackgroundRunner
+from NetworkAnalysis.device_index import DeviceIndex
+from NetworkAnalysis.layout import LayoutCache, incremental_layout
+from NetworkAnalysis.path_service import ShortestPathService
+from NetworkAnalysis.rendering import TopologyRenderer
+from NetworkAnalysis.point_to_point import PointToPointRouter
+from NetworkAnalysis.routing_table import RoutingTable
+from NetworkAnalysis.topology_loader import load_topology
+
+# Modos de consulta: None usa a tabela de rotas ou o cache de árvores.
+QUERY_MODES = {
+    "Árvore em cache": None,
+    "Dijkstra bidirecional": "bidirectional",
+    "A* com landmarks": "alt",
+}
 
 class NetworkGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Rede de Computadores")
         self.G = nx.Graph()
+        # Cópia imutável do grafo (e o cache de árvores sobre ela) usada pelas
+        # consultas em segundo plano; refeita na primeira consulta de cada versão
+        self.snapshot = None
+        self.path_service = None
+        self.routing_table = None
+        self.point_router = None
+        self.layout_cache = LayoutCache()
+        self.device_index = DeviceIndex()
+        self.topology_version = 0
         
         # Criar widgets primeiro
         self.create_widgets()
         
+        # Consultas, layouts e a tabela de rotas rodam fora da thread do Tk
+        self.runner = BackgroundRunner(self.root, on_busy=self.show_busy)
+        
         # Depois configurar o cenário padrão
         self.setup_scenario_1()
         
@@ -24,6 +51,8 @@ class NetworkGUI:
                   command=self.setup_scenario_1).grid(row=0, column=0, padx=5)
         ttk.Button(scenario_frame, text="Cenário 2", 
                   command=self.setup_scenario_2).grid(row=0, column=1, padx=5)
+        ttk.Button(scenario_frame, text="Carregar Topologia...", 
+                  command=self.load_topology_file).grid(row=0, column=2, padx=5)
         
         # Encontrar Caminho
         path_frame = ttk.LabelFrame(self.root, text="Encontrar Caminho", padding="5")
@@ -33,24 +62,61 @@ class NetworkGUI:
         self.source_var = StringVar()
         self.source_combo = ttk.Combobox(path_frame, textvariable=self.source_var)
         self.source_combo.grid(row=0, column=1, padx=5)
+        self.source_combo.bind("<KeyRelease>", self.filter_devices)
         
         ttk.Label(path_frame, text="Para:").grid(row=0, column=2, padx=5)
         self.dest_var = StringVar()
         self.dest_combo = ttk.Combobox(path_frame, textvariable=self.dest_var)
         self.dest_combo.grid(row=0, column=3, padx=5)
+        self.dest_combo.bind("<KeyRelease>", self.filter_devices)
         
         ttk.Button(path_frame, text="Encontrar Caminho", 
                   command=self.find_path).grid(row=0, column=4, padx=5)
         
+        # Tabela de rotas
+        ttk.Button(path_frame, text="Calcular Tabela de Rotas", 
+                  command=self.build_routing_table).grid(row=1, column=0, columnspan=2, padx=5, pady=5)
+        self.table_status = StringVar(value="Tabela de rotas não calculada")
+        ttk.Label(path_frame, textvariable=self.table_status).grid(row=1, column=2, columnspan=3, sticky="w")
+        
+        # Modo de consulta ponto a ponto
+        ttk.Label(path_frame, text="Modo:").grid(row=2, column=0, padx=5)
+        self.mode_var = StringVar(value=next(iter(QUERY_MODES)))
+        ttk.Combobox(path_frame, textvariable=self.mode_var, values=list(QUERY_MODES),
+                     state="readonly").grid(row=2, column=1, padx=5)
+        
         # Display de Resultado
         self.result_text = Text(self.root, height=5, width=50)
         self.result_text.grid(row=2, column=0, padx=5, pady=5)
         
         # Botão de visualização da rede
-        ttk.Button(self.root, text="Visualização da Rede", 
-                  command=self.visualize_network).grid(row=3, column=0, pady=5)
+        view_frame = ttk.Frame(self.root)
+        view_frame.grid(row=3, column=0, pady=5)
+        ttk.Button(view_frame, text="Visualização da Rede", 
+                  command=self.visualize_network).grid(row=0, column=0, padx=5)
+        self.embed_var = BooleanVar(value=False)
+        ttk.Checkbutton(view_frame, text="Abrir em janela interativa",
+                        variable=self.embed_var).grid(row=0, column=1, padx=5)
+        
+        # Indicador de progresso das tarefas em segundo plano
+        self.progress = ttk.Progressbar(self.root, mode="indeterminate", length=300)
+        self.progress.grid(row=4, column=0, padx=5, pady=5)
+        
+    def show_busy(self, busy, fraction):
+        if not busy:
+            self.progress.stop()
+            self.progress.configure(mode="determinate", value=0)
+        elif fraction is None:
+            if str(self.progress['mode']) != "indeterminate":
+                self.progress.configure(mode="indeterminate")
+                self.progress.start(10)
+        else:
+            self.progress.stop()
+            self.progress.configure(mode="determinate", value=100 * fraction)
         
     def setup_scenario_1(self):
+        # Cancela as tarefas antes de mexer no grafo
+        self.runner.cancel_all()
         self.G.clear()
         
         # Add nodes with device type attribute
@@ -73,9 +139,10 @@ class NetworkGUI:
         ]
         
         self.G.add_weighted_edges_from(edges)
-        self.update_device_lists()
+        self.topology_changed()
         
     def setup_scenario_2(self):
+        self.runner.cancel_all()
         self.G.clear()
         
         # Adiciona nós com atributo de tipo de dispositivo
@@ -104,12 +171,104 @@ class NetworkGUI:
         ]
         
         self.G.add_weighted_edges_from(edges)
+        self.topology_changed()
+        
+    def topology_changed(self):
+        # Caminhos calculados para a topologia anterior não valem mais, nem as
+        # tarefas que ainda estão rodando sobre ela
+        self.runner.cancel_all()
+        self.topology_version += 1
+        self.routing_table = None
+        self.point_router = None
+        self.table_status.set("Tabela de rotas não calculada")
+        self.snapshot = None
+        self.path_service = None
         self.update_device_lists()
         
+    def current_snapshot(self):
+        # Consultas em andamento nunca veem o grafo sendo alterado: leem esta
+        # cópia, que não muda; uma árvore calculada para uma versão antiga vai
+        # para o cache dessa versão, que já foi descartado
+        if self.snapshot is None:
+            self.snapshot = self.G.copy()
+            self.path_service = ShortestPathService(self.snapshot)
+        return self.topology_version, self.snapshot, self.path_service
+        
+    def set_link(self, source, dest, weight):
+        old_weight = self.G[source][dest]['weight'] if self.G.has_edge(source, dest) else float('inf')
+        table = self.routing_table
+        self.runner.cancel_all()
+        self.G.add_edge(source, dest, weight=weight)
+        self.topology_changed()
+        self.update_routing_table(table, source, dest, old_weight, weight)
+        
+    def remove_link(self, source, dest):
+        old_weight = self.G[source][dest]['weight']
+        table = self.routing_table
+        self.runner.cancel_all()
+        self.G.remove_edge(source, dest)
+        self.topology_changed()
+        self.update_routing_table(table, source, dest, old_weight, float('inf'))
+        
+    def update_routing_table(self, table, source, dest, old_weight, new_weight):
+        # Só o peso de uma aresta mudou: a tabela é ajustada em vez de recalculada
+        if table is None or source not in table or dest not in table:
+            return
+        table.update_edge(self.G, source, dest, old_weight, new_weight)
+        self.routing_table = table
+        self.table_status.set(f"Tabela de rotas pronta ({len(table.nodes)} dispositivos)")
+        
+    def build_routing_table(self):
+        # O cálculo roda em segundo plano sobre uma cópia do grafo; se a topologia
+        # mudar antes de terminar, a tarefa é cancelada
+        self.table_status.set("Calculando tabela de rotas...")
+        self.runner.submit("routing_table",
+                           lambda task, graph: RoutingTable.build(graph, progress=task.report),
+                           self.G.copy(), progress=True,
+                           on_done=self.routing_table_ready, on_error=self.routing_table_failed)
+        
+    def routing_table_ready(self, table):
+        self.routing_table = table
+        self.table_status.set(f"Tabela de rotas pronta ({len(table.nodes)} dispositivos)")
+        
+    def routing_table_failed(self, error):
+        self.table_status.set("Erro ao calcular a tabela de rotas")
+        messagebox.showerror("Erro", str(error))
+        
     def update_device_lists(self):
-        devices = list(self.G.nodes())
-        self.source_combo['values'] = devices
-        self.dest_combo['values'] = devices
+        # Os comboboxes mostram só as primeiras sugestões; o resto aparece
+        # conforme o nome é digitado
+        self.device_index = DeviceIndex(self.G.nodes())
+        suggestions = self.device_index.search("")
+        self.source_combo['values'] = suggestions
+        self.dest_combo['values'] = suggestions
+        
+    def filter_devices(self, event):
+        combo = event.widget
+        combo['values'] = self.device_index.search(combo.get())
+        
+    def load_topology_file(self):
+        path = filedialog.askopenfilename(
+            title="Carregar Topologia",
+            filetypes=[("Topologias", "*.json *.csv *.txt *.gz"), ("Todos os arquivos", "*")])
+        if not path:
+            return
+        self.result_text.delete(1.0, END)
+        self.result_text.insert(END, "Carregando topologia...")
+        self.runner.submit("load", load_topology, path,
+                           on_done=self.topology_loaded, on_error=self.topology_failed)
+        
+    def topology_loaded(self, result):
+        graph, stats = result
+        self.runner.cancel_all()
+        self.G = graph
+        self.topology_changed()
+        self.result_text.delete(1.0, END)
+        self.result_text.insert(END, f"Topologia carregada: {stats}")
+        
+    def topology_failed(self, error):
+        self.result_text.delete(1.0, END)
+        messagebox.showerror("Erro", f"Não foi possível carregar a topologia: {error}")
         
     def find_path(self):
         source = self.source_var.get()
@@ -118,51 +277,103 @@ class NetworkGUI:
         if not source or not dest:
             messagebox.showerror("Erro", "Por favor selecione o dispositivo de origem e destino")
             return
-            
-        try:
-            # Encontra o caminho mais curto e a distância
-            path = nx.shortest_path(self.G, source, dest, weight='weight')
-            distance = nx.shortest_path_length(self.G, source, dest, weight='weight')
-            
-            self.result_text.delete(1.0, END)
-            self.result_text.insert(END, f"Caminho mais curto: {' -> '.join(path)}\n")
-            self.result_text.insert(END, f"Distância Total: {distance}")
-        except nx.NetworkXNoPath:
-            self.result_text.delete(1.0, END)
+        
+        self.result_text.delete(1.0, END)
+        self.result_text.insert(END, "Calculando caminho...")
+        # Uma nova consulta substitui a anterior, se ela ainda não terminou
+        version, graph, service = self.current_snapshot()
+        self.runner.submit("path", self.compute_path, QUERY_MODES[self.mode_var.get()],
+                           source, dest, version, graph, service, self.routing_table, self.point_router,
+                           on_done=self.show_path, on_error=self.show_path_error)
+        
+    def compute_path(self, mode, source, dest, version, graph, service, table, router):
+        # Roda fora da thread do Tk: só usa os argumentos (a cópia do grafo da
+        # versão `version`), nunca os atributos da janela
+        settled = None
+        if mode is not None:
+            # Busca ponto a ponto sobre a CSR da topologia atual
+            if router is None:
+                router = PointToPointRouter.from_networkx(graph)
+            path, distance, search = router.query(source, dest, mode)
+            settled = search.settled
+        # Com a tabela de rotas pronta a consulta é só seguir os próximos saltos;
+        # senão, um único Dijkstra (com cache por origem)
+        elif table is not None:
+            path, distance = table.path(source, dest)
+        else:
+            path, distance = service.query(source, dest)
+        return version, path, distance, settled, router
+        
+    def show_path(self, result):
+        version, path, distance, settled, router = result
+        # Resultado de uma topologia que já mudou: descarta
+        if version != self.topology_version:
+            return
+        if router is not None:
+            self.point_router = router
+        self.result_text.delete(1.0, END)
+        self.result_text.insert(END, f"Caminho mais curto: {' -> '.join(path)}\n")
+        self.result_text.insert(END, f"Distância Total: {distance}")
+        if settled is not None:
+            self.result_text.insert(END, f"\nNós fixados pela busca: {settled}")
+        
+    def show_path_error(self, error):
+        self.result_text.delete(1.0, END)
+        if isinstance(error, nx.NetworkXNoPath):
             self.result_text.insert(END, "Não há caminho entre os dispositivos selecionados")
+        elif isinstance(error, nx.NodeNotFound):
+            messagebox.showerror("Erro", "Dispositivo não encontrado na rede")
+        else:
+            messagebox.showerror("Erro", str(error))
             
     def visualize_network(self):
-        plt.figure(figsize=(12, 8))
+        # Mesma topologia: reaproveita as posições do último desenho
+        version = self.topology_version
+        pos = self.layout_cache.lookup(version)
+        if pos is not None:
+            self.draw_network(pos)
+            return
+        # O layout é o passo demorado: roda em segundo plano sobre uma cópia,
+        # partindo das posições da versão anterior
+        self.runner.submit("layout", incremental_layout, self.G.copy(), self.layout_cache.positions,
+                           on_done=lambda pos: self.layout_ready(version, pos),
+                           on_error=self.layout_failed)
         
-        # Cria o layout spring para o grafo
-        pos = nx.spring_layout(self.G)
+    def layout_ready(self, version, pos):
+        self.layout_cache.store(version, pos)
+        self.draw_network(pos)
         
-        # Desenha nodes diferentes para cada tipo de dispositivo.
-        device_types = {
-            'router': {'color': 'red', 'nodes': []},
-            'switch': {'color': 'green', 'nodes': []},
-            'server': {'color': 'blue', 'nodes': []}
-        }
+    def layout_failed(self, error):
+        messagebox.showerror("Erro", f"Não foi possível calcular o layout: {error}")
         
-        for node, attr in self.G.nodes(data=True):
-            node_type = attr.get('type', 'server')
-            device_types[node_type]['nodes'].append(node)
-            
-        for device_type, info in device_types.items():
-            nx.draw_networkx_nodes(self.G, pos, 
-                                 nodelist=info['nodes'],
-                                 node_color=info['color'],
-                                 node_size=500)
-        
-        # Desenha as arestas e as labels 
-        nx.draw_networkx_edges(self.G, pos)
-        edge_labels = nx.get_edge_attributes(self.G, 'weight')
-        nx.draw_networkx_edge_labels(self.G, pos, edge_labels=edge_labels)
-        nx.draw_networkx_labels(self.G, pos)
-        
-        plt.title("Topologia da Rede")
-        plt.axis('off')
+    def draw_network(self, pos):
+        if self.embed_var.get():
+            self.show_embedded(pos)
+            return
+        fig, ax = plt.subplots(figsize=(12, 8))
+        self.draw_topology(ax, pos)
         plt.show()
+        
+    def draw_topology(self, ax, pos):
+        # Arestas numa única coleção e nós num único scatter; rótulos e pesos
+        # só aparecem quando poucos nós estão visíveis (rede pequena ou zoom)
+        TopologyRenderer(ax, self.G, pos)
+        ax.set_title("Topologia da Rede")
+        ax.axis('off')
+        
+    def show_embedded(self, pos):
+        # Janela Tk com o canvas do matplotlib, sem bloquear com plt.show()
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        
+        window = Toplevel(self.root)
+        window.title("Topologia da Rede")
+        figure = Figure(figsize=(12, 8))
+        canvas = FigureCanvasTkAgg(figure, master=window)
+        self.draw_topology(figure.add_subplot(), pos)
+        NavigationToolbar2Tk(canvas, window)
+        canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+        canvas.draw()
 
 def main():
     root = Tk()
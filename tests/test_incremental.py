@@ -0,0 +1,29 @@
+import random
+
+from LPD.incremental import IncrementalLexer
+
+
+def snapshot(lexer):
+    tokens = [(token.type, token.value, token.lineno, token.lexpos) for token in lexer.tokens()]
+    return tokens, list(lexer.errors()), lexer.inside_comment
+
+
+def test_brace_error_inside_comment():
+    text = '}\n{\nb}{\n{'
+    lexer = IncrementalLexer(text)
+    lexer.update(text)
+    assert snapshot(lexer) == snapshot(IncrementalLexer(text))
+
+
+def test_random_edits_match_full_lex():
+    rng = random.Random(1)
+    alphabet = ['{', '}', '\n', 'a', ' ', 'b', '1', ';', "'x'", '@']
+    for _ in range(1000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randrange(20)))
+        lexer = IncrementalLexer(text)
+        for _ in range(5):
+            start = rng.randrange(len(text) + 1)
+            end = min(len(text), start + rng.randrange(4))
+            text = text[:start] + ''.join(rng.choice(alphabet) for _ in range(rng.randrange(4))) + text[end:]
+            lexer.update(text)
+            assert snapshot(lexer) == snapshot(IncrementalLexer(text)), repr(text)
@@ -0,0 +1,33 @@
+import networkx as nx
+import numpy as np
+
+from NetworkAnalysis.routing_table import RoutingTable
+
+
+def test_increase_with_fractional_weights_matches_rebuild():
+    graph = nx.path_graph(800)
+    nx.set_edge_attributes(graph, 1.1, 'weight')
+    table = RoutingTable.build(graph, method='dijkstra', workers=1)
+
+    graph[400][401]['weight'] = 5.0
+    table.update_edge(graph, 400, 401, 1.1, 5.0)
+    rebuilt = RoutingTable.build(graph, method='dijkstra', workers=1)
+    assert np.array_equal(table.distance, rebuilt.distance)
+    assert np.array_equal(table.next_hop, rebuilt.next_hop)
+
+
+def test_random_updates_match_rebuild():
+    rng = np.random.default_rng(3)
+    graph = nx.connected_watts_strogatz_graph(120, 4, 0.3, seed=3)
+    for start, end in graph.edges:
+        graph[start][end]['weight'] = float(rng.uniform(0.1, 10.0))
+    table = RoutingTable.build(graph, method='floyd_warshall')
+
+    edges = list(graph.edges)
+    for _ in range(30):
+        start, end = edges[rng.integers(len(edges))]
+        old_weight = graph[start][end]['weight']
+        graph[start][end]['weight'] = new_weight = float(rng.uniform(0.1, 10.0))
+        table.update_edge(graph, start, end, old_weight, new_weight)
+    rebuilt = RoutingTable.build(graph, method='floyd_warshall')
+    assert np.allclose(table.distance, rebuilt.distance, rtol=1e-5)